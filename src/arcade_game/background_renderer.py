@@ -12,10 +12,15 @@
 import arcade
 import math
 import random
+import pyglet
+from arcade.shape_list import (
+    ShapeElementList, create_rectangle_filled, create_polygon,
+    create_ellipse_filled, create_line,
+)
 from typing import Tuple, List, Optional
 from dataclasses import dataclass
 
-from ..core.theme_colors import GameColors, PRIMARY, PRIMARY_LIGHT, PRIMARY_DARK, SECONDARY, SECONDARY_LIGHT, WHITE, Color
+from ..core.theme_colors import GameColors, PRIMARY, PRIMARY_LIGHT, PRIMARY_DARK, SECONDARY, SECONDARY_LIGHT, WHITE, Color, FONT_NAMES
 
 
 @dataclass
@@ -141,6 +146,12 @@ class BackgroundRenderer:
         
         # 初始化山脉
         self._init_mountains()
+        
+        # 静态图层（天空+山脉、草坪+网格、行列号），首次渲染时一次性构建
+        self._sky_shapes: Optional[ShapeElementList] = None
+        self._lawn_shapes: Optional[ShapeElementList] = None
+        self._label_batch: Optional[pyglet.graphics.Batch] = None
+        self._labels: List[arcade.Text] = []
     
     def _calculate_grid_positions(self) -> None:
         """计算网格位置"""
@@ -200,43 +211,67 @@ class BackgroundRenderer:
     
     def render(self) -> None:
         """渲染背景和网格"""
-        # 绘制天空渐变
-        self._draw_sky_gradient()
+        if self._sky_shapes is None:
+            self._build_static_layers()
         
-        # 绘制山脉
-        self._draw_mountains()
+        # 天空渐变 + 山脉（静态）
+        self._sky_shapes.draw()
         
         # 绘制云朵
         self._draw_clouds()
         
-        # 绘制草地背景
-        self._draw_grass_background()
-        
-        # 绘制网格
-        self._draw_grid()
+        # 草地背景 + 网格（静态）
+        self._lawn_shapes.draw()
         
         # 绘制装饰元素
         self._draw_decorations()
     
-    def _draw_grass_background(self) -> None:
-        """绘制草地背景（棋盘格效果）- 增强版"""
+    def _build_static_layers(self) -> None:
+        """
+        构建静态背景图层
+        
+        天空、山脉、草坪棋盘格、草地纹理和网格线都不随时间变化，
+        只在这里生成一次顶点数据，之后每帧各用一次绘制调用完成。
+        云朵夹在山脉与草坪之间，因此静态部分拆成两个图层。
+        """
+        self._sky_shapes = ShapeElementList()
+        self._build_sky_gradient(self._sky_shapes)
+        self._build_mountains(self._sky_shapes)
+        
+        self._lawn_shapes = ShapeElementList()
+        self._build_grass_background(self._lawn_shapes)
+        self._build_grid(self._lawn_shapes)
+        
+        self._build_labels()
+    
+    @staticmethod
+    def _lrbt_rect(left: float, right: float, bottom: float, top: float, color):
+        """按左右下上边界创建填充矩形"""
+        return create_rectangle_filled(
+            (left + right) / 2, (bottom + top) / 2,
+            right - left, top - bottom,
+            color
+        )
+    
+    def _build_grass_background(self, shapes: ShapeElementList) -> None:
+        """构建草地背景（棋盘格效果）- 增强版"""
         # 绘制整个游戏区域背景
         total_width = self.cols * self.cell_width
         total_height = self.rows * self.cell_height
         
         # 绘制外边框 - 带阴影效果
-        arcade.draw_lrbt_rectangle_filled(
+        shapes.append(self._lrbt_rect(
             self.start_x - 8, self.start_x + total_width + 8,
             self.start_y - 8, self.start_y + total_height + 8,
             (0, 0, 0, 80)
-        )
+        ))
         
         # 绘制主边框
-        arcade.draw_lrbt_rectangle_filled(
+        shapes.append(self._lrbt_rect(
             self.start_x - 5, self.start_x + total_width + 5,
             self.start_y - 5, self.start_y + total_height + 5,
             self.GRASS_BORDER.rgba
-        )
+        ))
         
         # 绘制棋盘格草地
         for row in range(self.rows):
@@ -251,41 +286,45 @@ class BackgroundRenderer:
                     color = self.GRASS_DARK
                 
                 # 绘制单元格背景
-                arcade.draw_lrbt_rectangle_filled(
+                shapes.append(self._lrbt_rect(
                     x, x + self.cell_width,
                     y, y + self.cell_height,
                     color.rgba
-                )
+                ))
                 
                 # 添加草地纹理效果
-                self._draw_grass_texture(x, y, color)
+                self._build_grass_texture(shapes, x, y, color)
                 
                 # 添加高光效果（每隔几个单元格）
                 if (row + col) % 3 == 0:
                     highlight_alpha = 20
-                    arcade.draw_lrbt_rectangle_filled(
+                    shapes.append(self._lrbt_rect(
                         x + 5, x + self.cell_width - 5,
                         y + self.cell_height - 10, y + self.cell_height - 5,
                         WHITE.with_alpha(highlight_alpha).rgba
-                    )
+                    ))
     
-    def _draw_grass_texture(self, cell_x: float, cell_y: float, base_color: Color) -> None:
-        """绘制草地纹理"""
-        # 使用固定的"随机"位置来绘制草地点，保持每帧一致
-        random.seed(int(cell_x * 1000 + cell_y))  # 使用位置作为种子
+    def _build_grass_texture(self, shapes: ShapeElementList,
+                             cell_x: float, cell_y: float, base_color: Color) -> None:
+        """构建草地纹理"""
+        # 使用位置作为种子的独立随机数生成器，点位固定且不影响全局随机状态
+        rng = random.Random(int(cell_x * 1000 + cell_y))
+        darker_color = base_color.darken(0.15).rgba
         
         # 绘制一些深色的草地点
         for _ in range(5):
-            dot_x = cell_x + random.uniform(5, self.cell_width - 5)
-            dot_y = cell_y + random.uniform(5, self.cell_height - 5)
-            dot_size = random.uniform(1, 3)
+            dot_x = cell_x + rng.uniform(5, self.cell_width - 5)
+            dot_y = cell_y + rng.uniform(5, self.cell_height - 5)
+            dot_size = rng.uniform(1, 3)
             
             # 深色点缀
-            darker_color = base_color.darken(0.15)
-            arcade.draw_circle_filled(dot_x, dot_y, dot_size, darker_color.rgba)
+            shapes.append(create_ellipse_filled(
+                dot_x, dot_y, dot_size * 2, dot_size * 2, darker_color,
+                num_segments=6
+            ))
     
-    def _draw_grid(self) -> None:
-        """绘制网格线 - 增强版"""
+    def _build_grid(self, shapes: ShapeElementList) -> None:
+        """构建网格线 - 增强版"""
         total_width = self.cols * self.cell_width
         total_height = self.rows * self.cell_height
         
@@ -293,33 +332,65 @@ class BackgroundRenderer:
         for col in range(self.cols + 1):
             x = self.start_x + col * self.cell_width
             # 阴影
-            arcade.draw_line(
+            shapes.append(create_line(
                 x + 1, self.start_y,
                 x + 1, self.start_y + total_height,
                 (0, 0, 0, 60), 1
-            )
+            ))
             # 主线
-            arcade.draw_line(
+            shapes.append(create_line(
                 x, self.start_y,
                 x, self.start_y + total_height,
                 self.GRID_LINE.rgba, 1
-            )
+            ))
         
         # 绘制水平线
         for row in range(self.rows + 1):
             y = self.start_y + row * self.cell_height
             # 阴影
-            arcade.draw_line(
+            shapes.append(create_line(
                 self.start_x, y - 1,
                 self.start_x + total_width, y - 1,
                 (0, 0, 0, 60), 1
-            )
+            ))
             # 主线
-            arcade.draw_line(
+            shapes.append(create_line(
                 self.start_x, y,
                 self.start_x + total_width, y,
                 self.GRID_LINE.rgba, 1
-            )
+            ))
+    
+    def _build_labels(self) -> None:
+        """构建行号与列号文字（同一批次绘制）- 增强版"""
+        self._label_batch = pyglet.graphics.Batch()
+        self._labels = []
+        
+        # 行号标识
+        for row in range(self.rows):
+            y = self.start_y + row * self.cell_height + self.cell_height / 2
+            for dx, dy, color in ((2, -1, (0, 0, 0, 150)), (0, 0, WHITE.rgba)):
+                self._labels.append(arcade.Text(
+                    str(row + 1),
+                    self.start_x - 25 + dx, y + dy,
+                    color, 14,
+                    anchor_x="center", anchor_y="center",
+                    font_name=FONT_NAMES,
+                    batch=self._label_batch
+                ))
+        
+        # 列号标识
+        label_y = self.start_y + self.rows * self.cell_height + 10
+        for col in range(self.cols):
+            x = self.start_x + col * self.cell_width + self.cell_width / 2
+            for dx, dy, color in ((1, -1, (0, 0, 0, 150)), (0, 0, WHITE.rgba)):
+                self._labels.append(arcade.Text(
+                    str(col + 1),
+                    x + dx, label_y + dy,
+                    color, 14,
+                    anchor_x="center",
+                    font_name=FONT_NAMES,
+                    batch=self._label_batch
+                ))
     
     def _draw_decorations(self) -> None:
         """绘制装饰元素"""
@@ -330,45 +401,8 @@ class BackgroundRenderer:
         for deco in self.decorations:
             self._draw_decoration(deco)
         
-        # 绘制行号标识 - 增强版
-        for row in range(self.rows):
-            y = self.start_y + row * self.cell_height + self.cell_height / 2
-            # 阴影
-            arcade.draw_text(
-                str(row + 1),
-                self.start_x - 23, y - 1,
-                (0, 0, 0, 150), 14,
-                anchor_x="center", anchor_y="center",
-                font_name=("Arial", "Microsoft YaHei", "sans-serif")
-            )
-            # 主文字
-            arcade.draw_text(
-                str(row + 1),
-                self.start_x - 25, y,
-                WHITE.rgba, 14,
-                anchor_x="center", anchor_y="center",
-                font_name=("Arial", "Microsoft YaHei", "sans-serif")
-            )
-        
-        # 绘制列号标识 - 增强版
-        for col in range(self.cols):
-            x = self.start_x + col * self.cell_width + self.cell_width / 2
-            # 阴影
-            arcade.draw_text(
-                str(col + 1),
-                x + 1, self.start_y + self.rows * self.cell_height + 9,
-                (0, 0, 0, 150), 14,
-                anchor_x="center",
-                font_name=("Arial", "Microsoft YaHei", "sans-serif")
-            )
-            # 主文字
-            arcade.draw_text(
-                str(col + 1),
-                x, self.start_y + self.rows * self.cell_height + 10,
-                WHITE.rgba, 14,
-                anchor_x="center",
-                font_name=("Arial", "Microsoft YaHei", "sans-serif")
-            )
+        # 绘制行号、列号标识
+        self._label_batch.draw()
     
     def _draw_decoration(self, deco: Decoration) -> None:
         """绘制单个装饰元素"""
@@ -567,8 +601,8 @@ class BackgroundRenderer:
             )
             self.mountains.append(mountain)
     
-    def _draw_sky_gradient(self) -> None:
-        """绘制天空渐变"""
+    def _build_sky_gradient(self, shapes: ShapeElementList) -> None:
+        """构建天空渐变"""
         # 从上到下绘制渐变
         gradient_steps = 20
         for i in range(gradient_steps):
@@ -580,35 +614,32 @@ class BackgroundRenderer:
             g = int(self.SKY_TOP.g + (self.SKY_BOTTOM.g - self.SKY_TOP.g) * t)
             b = int(self.SKY_TOP.b + (self.SKY_BOTTOM.b - self.SKY_TOP.b) * t)
             
-            arcade.draw_lrbt_rectangle_filled(
+            shapes.append(self._lrbt_rect(
                 0, self.screen_width,
                 y_top, y_bottom,
-                (r, g, b)
-            )
+                (r, g, b, 255)
+            ))
     
-    def _draw_mountains(self) -> None:
-        """绘制山脉"""
+    def _build_mountains(self, shapes: ShapeElementList) -> None:
+        """构建山脉"""
+        base_y = self.start_y + self.rows * self.cell_height + 20
+        snow_color = WHITE.with_alpha(150).rgba
         for mountain in self.mountains:
             # 绘制三角形山脉
             points = [
-                (mountain.x, self.start_y + self.rows * self.cell_height + 20),
-                (mountain.x + mountain.width / 2, 
-                 self.start_y + self.rows * self.cell_height + 20 + mountain.height),
-                (mountain.x + mountain.width, 
-                 self.start_y + self.rows * self.cell_height + 20),
+                (mountain.x, base_y),
+                (mountain.x + mountain.width / 2, base_y + mountain.height),
+                (mountain.x + mountain.width, base_y),
             ]
-            arcade.draw_polygon_filled(points, mountain.color)
+            shapes.append(create_polygon(points, mountain.color))
             
             # 山顶积雪效果
             snow_points = [
-                (mountain.x + mountain.width * 0.35, 
-                 self.start_y + self.rows * self.cell_height + 20 + mountain.height * 0.7),
-                (mountain.x + mountain.width / 2, 
-                 self.start_y + self.rows * self.cell_height + 20 + mountain.height),
-                (mountain.x + mountain.width * 0.65, 
-                 self.start_y + self.rows * self.cell_height + 20 + mountain.height * 0.7),
+                (mountain.x + mountain.width * 0.35, base_y + mountain.height * 0.7),
+                (mountain.x + mountain.width / 2, base_y + mountain.height),
+                (mountain.x + mountain.width * 0.65, base_y + mountain.height * 0.7),
             ]
-            arcade.draw_polygon_filled(snow_points, WHITE.with_alpha(150).rgba)
+            shapes.append(create_polygon(snow_points, snow_color))
     
     def _draw_clouds(self) -> None:
         """绘制云朵"""
@@ -3,12 +3,13 @@
 """
 
 import arcade
+import pyglet
 from typing import List, Tuple
 from dataclasses import dataclass
 import random
 
 
-@dataclass
+@dataclass(slots=True)
 class DamageNumber:
     """伤害数字"""
     x: float
@@ -27,18 +28,20 @@ class DamageNumber:
         """检查是否存活"""
         return self.life > 0
     
-    def update(self, dt: float) -> None:
-        """更新状态"""
-        # 更新位置
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        
-        # 更新生命周期
-        self.life -= dt
-        
-        # 更新透明度（渐隐）
-        life_ratio = max(0, self.life / self.max_life)
-        self.alpha = int(255 * life_ratio)
+    def reset(self, x: float, y: float, value: int,
+              color: Tuple[int, int, int], scale: float,
+              velocity_x: float, velocity_y: float, life: float) -> None:
+        """重置状态（对象池复用）"""
+        self.x = x
+        self.y = y
+        self.value = value
+        self.color = color
+        self.scale = scale
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+        self.life = life
+        self.max_life = life
+        self.alpha = 255
 
 
 class DamageNumberSystem:
@@ -56,11 +59,26 @@ class DamageNumberSystem:
     COLOR_FIRE = (255, 69, 0)        # 橙红色 - 火焰伤害
     COLOR_ICE = (135, 206, 250)      # 浅蓝色 - 冰冻伤害
     
+    # 对象池配置
+    POOL_PREWARM_SIZE = 256
+    POOL_MAX_SIZE = 512
+    
     def __init__(self):
         self.damage_numbers: List[DamageNumber] = []
         self.default_life = 1.0  # 默认存活时间（秒）
         self.default_scale = 1.0
         self.crit_scale = 1.5
+        
+        # 空闲对象池，避免每次命中都分配新对象
+        self._pool: List[DamageNumber] = [
+            DamageNumber(0.0, 0.0, 0, self.COLOR_NORMAL, 1.0, 0.0, 0.0, 0.0, 0.0)
+            for _ in range(self.POOL_PREWARM_SIZE)
+        ]
+        
+        # 文字对象按绘制槽位复用，全部放入同一批次一次绘制
+        self._text_batch = pyglet.graphics.Batch()
+        self._texts: List[arcade.Text] = []
+        self._visible_text_count = 0
     
     def add_damage_number(self, x: float, y: float, value: int,
                          damage_type: str = "normal", is_crit: bool = False) -> None:
@@ -84,17 +102,23 @@ class DamageNumberSystem:
         velocity_x = random.uniform(-20, 20)
         velocity_y = random.uniform(50, 100)  # 向上飘
         
-        damage_num = DamageNumber(
-            x=x,
-            y=y,
-            value=value,
-            color=color,
-            scale=scale,
-            velocity_x=velocity_x,
-            velocity_y=velocity_y,
-            life=self.default_life,
-            max_life=self.default_life
-        )
+        # 优先从对象池复用
+        if self._pool:
+            damage_num = self._pool.pop()
+            damage_num.reset(x, y, value, color, scale,
+                             velocity_x, velocity_y, self.default_life)
+        else:
+            damage_num = DamageNumber(
+                x=x,
+                y=y,
+                value=value,
+                color=color,
+                scale=scale,
+                velocity_x=velocity_x,
+                velocity_y=velocity_y,
+                life=self.default_life,
+                max_life=self.default_life
+            )
         
         self.damage_numbers.append(damage_num)
     
@@ -117,6 +141,11 @@ class DamageNumberSystem:
         }
         return color_map.get(damage_type, self.COLOR_NORMAL)
     
+    @property
+    def is_empty(self) -> bool:
+        """没有任何伤害数字时为True，调用方可跳过更新"""
+        return not self.damage_numbers
+    
     def update(self, dt: float) -> None:
         """
         更新所有伤害数字
@@ -124,44 +153,101 @@ class DamageNumberSystem:
         Args:
             dt: 时间增量
         """
-        # 更新所有数字
+        # 单次遍历完成移动、渐隐（透明度随剩余寿命线性下降）和回收
+        alive = []
         for num in self.damage_numbers:
-            num.update(dt)
+            num.x += num.velocity_x * dt
+            num.y += num.velocity_y * dt
+            num.life -= dt
+            
+            if num.life > 0:
+                num.alpha = int(255 * num.life / num.max_life)
+                alive.append(num)
+            else:
+                # 已消失的数字回收到对象池
+                num.alpha = 0
+                self._release(num)
         
-        # 移除已消失的数字
-        self.damage_numbers = [n for n in self.damage_numbers if n.is_alive]
+        self.damage_numbers = alive
+    
+    def _release(self, num: DamageNumber) -> None:
+        """回收伤害数字对象"""
+        if len(self._pool) < self.POOL_MAX_SIZE:
+            self._pool.append(num)
     
     def render(self) -> None:
         """渲染所有伤害数字"""
-        for num in self.damage_numbers:
-            self._draw_damage_number(num)
+        texts = self._texts
+        count = len(self.damage_numbers)
+        for i, num in enumerate(self.damage_numbers):
+            if i < len(texts):
+                text = texts[i]
+            else:
+                text = self._create_text()
+            self._sync_text(text, num)
+        
+        # 隐藏本帧未使用的文字槽位
+        for i in range(count, self._visible_text_count):
+            texts[i].visible = False
+        self._visible_text_count = count
+        
+        if count:
+            self._text_batch.draw()
     
-    def _draw_damage_number(self, num: DamageNumber) -> None:
+    def warm_up(self) -> None:
         """
-        绘制单个伤害数字
+        预先创建第一个文字槽位并排版全部数字字形
+        
+        字体加载和字形光栅化放到开局时完成，避免第一次命中时卡顿一帧
+        """
+        if self._texts:
+            return
+        text = self._create_text()
+        text.text = "0123456789"
+        text.text = ""
+    
+    def _create_text(self) -> arcade.Text:
+        """创建一个新的文字槽位"""
+        text = arcade.Text(
+            "", 0, 0, self.COLOR_NORMAL, 16,
+            anchor_x="center",
+            anchor_y="center",
+            bold=True,
+            batch=self._text_batch
+        )
+        self._texts.append(text)
+        return text
+    
+    def _sync_text(self, text: arcade.Text, num: DamageNumber) -> None:
+        """
+        把伤害数字同步到文字槽位
         
         Args:
+            text: 文字对象
             num: 伤害数字数据
         """
+        # text/x/y 的 setter 在值不变时直接返回；颜色和字号每次设置都会重建，需手动比较
+        text.text = str(num.value)
+        text.x = num.x
+        text.y = num.y
+        
         # 添加alpha通道到颜色
         color_with_alpha = (*num.color, num.alpha)
+        if text.color != color_with_alpha:
+            text.color = color_with_alpha
         
         # 计算字体大小
         font_size = int(16 * num.scale)
+        if text.font_size != font_size:
+            text.font_size = font_size
         
-        # 绘制文字
-        arcade.draw_text(
-            str(num.value),
-            num.x, num.y,
-            color_with_alpha,
-            font_size,
-            anchor_x="center",
-            anchor_y="center",
-            bold=True
-        )
+        if not text.visible:
+            text.visible = True
     
     def clear(self) -> None:
         """清除所有伤害数字"""
+        for num in self.damage_numbers:
+            self._release(num)
         self.damage_numbers.clear()
     
     def get_active_count(self) -> int:
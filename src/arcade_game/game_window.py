@@ -2,8 +2,8 @@
 游戏窗口 - 使用Arcade引擎的主窗口
 """
 
+import time
 import arcade
-import traceback
 from ..ecs import World
 from ..core.logger import get_module_logger
 from ..ecs.systems import (
@@ -13,31 +13,53 @@ from ..ecs.systems import (
 )
 from ..ecs.components import (
     TransformComponent, HealthComponent, ZombieComponent,
-    PlantComponent, GridPositionComponent, SpriteComponent
+    PlantComponent, GridPositionComponent, SpriteComponent,
+    PlantTypeComponent, ZombieTypeComponent
 )
 from ..core.event_bus import EventBus, Event, EventType
 from .entity_factory import EntityFactory
 from .planting_system import PlantingSystem
 from .zombie_spawner import ZombieSpawner
 from .sun_collection_system import SunCollectionSystem
-from .audio_manager import get_audio_manager
+from .audio_manager import get_audio_manager, SoundType
 from .particle_system import ParticleSystem
 from .background_renderer import BackgroundRenderer
 from .health_bar_system import HealthBarSystem
 from .damage_number_system import DamageNumberSystem
 from .screen_shake import ScreenShake
-from .ui_renderer import UIRenderer, GameOverRenderer
+from .ui_renderer import UIRenderer
 from .visual_effects_optimized import OptimizedVisualEffectsSystem
 from .pvz_visual_effects import PvzVisualEffectsSystem
 from .three_d_effects_optimized import ThreeDEffectsOptimized
 from .save_system import SaveSystem, GameSaveData, get_save_system
 from .zombie_render_integration import get_zombie_render_integration
+from .zombie_visual_system import DeathType
 from ..core.performance_monitor import get_performance_monitor, toggle_debug
-from ..core.game_state import GameStateManager, GameState
+from ..core.game_state import GameStateManager, GameState, StateFlag
 from ..core.game_constants import EASY, NORMAL, HARD
+from ..core.theme_colors import Color
 from ..ui.menu_system import MenuSystem
 
 
+# 游戏状态位组合（与 game_state.state_flags 按位与判断）
+_MENU_SHOWN_STATES = int(StateFlag.MENU_SHOWN)
+_OVERLAY_MENU_STATES = int(StateFlag.OVERLAY_MENU)
+_NO_UPDATE_STATES = int(StateFlag.MENU | StateFlag.PAUSED)
+
+# 爆炸类型 -> 音效类型（未列出的类型使用通用爆炸音效）
+_EXPLOSION_SOUND_TYPES = {
+    'cherry_bomb': SoundType.CHERRY_BOMB,
+    'potato_mine': SoundType.POTATO_MINE,
+}
+
+# 难度名称 -> 难度配置（未知难度使用普通难度）
+_DIFFICULTY_CONFIGS = {
+    'easy': EASY,
+    'normal': NORMAL,
+    'hard': HARD,
+}
+
+
 class GameWindow(arcade.Window):
     """
     游戏主窗口
@@ -50,9 +72,25 @@ class GameWindow(arcade.Window):
     SCREEN_TITLE = "植物大战僵尸 - Arcade ECS"
     BACKGROUND_COLOR = (34, 139, 34)
     
+    # 屏幕外特效裁剪边距（像素），边缘附近的特效仍部分可见
+    EFFECT_CULL_MARGIN = 50
+    
+    # 植物血条配置：只对最大生命值超过阈值的植物（如坚果墙）显示，尺寸小一些
+    PLANT_BAR_MIN_HEALTH = 100
+    PLANT_BAR_SIZE = (40, 4)
+    
+    # 每帧更新异常的最小记录间隔（秒）
+    UPDATE_ERROR_LOG_INTERVAL = 1.0
+    
+    # 血条位置和血量每隔几帧同步一次（落后一帧肉眼不可见）
+    HEALTH_BAR_UPDATE_STRIDE = 2
+    
     def __init__(self):
         # 初始化日志记录器
         self.logger = get_module_logger(__name__)
+        # 每帧更新异常的限流记录
+        self._last_update_error_time = float('-inf')
+        self._suppressed_update_errors = 0
         
         super().__init__(
             self.SCREEN_WIDTH,
@@ -62,12 +100,27 @@ class GameWindow(arcade.Window):
         
         self.logger.info("游戏窗口初始化开始")
         
+        # 每帧使用的屏幕尺寸常量，绑定为实例属性避免逐帧查找类属性
+        self._w = self.SCREEN_WIDTH
+        self._h = self.SCREEN_HEIGHT
+        self._half_w = self._w / 2
+        self._half_h = self._h / 2
+        
+        # 游戏场景相机 - 屏幕震动时只平移相机位置（更新投影矩阵），UI 仍用默认相机绘制
+        self._world_camera = arcade.Camera2D()
+        
         # 游戏状态管理器
         self.game_state = GameStateManager()
         self._setup_game_state_callbacks()
         
         # 音效管理器（尽早初始化）
         self.audio_manager = get_audio_manager()
+        # 伤害类型 -> 已绑定的音效方法，未列出的类型播放普通击中音效
+        self._damage_sound_handlers = {
+            'ice': self.audio_manager.play_ice_hit_sound,
+            'fire': self.audio_manager.play_fire_hit_sound,
+        }
+        self._default_damage_sound = self.audio_manager.play_hit_sound
         
         # 菜单系统
         self.menu_system = MenuSystem(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
@@ -84,6 +137,7 @@ class GameWindow(arcade.Window):
         
         # 初始化游戏组件（延迟到实际开始游戏时）
         self.world = None
+        self._cm = None  # 组件管理器缓存，省去热路径上的属性链查找
         self.entity_factory = None
         self.planting_system = None
         self.zombie_spawner = None
@@ -99,8 +153,22 @@ class GameWindow(arcade.Window):
         self.zombie_render_integration = None
         self.save_system = None
         self.event_bus = None
+        self._event_subscriptions = []  # 事件订阅令牌，重置时用于取消订阅
+        self._frame_updaters = ()  # 每帧按顺序调用的 update(delta_time) 方法
         self.play_time = 0.0
         
+        # 血条跟踪缓存：entity_id -> (transform, health, health_bar)
+        # 仅在组件结构变化（_cache_version 变化）时重建
+        self._health_bar_targets = {}
+        self._health_bar_version = -1
+        # 重建血条缓存时顺带统计的僵尸数量，供胜利判定使用
+        self._zombie_count = 0
+        # 血条同步的帧计数（按 HEALTH_BAR_UPDATE_STRIDE 间隔同步）
+        self._health_bar_frame = 0
+        # 需要渲染特效的僵尸ID缓存，同样只在 _cache_version 变化时重新查询
+        self._zombie_effect_ids = []
+        self._zombie_effect_version = -1
+        
         # 显示主菜单
         self.menu_system.show_main_menu()
         
@@ -146,6 +214,7 @@ class GameWindow(arcade.Window):
         
         # 创建ECS世界
         self.world = World()
+        self._cm = self.world._component_manager
         
         # 创建事件总线
         self.event_bus = EventBus()
@@ -162,6 +231,10 @@ class GameWindow(arcade.Window):
         # 创建僵尸生成器
         self.zombie_spawner = ZombieSpawner(self.world, self.entity_factory)
         self.zombie_spawner.set_level(self.current_level)
+        # 波次进度查询方法只解析一次（reset 不会替换生成器对象）
+        self._get_wave_progress = getattr(
+            self.zombie_spawner, 'get_wave_progress', None
+        ) or (lambda: 0.0)
         self.zombie_spawner.set_difficulty(
             difficulty_config.zombie_speed_multiplier,
             difficulty_config.zombie_health_multiplier,
@@ -191,9 +264,24 @@ class GameWindow(arcade.Window):
         
         # 创建UI渲染器
         self.ui_renderer = UIRenderer(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        # 最近一次同步给UI渲染器的数值（新渲染器需要重新同步）
+        self._ui_sun_count = None
+        self._ui_score = None
+        self._ui_wave_version = None
         
         # 创建视觉特效系统
         self.visual_effects = PvzVisualEffectsSystem()
+        visual_effects = self.visual_effects
+        # 伤害/爆炸类型 -> 视觉特效创建函数，统一接收 (x, y, 伤害或半径)；未列出的类型使用通用特效
+        self._hit_visual_handlers = {
+            'ice': lambda x, y, damage: visual_effects.create_frost_hit_visual(x, y),
+        }
+        self._default_hit_visual = visual_effects.create_hit_visual
+        self._explosion_visual_handlers = {
+            'cherry_bomb': lambda x, y, radius: visual_effects.create_cherry_bomb_visual(x, y),
+            'potato_mine': lambda x, y, radius: visual_effects.create_potato_mine_visual(x, y),
+        }
+        self._default_explosion_visual = visual_effects.create_explosion_visual
         
         # 创建背景渲染器
         self.background_renderer = BackgroundRenderer(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
@@ -204,6 +292,16 @@ class GameWindow(arcade.Window):
         # 初始化僵尸渲染集成系统
         self.zombie_render_integration = get_zombie_render_integration()
         
+        # 每帧只需 delta_time 的更新方法，按更新顺序绑定一次
+        self._frame_updaters = (
+            self.zombie_spawner.update,
+            self.sun_collection_system.update,
+            self.screen_shake.update,
+            self.ui_renderer.update,
+            self.background_renderer.update,
+            self.three_d_effects.update,
+        )
+        
         # 初始化存档系统
         self.save_system = get_save_system()
         
@@ -213,25 +311,31 @@ class GameWindow(arcade.Window):
         # 注册僵尸死亡回调
         self.zombie_behavior_system.register_death_callback(self._on_zombie_death)
         
+        # 新世界需要重建血条跟踪缓存和僵尸特效缓存
+        self._health_bar_targets = {}
+        self._health_bar_version = -1
+        self._zombie_count = 0
+        self._zombie_effect_ids = []
+        self._zombie_effect_version = -1
+        
         # 重置游戏数据（根据难度设置初始阳光）
         self.sun_count = difficulty_config.initial_sun
         self.score = 0
         self.play_time = 0.0
+        # 第一帧更新前UI就显示开局数值
+        self._sync_ui_values()
+        
+        # 开局时预先加载伤害数字字体，避免第一次命中时卡顿
+        self.damage_number_system.warm_up()
     
     def _get_difficulty_config(self, difficulty: str):
         """获取难度配置"""
-        if difficulty == "easy":
-            return EASY
-        elif difficulty == "hard":
-            return HARD
-        else:
-            return NORMAL
+        return _DIFFICULTY_CONFIGS.get(difficulty, NORMAL)
     
     def _init_systems(self):
         """初始化所有ECS系统"""
-        # 使用渲染系统
-        from ..ecs.systems import RenderSystem
-        self.render_system = RenderSystem(priority=100)
+        # 使用SpriteList批量渲染系统（每个z_index层一次绘制）
+        self.render_system = OptimizedRenderSystem(priority=100)
         self.world.add_system(self.render_system)
         
         self.movement_system = MovementSystem(priority=10)
@@ -248,6 +352,7 @@ class GameWindow(arcade.Window):
             self.event_bus,
             priority=35
         )
+        self.projectile_system.register_damage_callback(self._on_damage_dealt)
         self.world.add_system(self.projectile_system)
         
         self.plant_behavior_system = PlantBehaviorSystem(
@@ -255,6 +360,8 @@ class GameWindow(arcade.Window):
             self.event_bus,
             priority=40
         )
+        self.plant_behavior_system.register_damage_callback(self._on_damage_dealt)
+        self.plant_behavior_system.register_explosion_callback(self._on_explosion)
         self.world.add_system(self.plant_behavior_system)
         
         self.zombie_behavior_system = ZombieBehaviorSystem(
@@ -270,34 +377,30 @@ class GameWindow(arcade.Window):
         self.world.add_system(self.wave_system)
     
     def _register_event_handlers(self):
-        """注册事件处理器"""
-        self.event_bus.subscribe(EventType.DAMAGE_DEALT, self._on_damage_dealt)
-        self.event_bus.subscribe(EventType.EXPLOSION, self._on_explosion)
-        self.event_bus.subscribe(EventType.PLANT_DIED, self._on_plant_died)
-    
-    def _on_damage_dealt(self, event: Event):
-        """处理伤害事件"""
-        x = event.data.get('x', 0)
-        y = event.data.get('y', 0)
-        damage = event.data.get('damage', 0)
-        damage_type = event.data.get('damage_type', 'normal')
-        target_id = event.data.get('target_id')
-        
-        self.damage_number_system.add_damage_number(x, y, damage, damage_type)
-        
-        self.particle_system.create_hit_effect(x, y)
-        
-        # 添加视觉特效
-        if damage_type == 'ice':
-            self.visual_effects.create_frost(x, y, radius=40, duration=0.4)
-            self.visual_effects.create_hit_spark(x, y, length=15, color=(150, 200, 255))
-            # Add PVZ-style ice trail
-            self.visual_effects.create_ice_trail(x, y, radius=35, duration=0.5)
-        else:
-            self.visual_effects.create_hit_spark(x, y)
-            self.visual_effects.create_ripple(x, y, max_radius=30, color=(255, 200, 100))
-            # Add PVZ-style damage pop
-            self.visual_effects.create_damage_pop(x, y, damage, color=(255, 255, 255), duration=1.0)
+        """注册事件处理器（伤害和爆炸等高频效果由系统回调直接处理）"""
+        # 先取消旧订阅，保证重复注册（如重置游戏）不会累积处理器
+        self._unregister_event_handlers()
+        self._event_subscriptions = [
+            self.event_bus.subscribe(EventType.PLANT_DIED, self._on_plant_died),
+        ]
+    
+    def _unregister_event_handlers(self):
+        """取消已注册的事件处理器"""
+        for token in self._event_subscriptions:
+            self.event_bus.unsubscribe(*token)
+        self._event_subscriptions = []
+    
+    def _on_damage_dealt(self, x: float, y: float, damage: int,
+                         damage_type: str = 'normal', target_id: int = None):
+        """处理伤害回调"""
+        # 屏幕外的命中不创建伤害数字、粒子和视觉特效
+        if self._is_on_screen(x, y):
+            self.damage_number_system.add_damage_number(x, y, damage, damage_type)
+            
+            self.particle_system.create_hit_effect(x, y)
+            
+            # 添加视觉特效（整组创建）
+            self._hit_visual_handlers.get(damage_type, self._default_hit_visual)(x, y, damage)
         
         # 如果目标是僵尸，触发僵尸受击效果
         if target_id is not None:
@@ -307,80 +410,55 @@ class GameWindow(arcade.Window):
     
     def _play_damage_sound(self, damage_type: str):
         """根据伤害类型播放音效"""
-        from .audio_manager import SoundType
-        if damage_type == 'ice':
-            self.audio_manager.play_ice_hit_sound()
-        elif damage_type == 'fire':
-            self.audio_manager.play_fire_hit_sound()
-        else:
-            self.audio_manager.play_hit_sound()
+        self._damage_sound_handlers.get(damage_type, self._default_damage_sound)()
     
-    def _on_explosion(self, event: Event):
-        """处理爆炸事件"""
-        x = event.data.get('x', 0)
-        y = event.data.get('y', 0)
-        radius = event.data.get('radius', 100)
-        explosion_type = event.data.get('explosion_type', 'cherry_bomb')
-        
+    def _on_explosion(self, x: float, y: float, radius: float = 100,
+                      explosion_type: str = 'cherry_bomb'):
+        """处理爆炸回调"""
         intensity = min(radius / 10, 20)
         self.screen_shake.shake(intensity, 0.3)
         
-        particle_count = int(radius / 5)
-        from .particle_system import Color
-        self.particle_system.create_explosion(x, y, Color(255, 100, 0), particle_count)
-        
-        # 添加视觉特效
-        if explosion_type == 'cherry_bomb':
-            self.visual_effects.create_cherry_bomb_visual(x, y)
-        elif explosion_type == 'potato_mine':
-            self.visual_effects.create_potato_mine_visual(x, y)
-        else:
-            self.visual_effects.create_explosion(x, y, max_radius=radius, color=(255, 150, 50))
-            self.visual_effects.create_shockwave(x, y, max_radius=radius * 1.5)
+        # 震动和音效总是触发，粒子和视觉特效只在爆炸范围可见时创建
+        if self._is_on_screen(x, y, radius):
+            particle_count = int(radius / 5)
+            self.particle_system.create_explosion(x, y, Color(255, 100, 0), particle_count)
+            
+            # 添加视觉特效
+            self._explosion_visual_handlers.get(
+                explosion_type, self._default_explosion_visual
+            )(x, y, radius)
         
-        self.audio_manager.play_sound(self._get_explosion_sound_type(explosion_type))
+        self.audio_manager.play_sound(
+            _EXPLOSION_SOUND_TYPES.get(explosion_type, SoundType.EXPLOSION)
+        )
     
-    def _get_explosion_sound_type(self, explosion_type: str):
-        """获取爆炸音效类型"""
-        from .audio_manager import SoundType
-        if explosion_type == 'cherry_bomb':
-            return SoundType.CHERRY_BOMB
-        elif explosion_type == 'potato_mine':
-            return SoundType.POTATO_MINE
-        return SoundType.EXPLOSION
+    def _is_on_screen(self, x: float, y: float, radius: float = 0.0) -> bool:
+        """检查位置（含半径）是否在屏幕可见范围内"""
+        margin = self.EFFECT_CULL_MARGIN + radius
+        return (-margin <= x <= self._w + margin and
+                -margin <= y <= self._h + margin)
     
     def _on_plant_died(self, event: Event):
         """处理植物死亡事件"""
-        entity_id = event.data.get('entity_id')
-        row = event.data.get('row', -1)
-        col = event.data.get('col', -1)
+        payload = event.data
+        entity_id = payload.entity_id
+        row = payload.row
+        col = payload.col
         
-        # 从 planting_system 中移除植物引用
+        # 从 planting_system 中移除植物引用（该格子可能已被重新种植，需核对实体ID）
         if row >= 0 and col >= 0:
-            if self.planting_system.is_position_occupied(row, col):
-                # 获取该位置的实体
-                plant_entity = self.planting_system.get_plant_at(row, col)
-                if plant_entity and plant_entity.id == entity_id:
-                    # 从 planted_positions 中移除
-                    del self.planting_system.planted_positions[(row, col)]
-        
-        # 销毁实体
-        try:
-            from ..ecs import Entity
-            entity = Entity()
-            entity.id = entity_id
-            self.world.destroy_entity(entity)
-        except Exception as e:
-            self.logger.warning(f"销毁植物实体失败: {e}")
+            positions = self.planting_system.planted_positions
+            plant_entity = positions.get((row, col))
+            if plant_entity is not None and plant_entity.id == entity_id:
+                del positions[(row, col)]
+        
+        # 销毁实体（只是标记待销毁，帧末统一移除）
+        self.world.destroy_entity_by_id(entity_id)
     
     def on_update(self, delta_time: float):
         """更新游戏状态"""
-        # 如果在菜单中，只更新菜单
-        if self.game_state.is_in_menu():
-            return
-        
-        # 如果暂停，不更新游戏逻辑
-        if self.game_state.is_paused():
+        # 在菜单中或暂停时不更新游戏逻辑
+        if self.game_state.state_flags & _NO_UPDATE_STATES:
             return
         
         # 如果游戏未初始化或已结束，不更新
@@ -397,99 +475,152 @@ class GameWindow(arcade.Window):
             # 更新种植系统
             self.planting_system.update(delta_time, self.sun_count)
             
-            # 更新僵尸生成器
-            self.zombie_spawner.update(delta_time)
-            
-            # 更新阳光收集系统
-            self.sun_collection_system.update(delta_time)
-            
-            # 更新粒子系统
-            self.particle_system.update(delta_time)
-            
-            # 更新伤害数字系统
-            self.damage_number_system.update(delta_time)
+            # 更新僵尸生成器、阳光收集、屏幕震动、UI渲染器、背景动画和3D效果
+            for update in self._frame_updaters:
+                update(delta_time)
             
-            # 更新屏幕震动
-            self.screen_shake.update(delta_time)
+            # 更新粒子、伤害数字和视觉特效系统（空闲时跳过）
+            particles = self.particle_system
+            if not particles.is_empty:
+                particles.update(delta_time)
+            damage_numbers = self.damage_number_system
+            if not damage_numbers.is_empty:
+                damage_numbers.update(delta_time)
+            visual_effects = self.visual_effects
+            if not visual_effects.is_empty:
+                visual_effects.update(delta_time)
             
-            # 更新UI渲染器
-            self.ui_renderer.update(delta_time)
-            self.ui_renderer.set_sun_count(self.sun_count)
-            self.ui_renderer.set_score(self.score)
-            
-            # 更新波次信息
-            self.ui_renderer.set_wave_info(
-                self.zombie_spawner.current_wave,
-                self.zombie_spawner.total_waves,
-                getattr(self.zombie_spawner, 'get_wave_progress', lambda: 0.0)()
-            )
-            
-            # 更新背景动画
-            self.background_renderer.update(delta_time)
-            
-            # 更新视觉特效系统
-            self.visual_effects.update(delta_time)
-            
-            # 更新3D效果系统
-            self.three_d_effects.update(delta_time)
+            # 同步UI数值
+            self._sync_ui_values()
             
             # 更新僵尸渲染集成系统
-            self.zombie_render_integration.update(delta_time, self.world._component_manager)
+            self.zombie_render_integration.update(delta_time, self._cm)
             
-            # 更新血条系统
+            # 更新血条系统（同步血量后推进闪烁、平滑和低血量脉冲动画）
             self._update_health_bars()
+            self.health_bar_system.update(delta_time)
             
             # 检查游戏结束条件
             self._check_game_over()
         except Exception as e:
-            self.logger.error(f"游戏更新时发生异常: {e}")
-            self.logger.error(traceback.format_exc())
+            self._log_update_exception(e)
+    
+    def _log_update_exception(self, error: Exception):
+        """
+        记录每帧更新中的异常
+        
+        持续出错时每秒最多记录一次（附带期间被跳过的次数），
+        堆栈由 logger.exception 交给日志框架格式化
+        """
+        now = time.monotonic()
+        if now - self._last_update_error_time < self.UPDATE_ERROR_LOG_INTERVAL:
+            self._suppressed_update_errors += 1
+            return
+        
+        suppressed = self._suppressed_update_errors
+        self._last_update_error_time = now
+        self._suppressed_update_errors = 0
+        if suppressed:
+            self.logger.exception(f"游戏更新时发生异常: {error}（此前 1 秒内另有 {suppressed} 次被跳过）")
+        else:
+            self.logger.exception(f"游戏更新时发生异常: {error}")
+    
+    def _sync_ui_values(self):
+        """
+        把阳光、分数和波次信息同步到UI渲染器，数值未变化时跳过
+        
+        这是向UI渲染器推送这三项数值的唯一入口
+        """
+        ui_renderer = self.ui_renderer
+        if self.sun_count != self._ui_sun_count:
+            self._ui_sun_count = self.sun_count
+            ui_renderer.set_sun_count(self.sun_count)
+        if self.score != self._ui_score:
+            self._ui_score = self.score
+            ui_renderer.set_score(self.score)
+        
+        # 更新波次信息（生成器的波次状态有变化时才重新计算）
+        spawner = self.zombie_spawner
+        if spawner.wave_state_version != self._ui_wave_version:
+            self._ui_wave_version = spawner.wave_state_version
+            ui_renderer.set_wave_info(
+                spawner.current_wave, spawner.total_waves, self._get_wave_progress()
+            )
     
     def _update_health_bars(self):
         """更新血条显示"""
-        # 更新僵尸血条
-        zombies = self.world._component_manager.query(
+        # 组件结构变化时才重新查询，否则直接使用缓存的组件和血条引用；
+        # 这项检查每帧都做，保证胜利判定用到的僵尸数量是最新的
+        if self._cm._cache_version != self._health_bar_version:
+            self._refresh_health_bar_targets()
+        
+        # 血量和位置按间隔同步（新血条创建时已写入当前值）
+        self._health_bar_frame += 1
+        if self._health_bar_frame % self.HEALTH_BAR_UPDATE_STRIDE:
+            return
+        
+        # 直接写入血条字段，省去每个实体的查找和方法调用
+        # 最大生命值在运行中不变，只在重建缓存时同步，这里只写会变化的字段；
+        # 血量和位置都未变化的血条不标记，渲染时跳过精灵同步
+        offset_y = self.health_bar_system.offset_y
+        mark_dirty = self.health_bar_system.mark_dirty
+        for entity_id, (transform, health, bar) in self._health_bar_targets.items():
+            current = health.current
+            x = transform.x
+            y = transform.y + offset_y
+            if current != bar.current_health or x != bar.x or y != bar.y:
+                bar.current_health = current
+                bar.x = x
+                bar.y = y
+                mark_dirty(entity_id)
+    
+    def _refresh_health_bar_targets(self):
+        """重建需要显示血条的实体缓存，并为新实体创建血条"""
+        component_manager = self._cm
+        health_bar_system = self.health_bar_system
+        get_health_bar = health_bar_system.get_health_bar
+        add_health_bar = health_bar_system.add_health_bar
+        targets = {}
+        
+        def track(entity_id, transform, health, width=None, height=None):
+            bar = get_health_bar(entity_id)
+            if bar is None:
+                add_health_bar(
+                    entity_id, transform.x, transform.y,
+                    health.current, health.max_health,
+                    width, height
+                )
+                bar = get_health_bar(entity_id)
+            else:
+                bar.max_health = health.max_health
+                health_bar_system.mark_dirty(entity_id)
+            targets[entity_id] = (transform, health, bar)
+        
+        # 僵尸血条（默认尺寸）
+        zombie_count = 0
+        for entity_id, transform, health, _ in component_manager.query_with_components(
             TransformComponent, HealthComponent, ZombieComponent
-        )
-        for entity_id in zombies:
-            transform = self.world._component_manager.get_component(entity_id, TransformComponent)
-            health = self.world._component_manager.get_component(entity_id, HealthComponent)
-            
-            if transform and health:
-                # 如果血条不存在，添加血条
-                if self.health_bar_system.get_health_bar(entity_id) is None:
-                    self.health_bar_system.add_health_bar(
-                        entity_id, transform.x, transform.y,
-                        health.current, health.max_health
-                    )
-                else:
-                    # 更新血条位置和血量
-                    self.health_bar_system.update_health_bar(
-                        entity_id, health.current, health.max_health,
-                        transform.x, transform.y
-                    )
-        
-        # 更新植物血条（只对高血量植物如坚果墙显示）
-        plants = self.world._component_manager.query(
+        ):
+            track(entity_id, transform, health)
+            zombie_count += 1
+        
+        # 植物血条（只对高血量植物如坚果墙显示）
+        min_health = self.PLANT_BAR_MIN_HEALTH
+        bar_width, bar_height = self.PLANT_BAR_SIZE
+        for entity_id, transform, health, _ in component_manager.query_with_components(
             TransformComponent, HealthComponent, PlantComponent
-        )
-        for entity_id in plants:
-            health = self.world._component_manager.get_component(entity_id, HealthComponent)
-            # 只对最大生命值大于100的植物显示血条
-            if health and health.max_health > 100:
-                transform = self.world._component_manager.get_component(entity_id, TransformComponent)
-                if transform:
-                    if self.health_bar_system.get_health_bar(entity_id) is None:
-                        self.health_bar_system.add_health_bar(
-                            entity_id, transform.x, transform.y,
-                            health.current, health.max_health,
-                            width=40, height=4  # 植物血条小一些
-                        )
-                    else:
-                        self.health_bar_system.update_health_bar(
-                            entity_id, health.current, health.max_health,
-                            transform.x, transform.y
-                        )
+        ):
+            if health.max_health > min_health:
+                track(entity_id, transform, health, bar_width, bar_height)
+        
+        # 移除已不存在实体的血条
+        for entity_id in list(health_bar_system.health_bars):
+            if entity_id not in targets:
+                health_bar_system.remove_health_bar(entity_id)
+        
+        self._health_bar_targets = targets
+        self._health_bar_version = component_manager._cache_version
+        self._zombie_count = zombie_count
     
     def on_draw(self):
         """渲染游戏画面"""
@@ -497,27 +628,39 @@ class GameWindow(arcade.Window):
         perf_monitor = get_performance_monitor()
         perf_monitor.begin_frame()
         
-        self.clear()
-        
         # 如果在菜单中，只渲染菜单
-        if self.game_state.is_in_menu():
-            self.menu_system.render()
+        state_flags = self.game_state.state_flags
+        menu_system = self.menu_system
+        if state_flags & StateFlag.MENU:
+            self.clear()
+            menu_system.render_cached()
             perf_monitor.end_frame()
             return
         
         # 如果游戏未初始化，不渲染游戏画面
         if not self.world:
+            self.clear()
             perf_monitor.end_frame()
             return
         
-        # 获取屏幕震动偏移（暂时不应用）
-        shake_x, shake_y = self.screen_shake.get_offset()
+        # 天空渐变不透明地覆盖整个窗口，只有震动平移场景时才会露出边缘，
+        # 其余帧省去一次全屏清除
+        shake = self.screen_shake
+        shaking = shake.offset_x != 0.0 or shake.offset_y != 0.0
+        if shaking:
+            self.clear()
+            camera = self._world_camera
+            camera.position = (
+                self._half_w - shake.offset_x,
+                self._half_h - shake.offset_y
+            )
+            camera.use()
         
         # 渲染背景
         self.background_renderer.render()
         
         # 渲染所有实体
-        self.render_system.render(self.world._component_manager)
+        self.render_system.render(self._cm)
         
         # 渲染僵尸特效（阴影、尘土、表情等）
         self._render_zombie_effects()
@@ -535,83 +678,77 @@ class GameWindow(arcade.Window):
         self.sun_collection_system.render_suns()
         
         # 渲染粒子效果
-        self.particle_system.render()
+        particles = self.particle_system
+        if not particles.is_empty:
+            particles.render()
         
         # 渲染视觉特效
-        self.visual_effects.render()
+        visual_effects = self.visual_effects
+        if not visual_effects.is_empty:
+            visual_effects.render()
+        
+        # UI 不随屏幕震动
+        if shaking:
+            self.default_camera.use()
         
         # 渲染UI
         self._draw_ui()
         
-        # 如果暂停，渲染暂停菜单
-        if self.game_state.is_paused():
-            self.menu_system.render()
-        
-        # 如果游戏结束或胜利，渲染结束菜单
-        if self.game_state.is_game_over() or self.game_state.is_victory():
-            self.menu_system.render()
+        # 如果暂停、游戏结束或胜利，渲染覆盖在游戏画面上的菜单
+        if state_flags & _OVERLAY_MENU_STATES:
+            menu_system.render()
         
-        # 更新性能监控数据
-        perf_monitor.set_entity_count(len(self.world._entity_manager._entities))
-        perf_monitor.set_particle_count(self.particle_system.get_total_particle_count())
-        
-        # 渲染性能监控信息
-        perf_monitor.render()
+        # 更新并渲染性能监控信息（隐藏时跳过统计采集）
+        if perf_monitor.show_debug:
+            perf_monitor.set_entity_count(self.world.entity_count)
+            perf_monitor.set_particle_count(particles.get_total_particle_count())
+            perf_monitor.render()
         
         # 结束性能监控帧
         perf_monitor.end_frame()
     
     def _render_zombie_effects(self):
         """渲染僵尸特效（阴影、尘土、表情等）"""
-        # 获取所有僵尸实体并渲染特效
-        zombies = self.world._component_manager.query(
-            TransformComponent, SpriteComponent, ZombieComponent
-        )
-        for zombie_id in zombies:
-            self.zombie_render_integration.render(zombie_id, self.world._component_manager)
+        # 僵尸ID列表只在组件结构变化时重新查询，其余帧直接复用
+        cm = self._cm
+        if cm._cache_version != self._zombie_effect_version:
+            self._zombie_effect_ids = cm.query(TransformComponent, SpriteComponent, ZombieComponent)
+            self._zombie_effect_version = cm._cache_version
+        
+        self.zombie_render_integration.render_all(self._zombie_effect_ids, cm)
     
     def _draw_ui(self):
         """绘制UI界面"""
-        # 使用增强的UI渲染器
-        self.ui_renderer.render()
-    
-    def _draw_game_over(self):
-        """绘制游戏结束画面 - 使用增强版渲染器"""
-        self.game_over_renderer.show(False, self.score, self.zombie_spawner.current_wave)
-        self.game_over_renderer.render()
-    
-    def _draw_victory(self):
-        """绘制胜利画面 - 使用增强版渲染器"""
-        self.game_over_renderer.show(True, self.score, self.zombie_spawner.current_wave)
-        self.game_over_renderer.render()
+        # 使用增强的UI渲染器（数值由 _sync_ui_values 在变化时推送，文字对象已缓存）
+        self.ui_renderer.render(self.current_level)
     
     def _check_game_over(self):
         """检查游戏是否结束"""
+        # 最左僵尸位置和存活数量由僵尸行为系统在本帧更新时统计
+        behavior = self.zombie_behavior_system
+        
         # 检查是否有僵尸到达最左侧
-        zombies = self.world._component_manager.query(TransformComponent, ZombieComponent)
-        for entity_id in zombies:
-            transform = self.world._component_manager.get_component(entity_id, TransformComponent)
-            if transform and transform.x <= 0:
-                self.game_over = True
-                # 使用游戏状态管理器
-                self.game_state.game_over(self.score)
-                # 显示游戏结束菜单
-                self.menu_system.show_game_over(False, self.score)
-                # 播放游戏结束音效
-                self.audio_manager.play_game_over_sound()
-                return
+        if behavior.min_zombie_x <= 0:
+            self.game_over = True
+            # 使用游戏状态管理器
+            self.game_state.game_over(self.score)
+            # 显示游戏结束菜单
+            self.menu_system.show_game_over(False, self.score)
+            # 播放游戏结束音效
+            self.audio_manager.play_game_over_sound()
+            return
         
         # 检查是否完成所有波次且没有僵尸
-        if self.zombie_spawner.is_level_complete():
-            zombies_remaining = len(self.world._component_manager.query(TransformComponent, ZombieComponent))
-            if zombies_remaining == 0:
-                self.victory = True
-                # 使用游戏状态管理器
-                self.game_state.victory(self.score)
-                # 显示胜利菜单
-                self.menu_system.show_game_over(True, self.score)
-                # 播放胜利音效
-                self.audio_manager.play_victory_sound()
+        # _zombie_count 在本帧血条更新（生成器更新之后）时统计，已包含本帧新生成的僵尸
+        if (behavior.live_zombie_count == 0 and self._zombie_count == 0
+                and self.zombie_spawner.is_level_complete()):
+            self.victory = True
+            # 使用游戏状态管理器
+            self.game_state.victory(self.score)
+            # 显示胜利菜单
+            self.menu_system.show_game_over(True, self.score)
+            # 播放胜利音效
+            self.audio_manager.play_victory_sound()
     
     def _on_zombie_death(self, zombie_id: int, score_value: int):
         """僵尸死亡回调"""
@@ -620,11 +757,10 @@ class GameWindow(arcade.Window):
         self.audio_manager.play_zombie_death_sound()
         
         # 获取僵尸位置并创建粒子效果
-        transform = self.world._component_manager.get_component(zombie_id, TransformComponent)
+        transform = self._cm.get_component(zombie_id, TransformComponent)
         if transform:
             self.particle_system.create_zombie_death_effect(transform.x, transform.y)
             # 触发僵尸死亡动画
-            from .zombie_visual_system import DeathType
             self.zombie_render_integration.start_death_animation(
                 zombie_id, transform.x, transform.y,
                 zombie_type='normal', death_type=DeathType.NORMAL
@@ -632,6 +768,7 @@ class GameWindow(arcade.Window):
         
         # 移除血条
         self.health_bar_system.remove_health_bar(zombie_id)
+        self._health_bar_targets.pop(zombie_id, None)
         
         # 移除僵尸渲染效果
         self.zombie_render_integration.remove_zombie(zombie_id)
@@ -704,42 +841,39 @@ class GameWindow(arcade.Window):
         # 先清理已销毁的植物引用
         self.planting_system._cleanup_destroyed_plants()
         
-        # 收集植物数据
+        # 收集植物数据（直接按实体ID读取组件存储）
+        plant_type_store = self._cm.get_all_components(PlantTypeComponent)
+        transform_store = self._cm.get_all_components(TransformComponent)
+        health_store = self._cm.get_all_components(HealthComponent)
         plants = []
         for (row, col), entity in self.planting_system.planted_positions.items():
-            from ..ecs.components import PlantComponent, TransformComponent
-            try:
-                plant_comp = self.world._component_manager.get_component(entity, PlantComponent)
-                transform_comp = self.world._component_manager.get_component(entity, TransformComponent)
-                if plant_comp and transform_comp:
-                    plants.append({
-                        'plant_type': plant_comp.plant_type.name,
-                        'x': transform_comp.x,
-                        'y': transform_comp.y,
-                        'row': row,
-                        'col': col,
-                        'health': plant_comp.health if hasattr(plant_comp, 'health') else 100
-                    })
-            except Exception:
-                # 如果获取组件失败，跳过这个植物
+            plant_type_comp = plant_type_store.get(entity.id)
+            transform_comp = transform_store.get(entity.id)
+            if plant_type_comp is None or transform_comp is None:
                 continue
-        
-        # 收集僵尸数据
-        zombies = []
-        from ..ecs.components import ZombieComponent, HealthComponent
-        zombie_entities = self.world._component_manager.query(TransformComponent, ZombieComponent, HealthComponent)
-        for entity_id in zombie_entities:
-            transform = self.world._component_manager.get_component(entity_id, TransformComponent)
-            zombie = self.world._component_manager.get_component(entity_id, ZombieComponent)
-            health = self.world._component_manager.get_component(entity_id, HealthComponent)
-            if transform and zombie and health:
-                zombies.append({
-                    'zombie_type': zombie.zombie_type.name if hasattr(zombie, 'zombie_type') else 'NORMAL',
-                    'x': transform.x,
-                    'y': transform.y,
-                    'health': health.current,
-                    'max_health': health.max_health
-                })
+            health = health_store.get(entity.id)
+            plants.append({
+                'plant_type': plant_type_comp.plant_type.name,
+                'x': transform_comp.x,
+                'y': transform_comp.y,
+                'row': row,
+                'col': col,
+                'health': health.current if health else 100
+            })
+        
+        # 收集僵尸数据（查询结果已带齐所需组件）
+        zombies = [
+            {
+                'zombie_type': zombie_type.zombie_type.name,
+                'x': transform.x,
+                'y': transform.y,
+                'health': health.current,
+                'max_health': health.max_health
+            }
+            for _, transform, zombie_type, health in self._cm.query_with_components(
+                TransformComponent, ZombieTypeComponent, HealthComponent
+            )
+        ]
         
         # 创建存档数据
         save_data = GameSaveData(
@@ -809,10 +943,7 @@ class GameWindow(arcade.Window):
     def on_mouse_press(self, x: float, y: float, button, modifiers):
         """处理鼠标点击"""
         # 如果有菜单显示，优先处理菜单点击
-        if (self.game_state.is_in_menu() or 
-            self.game_state.is_paused() or 
-            self.game_state.is_game_over() or 
-            self.game_state.is_victory()):
+        if self.game_state.state_flags & _MENU_SHOWN_STATES:
             if self.menu_system.on_mouse_click(x, y):
                 return
         
@@ -827,7 +958,8 @@ class GameWindow(arcade.Window):
             return
         
         # 处理种植
-        handled, planted, removed = self.planting_system.handle_mouse_press(x, y, self.sun_count, return_tuple=True)
+        planting_system = self.planting_system
+        handled, planted, removed = planting_system.handle_mouse_press(x, y, self.sun_count, return_tuple=True)
         if handled:
             if planted:
                 # 播放种植音效
@@ -837,14 +969,13 @@ class GameWindow(arcade.Window):
                 # 创建种植视觉特效
                 self.visual_effects.create_planting_visual(x, y)
                 # 消耗阳光
-                cost = self.planting_system.get_planting_cost()
+                cost = planting_system.get_planting_cost()
                 if cost > 0:
                     self.spend_sun(cost)
             elif removed is not None:
                 # 植物被移除，创建特效
                 row, col = removed
-                cell_x = self.planting_system.GRID_START_X + col * self.planting_system.CELL_WIDTH + self.planting_system.CELL_WIDTH / 2
-                cell_y = self.planting_system.GRID_START_Y + row * self.planting_system.CELL_HEIGHT + self.planting_system.CELL_HEIGHT / 2
+                cell_x, cell_y = planting_system.cell_center(row, col)
                 # 创建移除植物的粒子效果
                 self.particle_system.create_plant_effect(cell_x, cell_y)
             return
@@ -855,10 +986,7 @@ class GameWindow(arcade.Window):
         self._mouse_y = y
         
         # 如果在菜单中，传递给菜单系统
-        if (self.game_state.is_in_menu() or 
-            self.game_state.is_paused() or 
-            self.game_state.is_game_over() or 
-            self.game_state.is_victory()):
+        if self.game_state.state_flags & _MENU_SHOWN_STATES:
             self.menu_system.on_mouse_motion(x, y)
             return
         
@@ -878,6 +1006,11 @@ class GameWindow(arcade.Window):
         self.visual_effects.clear()
         self.zombie_render_integration.clear()
         self.screen_shake.stop()
+        self._health_bar_targets = {}
+        self._health_bar_version = -1
+        self._zombie_count = 0
+        self._zombie_effect_ids = []
+        self._zombie_effect_version = -1
         self.sun_count = 50
         self.score = 0
         self.game_over = False
@@ -984,5 +1117,5 @@ class GameWindow(arcade.Window):
         # 保存当前选择的难度
         self.current_difficulty = difficulty
         # 开始游戏（使用当前关卡或默认关卡1）
-        level = getattr(self.menu_system, '_pending_level', 1)
+        level = self.menu_system._pending_level
         self.game_state.start_game(level, difficulty)
@@ -11,12 +11,12 @@
 import arcade
 import math
 import random
-from typing import Dict, Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List, Set
 from dataclasses import dataclass, field
-from ..core.theme_colors import StatusColors, UIColors, WHITE, Color
+from ..core.theme_colors import StatusColors, UIColors, WHITE, Color, FONT_NAMES
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthBar:
     """血条数据 - 增强版"""
     entity_id: int
@@ -37,6 +37,9 @@ class HealthBar:
     # 历史血量（用于检测变化）
     prev_health: float = field(default=0.0)
     
+    # 上一次更新时是否处于动画中（闪烁、延迟血量条、低血量脉冲）
+    animating: bool = field(default=False)
+    
     def __post_init__(self):
         if self.display_health == 0.0:
             self.display_health = self.current_health
@@ -56,59 +59,57 @@ class HealthBar:
         if self.max_health <= 0:
             return 0.0
         return max(0.0, min(1.0, self.display_health / self.max_health))
-    
-    def update(self, dt: float) -> None:
-        """更新血条动画"""
-        # 平滑血量变化
-        diff = self.current_health - self.display_health
-        self.display_health += diff * 0.15
-        
-        # 检测受伤/治疗
-        health_diff = self.current_health - self.prev_health
-        if health_diff < 0:
-            # 受伤
-            self.damage_flash = 1.0
-        elif health_diff > 0:
-            # 治疗
-            self.heal_flash = 1.0
-        
-        self.prev_health = self.current_health
-        
-        # 闪烁衰减
-        self.damage_flash *= 0.9
-        self.heal_flash *= 0.9
-        
-        # 低血量脉冲
-        if self.health_percent <= 0.3:
-            self.pulse_phase += dt * 5.0
-        else:
-            self.pulse_phase = 0.0
-    
-    def get_health_color(self, percent: float) -> Color:
-        """根据血量获取颜色 - 渐变效果"""
-        if percent > 0.6:
-            return StatusColors.HEALTH_HIGH
-        elif percent > 0.3:
-            # 绿色到黄色的渐变
-            t = (percent - 0.3) / 0.3
-            return Color(
-                int(StatusColors.HEALTH_LOW.r + (StatusColors.HEALTH_HIGH.r - StatusColors.HEALTH_LOW.r) * t),
-                int(StatusColors.HEALTH_LOW.g + (StatusColors.HEALTH_HIGH.g - StatusColors.HEALTH_LOW.g) * t),
-                int(StatusColors.HEALTH_LOW.b + (StatusColors.HEALTH_HIGH.b - StatusColors.HEALTH_LOW.b) * t)
-            )
-        else:
-            # 黄色到红色的渐变
-            t = percent / 0.3
-            return Color(
-                int(StatusColors.HEALTH_LOW.r + (StatusColors.HEALTH_MEDIUM.r - StatusColors.HEALTH_LOW.r) * t),
-                int(StatusColors.HEALTH_LOW.g + (StatusColors.HEALTH_MEDIUM.g - StatusColors.HEALTH_LOW.g) * t),
-                int(StatusColors.HEALTH_LOW.b + (StatusColors.HEALTH_MEDIUM.b - StatusColors.HEALTH_LOW.b) * t)
-            )
 
 
-@dataclass
+def _compute_health_rgb(percent: float) -> Tuple[int, int, int]:
+    """血量渐变颜色的分段线性公式（仅用于生成查找表）"""
+    low = StatusColors.HEALTH_LOW
+    if percent > 0.6:
+        high = StatusColors.HEALTH_HIGH
+        return (high.r, high.g, high.b)
+    if percent > 0.3:
+        # 绿色到黄色的渐变
+        end = StatusColors.HEALTH_HIGH
+        t = (percent - 0.3) / 0.3
+    else:
+        # 黄色到红色的渐变
+        end = StatusColors.HEALTH_MEDIUM
+        t = percent / 0.3
+    return (
+        int(low.r + (end.r - low.r) * t),
+        int(low.g + (end.g - low.g) * t),
+        int(low.b + (end.b - low.b) * t)
+    )
+
+
+# 血量颜色查找表：血量比例量化为 256 级，每级 3 字节 RGB，模块加载时生成一次
+_HEALTH_LUT_STEPS = 255
+_HEALTH_LUT = bytes(
+    channel
+    for i in range(_HEALTH_LUT_STEPS + 1)
+    for channel in _compute_health_rgb(i / _HEALTH_LUT_STEPS)
+)
+
+
+def _health_rgb(percent: float) -> Tuple[int, int, int]:
+    """根据血量比例（0~1）查表获取渐变颜色的 RGB 元组"""
+    if percent <= 0.0:
+        i = 0
+    elif percent >= 1.0:
+        i = _HEALTH_LUT_STEPS * 3
+    else:
+        i = int(percent * _HEALTH_LUT_STEPS + 0.5) * 3
+    lut = _HEALTH_LUT
+    return (lut[i], lut[i + 1], lut[i + 2])
+
+
+@dataclass(slots=True)
 class DamageNumber:
-    """伤害数字"""
+    """
+    伤害数字
+    
+    仅供 HealthBarSystem.add_damage_number 使用；游戏内的命中伤害数字由 DamageNumberSystem 负责
+    """
     x: float
     y: float
     value: int
@@ -150,8 +151,27 @@ class HealthBarSystem:
     管理并渲染所有实体的血条，包含动画效果
     """
     
+    # 每个血条由几层矩形精灵组成（阴影、边框、背景、延迟血量、血量、高光）
+    BAR_LAYER_COUNT = 6
+    DELAYED_BAR_COLOR = WHITE.with_alpha(100).rgba
+    HIGHLIGHT_COLOR = WHITE.with_alpha(60).rgba
+    
+    # 低血量警告光晕的白色圆形纹理（按类缓存，通过精灵颜色着色）
+    _glow_texture: Optional[arcade.Texture] = None
+    GLOW_TEXTURE_SIZE = 64
+    
     def __init__(self):
         self.health_bars: Dict[int, HealthBar] = {}
+        # 血条矩形精灵 - 所有血条放在同一个精灵列表中一次绘制
+        self._bar_sprite_list = arcade.SpriteList(lazy=True)
+        self._bar_sprites: Dict[int, Tuple[arcade.SpriteSolidColor, ...]] = {}
+        # 低血量警告光晕精灵 - 单独的精灵列表，在所有血条之前一次绘制
+        self._glow_sprite_list = arcade.SpriteList(lazy=True)
+        self._glow_sprites: Dict[int, arcade.Sprite] = {}
+        # 需要重新同步精灵的血条（数据或动画状态有变化），渲染后清空
+        self._dirty_bars: Set[int] = set()
+        # 低血量脉冲中的血条：有成员时才绘制警告光晕精灵列表
+        self._pulsing_bars: Set[int] = set()
         self.damage_numbers: List[DamageNumber] = []
         self.bar_width = 50
         self.bar_height = 8
@@ -190,11 +210,19 @@ class HealthBarSystem:
             prev_health=current_health
         )
         self.health_bars[entity_id] = bar
+        self._dirty_bars.add(entity_id)
     
     def remove_health_bar(self, entity_id: int) -> None:
         """移除血条"""
         if entity_id in self.health_bars:
             del self.health_bars[entity_id]
+        self._dirty_bars.discard(entity_id)
+        self._pulsing_bars.discard(entity_id)
+        self._remove_bar_sprites(entity_id)
+    
+    def mark_dirty(self, entity_id: int) -> None:
+        """标记血条数据已被外部直接修改，下次渲染时重新同步精灵"""
+        self._dirty_bars.add(entity_id)
     
     def update_health_bar(self, entity_id: int, 
                          current_health: float, max_health: float = None,
@@ -214,11 +242,14 @@ class HealthBarSystem:
         
         if y is not None:
             bar.y = y + self.offset_y
+        
+        self._dirty_bars.add(entity_id)
     
     def set_visibility(self, entity_id: int, visible: bool) -> None:
         """设置血条可见性"""
         if entity_id in self.health_bars:
             self.health_bars[entity_id].is_visible = visible
+            self._dirty_bars.add(entity_id)
     
     def add_damage_number(self, x: float, y: float, damage: int, 
                          is_crit: bool = False, is_heal: bool = False) -> None:
@@ -248,10 +279,48 @@ class HealthBarSystem:
         ))
     
     def update(self, dt: float) -> None:
-        """更新所有血条和伤害数字"""
+        """
+        更新所有血条和伤害数字
+        
+        血条动画（平滑血量、受伤/治疗闪烁、低血量脉冲）在一次遍历中完成，
+        避免每个血条一次方法调用和 health_percent 属性计算。
+        动画中的血条以及动画刚结束的血条标记为需要同步精灵。
+        """
         # 更新血条
-        for bar in self.health_bars.values():
-            bar.update(dt)
+        pulse_step = dt * 5.0
+        dirty_add = self._dirty_bars.add
+        for entity_id, bar in self.health_bars.items():
+            current = bar.current_health
+            
+            # 平滑血量变化
+            bar.display_health += (current - bar.display_health) * 0.15
+            
+            # 检测受伤/治疗
+            prev = bar.prev_health
+            if current < prev:
+                bar.damage_flash = 1.0
+            elif current > prev:
+                bar.heal_flash = 1.0
+            bar.prev_health = current
+            
+            # 闪烁衰减
+            bar.damage_flash *= 0.9
+            bar.heal_flash *= 0.9
+            
+            # 低血量脉冲（与 health_percent <= 0.3 等价）
+            max_health = bar.max_health
+            if max_health <= 0 or current / max_health <= 0.3:
+                bar.pulse_phase += pulse_step
+                animating = True
+            else:
+                bar.pulse_phase = 0.0
+                animating = (bar.damage_flash > 0.1 or bar.heal_flash > 0.1 or
+                             abs(bar.display_health - current) > 1)
+            
+            # 动画结束后再同步一次，恢复常态外观
+            if animating or bar.animating:
+                dirty_add(entity_id)
+            bar.animating = animating
         
         # 更新伤害数字
         for num in self.damage_numbers:
@@ -262,17 +331,107 @@ class HealthBarSystem:
     
     def render(self) -> None:
         """渲染所有血条和伤害数字"""
-        # 渲染血条
-        for bar in self.health_bars.values():
-            if bar.is_visible and bar.max_health > 0:
-                self._draw_health_bar(bar)
+        # 渲染血条：只同步有变化的血条的矩形精灵（脉冲中的血条由 update 每帧标记），
+        # 全部血条一次绘制
+        bar_sprites = self._bar_sprites
+        health_bars = self.health_bars
+        dirty = self._dirty_bars
+        pulsing = self._pulsing_bars
+        for entity_id in dirty:
+            bar = health_bars.get(entity_id)
+            if bar is None:
+                continue
+            sprites = bar_sprites.get(entity_id)
+            if sprites is None:
+                sprites = self._create_bar_sprites(entity_id)
+            if self._sync_bar_sprites(bar, sprites):
+                pulsing.add(entity_id)
+            else:
+                pulsing.discard(entity_id)
+        dirty.clear()
+        if pulsing:
+            self._glow_sprite_list.draw()
+        if bar_sprites:
+            self._bar_sprite_list.draw()
         
         # 渲染伤害数字
         for num in self.damage_numbers:
             self._draw_damage_number(num)
     
-    def _draw_health_bar(self, bar: HealthBar) -> None:
-        """绘制单个血条 - 增强版"""
+    def _create_bar_sprites(self, entity_id: int) -> Tuple[arcade.SpriteSolidColor, ...]:
+        """为血条创建矩形精灵（阴影、边框、背景、延迟血量、血量、高光）"""
+        sprites = tuple(
+            arcade.SpriteSolidColor(1, 1) for _ in range(self.BAR_LAYER_COUNT)
+        )
+        self._bar_sprite_list.extend(sprites)
+        self._bar_sprites[entity_id] = sprites
+        return sprites
+    
+    def _remove_bar_sprites(self, entity_id: int) -> None:
+        """移除血条对应的矩形精灵"""
+        sprites = self._bar_sprites.pop(entity_id, None)
+        if sprites:
+            for sprite in sprites:
+                sprite.remove_from_sprite_lists()
+        glow = self._glow_sprites.pop(entity_id, None)
+        if glow is not None:
+            glow.remove_from_sprite_lists()
+    
+    @classmethod
+    def _get_glow_texture(cls) -> arcade.Texture:
+        """获取白色圆形光晕纹理（按类缓存）"""
+        texture = cls._glow_texture
+        if texture is None:
+            texture = arcade.make_circle_texture(cls.GLOW_TEXTURE_SIZE, arcade.color.WHITE)
+            cls._glow_texture = texture
+        return texture
+    
+    def _hide_glow(self, entity_id: int) -> None:
+        """隐藏血条的警告光晕精灵（如果有）"""
+        glow = self._glow_sprites.get(entity_id)
+        if glow is not None and glow.visible:
+            glow.visible = False
+    
+    @staticmethod
+    def _set_rect(sprite: arcade.SpriteSolidColor, left: float, right: float,
+                  bottom: float, top: float, color: Tuple[int, int, int, int]) -> None:
+        """把矩形精灵设置为指定边界和颜色"""
+        if right <= left or top <= bottom:
+            sprite.visible = False
+            return
+        sprite.visible = True
+        sprite.position = ((left + right) / 2, (bottom + top) / 2)
+        sprite.size = (right - left, top - bottom)
+        if sprite.color != color:
+            sprite.color = color
+    
+    def _sync_bar_sprites(self, bar: HealthBar, sprites: Tuple[arcade.SpriteSolidColor, ...]) -> bool:
+        """
+        把单个血条的状态同步到它的矩形精灵 - 增强版
+        
+        血量比例每个血条只计算一次，颜色直接以 RGBA 元组计算，
+        避免每帧为每个血条创建多个 Color 对象
+        
+        Returns:
+            是否处于低血量脉冲（需要每帧重新同步并绘制警告光晕）
+        """
+        shadow, border, background, delayed, health, highlight = sprites
+        max_health = bar.max_health
+        if not (bar.is_visible and max_health > 0):
+            for sprite in sprites:
+                sprite.visible = False
+            self._hide_glow(bar.entity_id)
+            return False
+        
+        current = bar.current_health
+        percent = current / max_health
+        if percent < 0.0:
+            percent = 0.0
+        elif percent > 1.0:
+            percent = 1.0
+        damage_flash = bar.damage_flash
+        heal_flash = bar.heal_flash
+        
         # 计算位置
         half_width = bar.width / 2
         half_height = bar.height / 2
@@ -282,95 +441,115 @@ class HealthBarSystem:
         top = bar.y + half_height
         
         # 低血量脉冲效果
-        pulse_scale = 1.0
-        if bar.health_percent <= 0.3:
+        if percent <= 0.3:
             pulse = 0.5 + 0.5 * math.sin(bar.pulse_phase)
             pulse_scale = 1.0 + pulse * 0.1
             
-            # 绘制警告光晕
+            # 警告光晕（仅低血量时出现，精灵在首次需要时创建）；
+            # 脉冲谷底透明度取整后几乎为零，此时直接隐藏
             glow_alpha = int(50 * pulse)
-            arcade.draw_circle_filled(
-                bar.x, bar.y, half_width * 1.5,
-                StatusColors.ERROR.with_alpha(glow_alpha).rgba
-            )
+            if glow_alpha > 1:
+                glow = self._glow_sprites.get(bar.entity_id)
+                if glow is None:
+                    glow = arcade.Sprite(self._get_glow_texture())
+                    self._glow_sprites[bar.entity_id] = glow
+                    self._glow_sprite_list.append(glow)
+                elif not glow.visible:
+                    glow.visible = True
+                error = StatusColors.ERROR
+                glow.position = (bar.x, bar.y)
+                glow.size = (half_width * 3, half_width * 3)
+                glow.color = (error.r, error.g, error.b, glow_alpha)
+            else:
+                self._hide_glow(bar.entity_id)
+            
+            # 应用脉冲缩放
+            if pulse_scale != 1.0:
+                center_x = (left + right) / 2
+                center_y = (bottom + top) / 2
+                w = (right - left) * pulse_scale / 2
+                h = (top - bottom) * pulse_scale / 2
+                left = center_x - w
+                right = center_x + w
+                bottom = center_y - h
+                top = center_y + h
+        else:
+            self._hide_glow(bar.entity_id)
         
-        # 应用脉冲缩放
-        if pulse_scale != 1.0:
-            center_x = (left + right) / 2
-            center_y = (bottom + top) / 2
-            w = (right - left) * pulse_scale / 2
-            h = (top - bottom) * pulse_scale / 2
-            left = center_x - w
-            right = center_x + w
-            bottom = center_y - h
-            top = center_y + h
+        set_rect = self._set_rect
         
-        # 绘制阴影
-        arcade.draw_lrbt_rectangle_filled(
-            left + 2, right + 2, bottom - 2, top - 2,
-            (0, 0, 0, 100)
-        )
+        # 阴影
+        set_rect(shadow, left + 2, right + 2, bottom - 2, top - 2, (0, 0, 0, 100))
         
-        # 绘制背景
-        arcade.draw_lrbt_rectangle_filled(
-            left, right, bottom, top,
-            self.bg_color.rgba
+        # 边框（受伤时变红加粗，治疗时变绿），画在背景下方并向外扩出边框宽度
+        border_width = 1
+        if damage_flash > 0.1:
+            c = self.damage_flash_color
+            border_rgba = (c.r, c.g, c.b, int(150 + damage_flash * 105))
+            border_width = 2
+        elif heal_flash > 0.1:
+            c = self.heal_flash_color
+            border_rgba = (c.r, c.g, c.b, int(150 + heal_flash * 105))
+        else:
+            border_rgba = self.border_color.rgba
+        set_rect(
+            border, left - border_width, right + border_width,
+            bottom - border_width, top + border_width, border_rgba
         )
         
-        # 绘制血量背景（显示血量变化）
-        display_width = bar.width * bar.display_percent
-        if display_width > 0 and abs(bar.display_health - bar.current_health) > 1:
-            # 延迟血量条（白色）
-            arcade.draw_lrbt_rectangle_filled(
-                left, left + display_width, bottom + 1, top - 1,
-                WHITE.with_alpha(100).rgba
+        # 背景
+        set_rect(background, left, right, bottom, top, self.bg_color.rgba)
+        
+        # 血量背景（显示血量变化，延迟血量条为白色）
+        display_percent = bar.display_health / max_health
+        if display_percent < 0.0:
+            display_percent = 0.0
+        elif display_percent > 1.0:
+            display_percent = 1.0
+        display_width = bar.width * display_percent
+        if display_width > 0 and abs(bar.display_health - current) > 1:
+            set_rect(
+                delayed, left, left + display_width, bottom + 1, top - 1,
+                self.DELAYED_BAR_COLOR
             )
+        else:
+            delayed.visible = False
         
-        # 绘制实际血量
-        health_width = bar.width * bar.health_percent
+        # 实际血量
+        health_width = bar.width * percent
         if health_width > 0:
-            health_color = bar.get_health_color(bar.health_percent)
+            r, g, b = _health_rgb(percent)
             
             # 受伤闪烁效果
-            if bar.damage_flash > 0.1:
-                flash_intensity = bar.damage_flash
-                health_color = Color(
-                    int(health_color.r + (255 - health_color.r) * flash_intensity * 0.5),
-                    int(health_color.g * (1 - flash_intensity * 0.3)),
-                    int(health_color.b * (1 - flash_intensity * 0.3))
-                )
+            if damage_flash > 0.1:
+                r = int(r + (255 - r) * damage_flash * 0.5)
+                g = int(g * (1 - damage_flash * 0.3))
+                b = int(b * (1 - damage_flash * 0.3))
             
-            # 治疗闪烁效果
-            if bar.heal_flash > 0.1:
-                flash_intensity = bar.heal_flash
-                health_color = health_color.lighten(flash_intensity * 0.3)
+            # 治疗闪烁效果（与 Color.lighten 相同的取整）
+            if heal_flash > 0.1:
+                amount = heal_flash * 0.3
+                r = min(255, int(r + (255 - r) * amount))
+                g = min(255, int(g + (255 - g) * amount))
+                b = min(255, int(b + (255 - b) * amount))
             
-            arcade.draw_lrbt_rectangle_filled(
-                left, left + health_width, bottom + 1, top - 1,
-                health_color.rgba
+            set_rect(
+                health, left, left + health_width, bottom + 1, top - 1,
+                (r, g, b, 255)
             )
             
-            # 绘制血量高光
+            # 血量高光
             highlight_height = (top - bottom - 2) * 0.4
-            arcade.draw_lrbt_rectangle_filled(
-                left, left + health_width,
+            set_rect(
+                highlight, left, left + health_width,
                 top - 1 - highlight_height, top - 1,
-                WHITE.with_alpha(60).rgba
+                self.HIGHLIGHT_COLOR
             )
+        else:
+            health.visible = False
+            highlight.visible = False
         
-        # 绘制边框
-        border_color = self.border_color
-        if bar.damage_flash > 0.1:
-            # 受伤时边框变红
-            border_color = self.damage_flash_color.with_alpha(int(150 + bar.damage_flash * 105))
-        elif bar.heal_flash > 0.1:
-            # 治疗时边框变绿
-            border_color = self.heal_flash_color.with_alpha(int(150 + bar.heal_flash * 105))
-        
-        arcade.draw_lrbt_rectangle_outline(
-            left, right, bottom, top,
-            border_color.rgba, 2 if bar.damage_flash > 0.1 else 1
-        )
+        return percent <= 0.3
     
     def _draw_damage_number(self, num: DamageNumber) -> None:
         """绘制伤害数字"""
@@ -392,7 +571,7 @@ class HealthBarSystem:
                     num.color.with_alpha(glow_alpha).rgba,
                     font_size + i * 2,
                     anchor_x="center",
-                    font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+                    font_name=FONT_NAMES,
                     bold=True
                 )
         
@@ -402,7 +581,7 @@ class HealthBarSystem:
             (0, 0, 0, alpha // 2),
             font_size,
             anchor_x="center",
-            font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+            font_name=FONT_NAMES,
             bold=num.is_crit
         )
         
@@ -412,7 +591,7 @@ class HealthBarSystem:
             color.rgba,
             font_size,
             anchor_x="center",
-            font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+            font_name=FONT_NAMES,
             bold=num.is_crit
         )
     
@@ -420,6 +599,12 @@ class HealthBarSystem:
         """清除所有血条和伤害数字"""
         self.health_bars.clear()
         self.damage_numbers.clear()
+        self._bar_sprite_list.clear()
+        self._bar_sprites.clear()
+        self._glow_sprite_list.clear()
+        self._glow_sprites.clear()
+        self._dirty_bars.clear()
+        self._pulsing_bars.clear()
     
     def get_health_bar(self, entity_id: int) -> Optional[HealthBar]:
         """获取血条"""
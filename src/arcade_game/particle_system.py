@@ -15,6 +15,7 @@ from typing import List, Tuple, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import arcade
+from PIL import Image, ImageDraw
 
 from ..core.theme_colors import (
     Color, GameColors, StatusColors, EffectColors, SECONDARY, SECONDARY_LIGHT, WHITE
@@ -34,12 +35,12 @@ class ParticleShape(Enum):
     CROSS = auto()       # 十字
 
 
-@dataclass
+@dataclass(slots=True)
 class Particle:
     """
     粒子类 - 增强版
     
-    表示单个粒子
+    表示单个粒子（使用 __slots__ 紧凑存储字段，减少内存占用并加快属性访问）
     """
     x: float
     y: float
@@ -72,6 +73,40 @@ class Particle:
         if self.end_color is not None and not isinstance(self.end_color, Color):
             self.end_color = Color(*self.end_color[:3], 255)
     
+    def reset(self, x: float, y: float, vx: float, vy: float,
+              life: float, size: float, color: Color,
+              gravity: float = 0.0,
+              shape: ParticleShape = ParticleShape.CIRCLE,
+              rotation: float = 0.0,
+              rotation_speed: float = 0.0,
+              size_curve: str = "linear",
+              end_color: Optional[Color] = None) -> None:
+        """重置粒子状态（对象池复用）"""
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.life = life
+        self.max_life = life
+        self.size = size
+        self.initial_size = size
+        self.color = color
+        self.alpha_decay = 1.0 / life if life > 0 else 0
+        self.size_decay = 0.0
+        self.gravity = gravity
+        self.shape = shape
+        self.rotation = rotation
+        self.rotation_speed = rotation_speed
+        self.size_curve = size_curve
+        self.end_color = end_color
+        self.color_lerp = 0.0
+        
+        # 确保颜色是 Color 对象
+        if not isinstance(self.color, Color):
+            self.color = Color(*self.color[:3], 255)
+        if self.end_color is not None and not isinstance(self.end_color, Color):
+            self.end_color = Color(*self.end_color[:3], 255)
+    
     @property
     def is_alive(self) -> bool:
         """检查粒子是否存活"""
@@ -84,20 +119,29 @@ class Particle:
     
     def get_current_color(self) -> Color:
         """获取当前颜色（支持渐变）"""
-        # 确保颜色是 Color 对象
-        color = self.color if isinstance(self.color, Color) else Color(*self.color[:3], 255)
+        return Color(*self.get_current_rgba())
+    
+    def get_current_rgba(self) -> Tuple[int, int, int, int]:
+        """
+        获取当前颜色的 RGBA 元组（支持渐变）
         
-        if self.end_color is None:
-            return color.with_alpha(int(255 * self.life_ratio))
+        透明度由剩余寿命比例在渲染时算出，不在每帧更新中存储，
+        直接返回元组供精灵着色，不创建 Color 对象
+        """
+        # color/end_color 在 __post_init__ 和 reset 中已保证为 Color 对象
+        color = self.color
+        life_ratio = self.life / self.max_life
+        end_color = self.end_color
         
-        end_color = self.end_color if isinstance(self.end_color, Color) else Color(*self.end_color[:3], 255)
+        if end_color is None:
+            return (color.r, color.g, color.b, int(255 * life_ratio))
         
-        t = 1.0 - self.life_ratio
+        t = 1.0 - life_ratio
         r = int(color.r + (end_color.r - color.r) * t)
         g = int(color.g + (end_color.g - color.g) * t)
         b = int(color.b + (end_color.b - color.b) * t)
-        a = int(color.a * self.life_ratio)
-        return Color(r, g, b, a)
+        a = int(color.a * life_ratio)
+        return (r, g, b, a)
     
     def update(self, dt: float) -> None:
         """更新粒子状态"""
@@ -135,223 +179,108 @@ class Particle:
                 self.size = self.initial_size * life_ratio * 2.0
 
 
+# 粒子对象池 - 所有发射器共享，避免每次特效都分配大量粒子对象
+_PARTICLE_POOL_MAX_SIZE = 2048
+_particle_pool: List[Particle] = []
+
+
+def _acquire_particle() -> Optional[Particle]:
+    """从对象池获取一个粒子（池为空时返回None）"""
+    if _particle_pool:
+        return _particle_pool.pop()
+    return None
+
+
+def _release_particle(particle: Particle) -> None:
+    """回收粒子到对象池"""
+    if len(_particle_pool) < _PARTICLE_POOL_MAX_SIZE:
+        _particle_pool.append(particle)
+
+
+def _prewarm_particle_pool(size: int) -> None:
+    """预热粒子对象池"""
+    for _ in range(size - len(_particle_pool)):
+        _particle_pool.append(Particle(
+            x=0.0, y=0.0, vx=0.0, vy=0.0,
+            life=0.0, max_life=1.0, size=0.0, color=WHITE
+        ))
+
+
 class ParticleRenderer:
     """
-    粒子渲染器 - 批量渲染优化版
+    粒子渲染器 - 精灵合批版
     
-    使用批量渲染技术提高性能
+    提供各粒子形状的白色纹理和尺寸系数，ParticleSystem 用它们把所有粒子放入同一个 SpriteList 绘制
     """
     
-    # 批量渲染缓冲区
-    _circle_batch: List[Tuple[float, float, float, Color]] = []
-    _line_batch: List[Tuple[float, float, float, float, Color, float]] = []
-    _polygon_batch: List[Tuple[List[Tuple[float, float]], Color]] = []
-    
-    @classmethod
-    def begin_batch(cls) -> None:
-        """开始批量渲染"""
-        cls._circle_batch.clear()
-        cls._line_batch.clear()
-        cls._polygon_batch.clear()
-    
-    @classmethod
-    def end_batch(cls) -> None:
-        """结束批量渲染并执行绘制"""
-        # 批量绘制圆形
-        if cls._circle_batch:
-            for x, y, radius, color in cls._circle_batch:
-                arcade.draw_circle_filled(x, y, radius, color.rgba)
-        
-        # 批量绘制线条
-        if cls._line_batch:
-            for x1, y1, x2, y2, color, width in cls._line_batch:
-                arcade.draw_line(x1, y1, x2, y2, color.rgba, width)
-        
-        # 批量绘制多边形
-        if cls._polygon_batch:
-            for points, color in cls._polygon_batch:
-                arcade.draw_polygon_filled(points, color.rgba)
+    # 精灵合批用的白色形状纹理（按类缓存，首次使用时生成）
+    _shape_textures: dict = {}
+    SHAPE_TEXTURE_SIZE = 64
+    SHAPE_SUPERSAMPLE = 4
     
-    @staticmethod
-    def draw_particle(particle: Particle) -> None:
-        """绘制粒子 - 使用批量渲染"""
-        if particle.size <= 0:
-            return
-        
-        color = particle.get_current_color()
-        shape = particle.shape
-        
-        if shape == ParticleShape.CIRCLE:
-            ParticleRenderer._batch_circle(particle, color)
-        elif shape == ParticleShape.STAR:
-            ParticleRenderer._batch_star(particle, color)
-        elif shape == ParticleShape.DIAMOND:
-            ParticleRenderer._batch_diamond(particle, color)
-        elif shape == ParticleShape.HEART:
-            ParticleRenderer._batch_heart(particle, color)
-        elif shape == ParticleShape.SQUARE:
-            ParticleRenderer._batch_square(particle, color)
-        elif shape == ParticleShape.TRIANGLE:
-            ParticleRenderer._batch_triangle(particle, color)
-        elif shape == ParticleShape.SPARK:
-            ParticleRenderer._batch_spark(particle, color)
-        elif shape == ParticleShape.RING:
-            ParticleRenderer._batch_ring(particle, color)
-        elif shape == ParticleShape.CROSS:
-            ParticleRenderer._batch_cross(particle, color)
+    # 形状 -> (纹理, 宽度/粒子大小, 高度/粒子大小, 是否随粒子旋转)
+    _SPRITE_SHAPES = {
+        ParticleShape.CIRCLE: ("circle", 2.0, 2.0, False),
+        ParticleShape.HEART: ("circle", 1.6, 1.6, False),
+        ParticleShape.SPARK: ("circle", 2.0, 2.0, False),
+        ParticleShape.RING: ("circle", 1.8, 1.8, False),
+        ParticleShape.CROSS: ("circle", 1.4, 1.4, False),
+        ParticleShape.STAR: ("star", 2.0, 2.0, True),
+        ParticleShape.DIAMOND: ("diamond", 1.4, 2.0, False),
+        ParticleShape.SQUARE: ("square", 1.4, 1.4, False),
+        ParticleShape.TRIANGLE: ("triangle", 2.0, 2.0, True),
+    }
     
     @classmethod
-    def _batch_circle(cls, particle: Particle, color: Color) -> None:
-        """批量添加圆形粒子"""
-        cls._circle_batch.append((particle.x, particle.y, particle.size, color))
-        # 简化：不再绘制高光以减少绘制调用
-    
-    @staticmethod
-    def _draw_circle(particle: Particle, color: Color) -> None:
-        """绘制圆形粒子（单独绘制模式，保留用于兼容性）"""
-        arcade.draw_circle_filled(
-            particle.x, particle.y,
-            particle.size,
-            color.rgba
-        )
-    
-    @classmethod
-    def _batch_star(cls, particle: Particle, color: Color) -> None:
-        """批量添加星形粒子"""
-        x, y = particle.x, particle.y
-        size = particle.size
-        
-        # 计算五角星顶点
-        points = []
-        for i in range(5):
-            # 外顶点
-            angle = particle.rotation + math.radians(i * 72 - 90)
-            points.append((
-                x + math.cos(angle) * size,
-                y + math.sin(angle) * size
-            ))
-            # 内顶点
-            angle = particle.rotation + math.radians(i * 72 + 36 - 90)
-            points.append((
-                x + math.cos(angle) * size * 0.4,
-                y + math.sin(angle) * size * 0.4
-            ))
-        
-        cls._polygon_batch.append((points, color))
-    
-    @staticmethod
-    def _draw_star(particle: Particle, color: Color) -> None:
-        """绘制星形粒子（单独绘制模式）"""
-        ParticleRenderer._batch_star(particle, color)
-    
-    @classmethod
-    def _batch_diamond(cls, particle: Particle, color: Color) -> None:
-        """批量添加菱形粒子"""
-        x, y = particle.x, particle.y
-        size = particle.size
-        
-        # 菱形四个顶点
-        points = [
-            (x, y + size),           # 上
-            (x + size * 0.7, y),     # 右
-            (x, y - size),           # 下
-            (x - size * 0.7, y),     # 左
-        ]
-        
-        cls._polygon_batch.append((points, color))
-    
-    @staticmethod
-    def _draw_diamond(particle: Particle, color: Color) -> None:
-        """绘制菱形粒子（单独绘制模式）"""
-        ParticleRenderer._batch_diamond(particle, color)
-    
-    @classmethod
-    def _batch_heart(cls, particle: Particle, color: Color) -> None:
-        """批量添加心形粒子（简化为圆形以提高性能）"""
-        # 简化为圆形以提高批量渲染效率
-        cls._circle_batch.append((particle.x, particle.y, particle.size * 0.8, color))
-    
-    @staticmethod
-    def _draw_heart(particle: Particle, color: Color) -> None:
-        """绘制心形粒子（单独绘制模式）"""
-        ParticleRenderer._batch_heart(particle, color)
-    
-    @classmethod
-    def _batch_square(cls, particle: Particle, color: Color) -> None:
-        """批量添加方形粒子"""
-        x, y = particle.x, particle.y
-        size = particle.size
-        half = size * 0.7
-        
-        # 方形用四个顶点表示
-        points = [
-            (x - half, y - half),
-            (x + half, y - half),
-            (x + half, y + half),
-            (x - half, y + half),
-        ]
-        cls._polygon_batch.append((points, color))
-    
-    @staticmethod
-    def _draw_square(particle: Particle, color: Color) -> None:
-        """绘制方形粒子（单独绘制模式）"""
-        ParticleRenderer._batch_square(particle, color)
-    
-    @classmethod
-    def _batch_triangle(cls, particle: Particle, color: Color) -> None:
-        """批量添加三角形粒子"""
-        x, y = particle.x, particle.y
-        size = particle.size
-        
-        # 等边三角形
-        angle = particle.rotation
-        points = []
-        for i in range(3):
-            a = angle + math.radians(i * 120 - 90)
-            points.append((
-                x + math.cos(a) * size,
-                y + math.sin(a) * size
-            ))
-        
-        cls._polygon_batch.append((points, color))
-    
-    @staticmethod
-    def _draw_triangle(particle: Particle, color: Color) -> None:
-        """绘制三角形粒子（单独绘制模式）"""
-        ParticleRenderer._batch_triangle(particle, color)
-    
-    @classmethod
-    def _batch_spark(cls, particle: Particle, color: Color) -> None:
-        """批量添加火花粒子（简化为圆形以提高性能）"""
-        # 简化为圆形以提高批量渲染效率
-        cls._circle_batch.append((particle.x, particle.y, particle.size, color))
-    
-    @staticmethod
-    def _draw_spark(particle: Particle, color: Color) -> None:
-        """绘制火花粒子（单独绘制模式）"""
-        ParticleRenderer._batch_spark(particle, color)
-    
-    @classmethod
-    def _batch_ring(cls, particle: Particle, color: Color) -> None:
-        """批量添加环形粒子（简化为圆形以提高性能）"""
-        # 简化为圆形以提高批量渲染效率
-        cls._circle_batch.append((particle.x, particle.y, particle.size * 0.9, color))
-    
-    @staticmethod
-    def _draw_ring(particle: Particle, color: Color) -> None:
-        """绘制环形粒子（单独绘制模式）"""
-        ParticleRenderer._batch_ring(particle, color)
+    def get_sprite_shape(cls, shape: ParticleShape) -> Tuple[arcade.Texture, float, float, bool]:
+        """
+        获取粒子形状对应的精灵纹理和尺寸系数
+        
+        Returns:
+            (纹理, 宽度系数, 高度系数, 是否随粒子旋转)
+        """
+        name, width, height, rotates = cls._SPRITE_SHAPES[shape]
+        return cls._get_shape_texture(name), width, height, rotates
     
     @classmethod
-    def _batch_cross(cls, particle: Particle, color: Color) -> None:
-        """批量添加十字粒子（简化为圆形以提高性能）"""
-        # 简化为圆形以提高批量渲染效率
-        cls._circle_batch.append((particle.x, particle.y, particle.size * 0.7, color))
-    
-    @staticmethod
-    def _draw_cross(particle: Particle, color: Color) -> None:
-        """绘制十字粒子（单独绘制模式）"""
-        ParticleRenderer._batch_cross(particle, color)
+    def _get_shape_texture(cls, name: str) -> arcade.Texture:
+        """
+        获取白色形状纹理（通过精灵颜色着色）
+        
+        形状填满纹理边界框，星形和三角形以外接圆为边界；超采样后缩小以获得平滑边缘
+        """
+        texture = cls._shape_textures.get(name)
+        if texture is None:
+            size = cls.SHAPE_TEXTURE_SIZE * cls.SHAPE_SUPERSAMPLE
+            half = size / 2
+            image = Image.new("RGBA", (size, size), (255, 255, 255, 0))
+            draw = ImageDraw.Draw(image)
+            fill = (255, 255, 255, 255)
+            
+            def vertex(angle_deg: float, radius: float) -> Tuple[float, float]:
+                # 图像 y 轴向下，角度按 y 轴向上的坐标系计算
+                angle = math.radians(angle_deg)
+                return half + math.cos(angle) * radius, half - math.sin(angle) * radius
+            
+            if name == "circle":
+                draw.ellipse((0, 0, size - 1, size - 1), fill=fill)
+            elif name == "star":
+                points = []
+                for i in range(5):
+                    points.append(vertex(i * 72 - 90, half))
+                    points.append(vertex(i * 72 + 36 - 90, half * 0.4))
+                draw.polygon(points, fill=fill)
+            elif name == "diamond":
+                draw.polygon([(half, 0), (size, half), (half, size), (0, half)], fill=fill)
+            elif name == "square":
+                draw.rectangle((0, 0, size - 1, size - 1), fill=fill)
+            elif name == "triangle":
+                draw.polygon([vertex(i * 120 - 90, half) for i in range(3)], fill=fill)
+            
+            image = image.resize((cls.SHAPE_TEXTURE_SIZE, cls.SHAPE_TEXTURE_SIZE), Image.LANCZOS)
+            texture = arcade.Texture(image, hash=f"particle_shape_{name}")
+            cls._shape_textures[name] = texture
+        return texture
 
 
 class ParticleEmitter:
@@ -398,61 +327,80 @@ class ParticleEmitter:
             size_curve: 大小变化曲线
             end_color: 结束颜色（用于渐变）
         """
+        # 循环中用到的模块函数和属性预先绑定为局部变量
+        uniform = random.uniform
+        radians = math.radians
+        cos = math.cos
+        sin = math.sin
+        acquire = _acquire_particle
+        emit = self.emit
+        x = self.x
+        y = self.y
+        rotation_speed_min, rotation_speed_max = rotation_speed_range
+        
         for _ in range(count):
-            angle = math.radians(random.uniform(angle_min, angle_max))
-            speed = random.uniform(speed_min, speed_max)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
+            angle = radians(uniform(angle_min, angle_max))
+            speed = uniform(speed_min, speed_max)
+            vx = cos(angle) * speed
+            vy = sin(angle) * speed
             
-            life = random.uniform(life_min, life_max)
-            size = random.uniform(size_min, size_max)
-            rotation_speed = random.uniform(rotation_speed_range[0], rotation_speed_range[1])
+            life = uniform(life_min, life_max)
+            size = uniform(size_min, size_max)
+            rotation_speed = uniform(rotation_speed_min, rotation_speed_max)
+            rotation = uniform(0, 360)
             
-            particle = Particle(
-                x=self.x,
-                y=self.y,
-                vx=vx,
-                vy=vy,
-                life=life,
-                max_life=life,
-                size=size,
-                color=color,
-                alpha_decay=1.0 / life if life > 0 else 0,
-                size_decay=0.0,
-                gravity=gravity,
-                shape=shape,
-                rotation=random.uniform(0, 360),
-                rotation_speed=rotation_speed,
-                size_curve=size_curve,
-                end_color=end_color
-            )
+            # 优先从对象池复用粒子
+            particle = acquire()
+            if particle is not None:
+                particle.reset(
+                    x, y, vx, vy, life, size, color,
+                    gravity, shape, rotation, rotation_speed,
+                    size_curve, end_color
+                )
+            else:
+                particle = Particle(
+                    x=x,
+                    y=y,
+                    vx=vx,
+                    vy=vy,
+                    life=life,
+                    max_life=life,
+                    size=size,
+                    color=color,
+                    alpha_decay=1.0 / life if life > 0 else 0,
+                    size_decay=0.0,
+                    gravity=gravity,
+                    shape=shape,
+                    rotation=rotation,
+                    rotation_speed=rotation_speed,
+                    size_curve=size_curve,
+                    end_color=end_color
+                )
             
-            self.emit(particle)
+            emit(particle)
     
     def update(self, dt: float) -> None:
         """更新所有粒子"""
+        alive = []
         for particle in self.particles:
             particle.update(dt)
+            if particle.life > 0:
+                alive.append(particle)
+            else:
+                # 死亡粒子回收到对象池
+                _release_particle(particle)
         
-        self.particles = [p for p in self.particles if p.is_alive]
+        self.particles = alive
         
         if not self.particles:
             self.is_active = False
     
-    def render(self) -> None:
-        """渲染所有粒子 - 使用批量渲染"""
-        if not self.particles:
-            return
-        
-        # 开始批量渲染
-        ParticleRenderer.begin_batch()
-        
-        # 添加所有粒子到批次
+    def release(self) -> None:
+        """回收所有粒子到对象池"""
         for particle in self.particles:
-            ParticleRenderer.draw_particle(particle)
-        
-        # 执行批量绘制
-        ParticleRenderer.end_batch()
+            _release_particle(particle)
+        self.particles = []
+        self.is_active = False
     
     def is_finished(self) -> bool:
         """检查发射器是否完成"""
@@ -466,20 +414,136 @@ class ParticleSystem:
     管理所有粒子发射器，使用Material Design配色
     """
     
+    # 对象池预热大小
+    POOL_PREWARM_SIZE = 512
+    # 空闲发射器对象池上限
+    EMITTER_POOL_MAX_SIZE = 64
+    
     def __init__(self):
         self.emitters: List[ParticleEmitter] = []
+        # 已结束的发射器回收复用，避免每次命中都分配新发射器
+        self._emitter_pool: List[ParticleEmitter] = []
+        # 粒子总数计数（添加发射器和每帧更新时维护，避免查询时遍历发射器）
+        self._particle_count = 0
+        _prewarm_particle_pool(self.POOL_PREWARM_SIZE)
+        
+        # 渲染用的精灵按槽位复用，所有粒子放入同一个 SpriteList 一次绘制（首次渲染时创建）
+        self._sprite_list: Optional[arcade.SpriteList] = None
+        self._sprites: List[arcade.Sprite] = []
+        self._visible_sprite_count = 0
+    
+    @property
+    def is_empty(self) -> bool:
+        """没有任何发射器时为True，调用方可跳过更新和渲染"""
+        return not self.emitters
     
     def update(self, dt: float) -> None:
-        """更新所有发射器"""
+        """
+        更新所有发射器
+        
+        所有发射器的粒子在一次遍历中完成积分（内联 Particle.update 的逻辑），
+        避免每个粒子一次方法调用；结束的发射器同时被移除。
+        """
+        release = _release_particle
+        active_emitters = []
+        particle_count = 0
+        
         for emitter in self.emitters:
-            emitter.update(dt)
+            alive = []
+            for p in emitter.particles:
+                p.x += p.vx * dt
+                p.y += p.vy * dt
+                p.vy -= p.gravity * dt
+                p.life -= dt
+                
+                if p.life <= 0:
+                    # 死亡粒子回收到对象池
+                    release(p)
+                    continue
+                
+                p.rotation += p.rotation_speed * dt
+                if p.size_curve != "linear" or p.size_decay > 0:
+                    p._update_size()
+                alive.append(p)
+            
+            emitter.particles = alive
+            if alive:
+                active_emitters.append(emitter)
+                particle_count += len(alive)
+            else:
+                emitter.is_active = False
+                self._release_emitter(emitter)
         
-        self.emitters = [e for e in self.emitters if not e.is_finished()]
+        self.emitters = active_emitters
+        self._particle_count = particle_count
+    
+    def _acquire_emitter(self, x: float, y: float) -> ParticleEmitter:
+        """从对象池取出发射器并重置位置，池为空时新建"""
+        pool = self._emitter_pool
+        if pool:
+            emitter = pool.pop()
+            emitter.x = x
+            emitter.y = y
+            emitter.is_active = True
+            return emitter
+        return ParticleEmitter(x, y)
+    
+    def _release_emitter(self, emitter: ParticleEmitter) -> None:
+        """回收已结束的发射器"""
+        if len(self._emitter_pool) < self.EMITTER_POOL_MAX_SIZE:
+            self._emitter_pool.append(emitter)
+    
+    def _add_emitter(self, emitter: ParticleEmitter) -> None:
+        """登记新发射器并累加其粒子数"""
+        self.emitters.append(emitter)
+        self._particle_count += len(emitter.particles)
     
     def render(self) -> None:
-        """渲染所有发射器"""
+        """
+        渲染所有发射器的粒子
+        
+        每个粒子写入一个复用的着色精灵（形状纹理 + 尺寸 + 旋转 + 颜色），
+        整个系统只提交一次 SpriteList 绘制
+        """
+        sprite_list = self._sprite_list
+        if sprite_list is None:
+            sprite_list = self._sprite_list = arcade.SpriteList(lazy=True)
+        
+        sprites = self._sprites
+        get_sprite_shape = ParticleRenderer.get_sprite_shape
+        degrees = math.degrees
+        count = 0
         for emitter in self.emitters:
-            emitter.render()
+            for p in emitter.particles:
+                size = p.size
+                if size <= 0:
+                    continue
+                
+                texture, width, height, rotates = get_sprite_shape(p.shape)
+                if count == len(sprites):
+                    sprite = arcade.Sprite(texture)
+                    sprites.append(sprite)
+                    sprite_list.append(sprite)
+                else:
+                    sprite = sprites[count]
+                    sprite.texture = texture
+                    if not sprite.visible:
+                        sprite.visible = True
+                
+                sprite.position = (p.x, p.y)
+                sprite.size = (size * width, size * height)
+                # 粒子旋转按逆时针弧度计算，精灵角度为顺时针角度
+                sprite.angle = -degrees(p.rotation) if rotates else 0.0
+                sprite.color = p.get_current_rgba()
+                count += 1
+        
+        # 隐藏本帧未使用的精灵槽位
+        for i in range(count, self._visible_sprite_count):
+            sprites[i].visible = False
+        self._visible_sprite_count = count
+        
+        if count:
+            sprite_list.draw()
     
     def create_explosion(self, x: float, y: float, 
                         color: Optional[Color] = None,
@@ -494,7 +558,7 @@ class ParticleSystem:
             count: 粒子数量
             size: 基础大小
         """
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         if color is None:
             color = EffectColors.EXPLOSION_CORE
@@ -553,14 +617,14 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_hit_effect(self, x: float, y: float,
                          color: Optional[Color] = None,
                          count: int = 12) -> ParticleEmitter:
         """创建击中效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         if color is None:
             color = SECONDARY_LIGHT
@@ -589,14 +653,14 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_collect_effect(self, x: float, y: float,
                              color: Optional[Color] = None,
                              count: int = 18) -> ParticleEmitter:
         """创建收集效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         if color is None:
             color = SECONDARY
@@ -629,14 +693,14 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_plant_effect(self, x: float, y: float,
                            color: Optional[Color] = None,
                            count: int = 15) -> ParticleEmitter:
         """创建种植效果（增强版）"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         if color is None:
             color = GameColors.PLANT_PEASHOOTER
@@ -682,13 +746,13 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_zombie_death_effect(self, x: float, y: float,
                                    count: int = 30) -> ParticleEmitter:
         """创建僵尸死亡效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         # 灰色碎片
         emitter.emit_burst(
@@ -730,14 +794,14 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_projectile_trail(self, x: float, y: float,
                                 color: Optional[Color] = None,
                                 size: float = 3.5) -> ParticleEmitter:
         """创建投射物尾迹效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         if color is None:
             color = GameColors.PEA_NORMAL
@@ -753,13 +817,13 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_sun_glow(self, x: float, y: float,
                        count: int = 10) -> ParticleEmitter:
         """创建阳光发光效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         # 黄色光晕
         emitter.emit_burst(
@@ -787,13 +851,13 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_ice_effect(self, x: float, y: float,
                          count: int = 18) -> ParticleEmitter:
         """创建寒冰效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         # 冰晶
         emitter.emit_burst(
@@ -824,13 +888,13 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_fire_effect(self, x: float, y: float,
                           count: int = 25) -> ParticleEmitter:
         """创建火焰效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         # 红色火焰核心
         emitter.emit_burst(
@@ -871,14 +935,14 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_sparkle_effect(self, x: float, y: float,
                              color: Optional[Color] = None,
                              count: int = 12) -> ParticleEmitter:
         """创建闪烁效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         if color is None:
             color = WHITE
@@ -896,12 +960,12 @@ class ParticleSystem:
             size_curve="grow_shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_cherry_bomb_explosion(self, x: float, y: float) -> ParticleEmitter:
         """创建樱桃炸弹爆炸效果（增强版）"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         # 核心爆炸
         emitter.emit_burst(
@@ -957,12 +1021,12 @@ class ParticleSystem:
             size_curve="grow"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_pea_hit(self, x: float, y: float, is_frozen: bool = False) -> ParticleEmitter:
         """创建豌豆击中效果 - 增强版"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         if is_frozen:
             # 冰豌豆击中
@@ -1016,12 +1080,12 @@ class ParticleSystem:
                 size_curve="shrink"
             )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def create_level_up_effect(self, x: float, y: float) -> ParticleEmitter:
         """创建升级效果"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._acquire_emitter(x, y)
         
         # 金色星形
         emitter.emit_burst(
@@ -1050,12 +1114,16 @@ class ParticleSystem:
             size_curve="shrink"
         )
         
-        self.emitters.append(emitter)
+        self._add_emitter(emitter)
         return emitter
     
     def clear(self) -> None:
         """清除所有发射器"""
+        for emitter in self.emitters:
+            emitter.release()
+            self._release_emitter(emitter)
         self.emitters.clear()
+        self._particle_count = 0
     
     def get_active_emitter_count(self) -> int:
         """获取活动发射器数量"""
@@ -1063,4 +1131,4 @@ class ParticleSystem:
     
     def get_total_particle_count(self) -> int:
         """获取总粒子数量"""
-        return sum(len(e.particles) for e in self.emitters)
+        return self._particle_count
@@ -13,7 +13,7 @@ import math
 from typing import Optional, Dict, List, Tuple
 import arcade
 from ..ecs import World, Entity
-from ..ecs.components import PlantType, PLANT_CONFIGS
+from ..ecs.components import PlantType, PLANT_CONFIGS, TransformComponent, HealthComponent
 from .entity_factory import EntityFactory
 from .sprite_manager import get_sprite_manager
 
@@ -73,6 +73,11 @@ class PlantCard:
         self._time = 0.0
         
         self._texture = self._load_texture()
+        
+        # 名称和阳光成本文字对象（首次渲染时创建，之后只在变化时更新）
+        self._name_text: Optional[arcade.Text] = None
+        self._cost_text: Optional[arcade.Text] = None
+        self._text_style: Optional[Tuple[bool, int, int]] = None
     
     def _load_texture(self) -> Optional[arcade.Texture]:
         """加载植物精灵图纹理"""
@@ -301,27 +306,10 @@ class PlantCard:
                     (min(255, self.color[0] + 50), min(255, self.color[1] + 50), min(255, self.color[2] + 50))
                 )
         
-        # 绘制植物名称（简化显示）
+        # 绘制植物名称（简化显示）和阳光成本
         name_y = render_y + half_height - 12 * self._scale
-        arcade.draw_text(
-            self.name[:4],
-            render_x, name_y,
-            arcade.color.WHITE if self.is_available else (150, 150, 150),
-            int(9 * self._scale),
-            anchor_x="center"
-        )
-        
-        # 绘制阳光成本
         cost_y = render_y - half_height + 12 * self._scale
-        cost_color = self.SUN_COST_COLOR if self.is_available else (100, 100, 100)
-        arcade.draw_text(
-            f"{self.cost}",
-            render_x, cost_y,
-            cost_color,
-            int(11 * self._scale),
-            anchor_x="center",
-            bold=True
-        )
+        self._render_labels(render_x, name_y, cost_y)
         
         # 绘制冷却遮罩
         if self.cooldown_timer > 0:
@@ -342,6 +330,46 @@ class PlantCard:
                     render_y - half_height - 3, render_y - half_height,
                     (100, 200, 100)
                 )
+    
+    def _render_labels(self, x: float, name_y: float, cost_y: float) -> None:
+        """
+        绘制名称和阳光成本文字
+        
+        每张卡片持有自己的文字对象，字号和颜色只在可用状态或缩放变化时更新，
+        避免 draw_text 共用的缓存标签在不同卡片之间反复重新排版
+        """
+        name_size = int(9 * self._scale)
+        cost_size = int(11 * self._scale)
+        name_color = arcade.color.WHITE if self.is_available else (150, 150, 150)
+        cost_color = self.SUN_COST_COLOR if self.is_available else (100, 100, 100)
+        
+        name_text = self._name_text
+        cost_text = self._cost_text
+        if name_text is None:
+            name_text = self._name_text = arcade.Text(
+                self.name[:4], x, name_y, name_color, name_size, anchor_x="center"
+            )
+            cost_text = self._cost_text = arcade.Text(
+                f"{self.cost}", x, cost_y, cost_color, cost_size,
+                anchor_x="center", bold=True
+            )
+            self._text_style = (self.is_available, name_size, cost_size)
+        else:
+            style = (self.is_available, name_size, cost_size)
+            if style != self._text_style:
+                self._text_style = style
+                name_text.font_size = name_size
+                name_text.color = name_color
+                cost_text.font_size = cost_size
+                cost_text.color = cost_color
+            cost_text.text = f"{self.cost}"
+            name_text.x = x
+            name_text.y = name_y
+            cost_text.x = x
+            cost_text.y = cost_y
+        
+        name_text.draw()
+        cost_text.draw()
 
 
 class PlantingSystem:
@@ -363,6 +391,16 @@ class PlantingSystem:
         self.world = world
         self.entity_factory = entity_factory
         
+        # 预计算每行/每列的格子中心坐标
+        self._cell_centers_x = tuple(
+            self.GRID_START_X + col * self.CELL_WIDTH + self.CELL_WIDTH / 2
+            for col in range(self.GRID_COLS)
+        )
+        self._cell_centers_y = tuple(
+            self.GRID_START_Y + row * self.CELL_HEIGHT + self.CELL_HEIGHT / 2
+            for row in range(self.GRID_ROWS)
+        )
+        
         # 植物卡片
         self.cards: List[PlantCard] = []
         self.selected_card: Optional[PlantCard] = None
@@ -420,23 +458,24 @@ class PlantingSystem:
         但 planted_positions 中仍然保留着对它们的引用。
         这个方法会清理这些无效的引用。
         """
+        if not self.planted_positions:
+            return
+        
+        # 每帧调用：直接取组件存储字典按ID查找，避免逐个实体走 get_component
+        transforms = self.world.query_components(TransformComponent)
+        healths = self.world.query_components(HealthComponent)
+        
         positions_to_remove = []
-        for (row, col), entity in self.planted_positions.items():
-            should_remove = False
-            
+        for pos, entity in self.planted_positions.items():
+            entity_id = entity.id
             # 检查1：实体是否还存在（通过检查其组件）
-            from ..ecs.components import TransformComponent, HealthComponent
-            transform = self.world.get_component(entity, TransformComponent)
-            if transform is None:
-                should_remove = True
+            # 检查2：实体是否已死亡（HealthComponent.is_dead）
+            if entity_id not in transforms:
+                positions_to_remove.append(pos)
             else:
-                # 检查2：实体是否已死亡（HealthComponent.is_dead）
-                health = self.world.get_component(entity, HealthComponent)
+                health = healths.get(entity_id)
                 if health and health.is_dead:
-                    should_remove = True
-            
-            if should_remove:
-                positions_to_remove.append((row, col))
+                    positions_to_remove.append(pos)
         
         # 移除无效引用
         for pos in positions_to_remove:
@@ -590,8 +629,7 @@ class PlantingSystem:
             return None
         
         # 计算网格中心位置
-        x = self.GRID_START_X + col * self.CELL_WIDTH + self.CELL_WIDTH / 2
-        y = self.GRID_START_Y + row * self.CELL_HEIGHT + self.CELL_HEIGHT / 2
+        x, y = self.cell_center(row, col)
         
         # 创建植物实体
         entity = self.entity_factory.create_plant(
@@ -618,6 +656,10 @@ class PlantingSystem:
             self.world.destroy_entity(entity)
             del self.planted_positions[(row, col)]
     
+    def cell_center(self, row: int, col: int) -> Tuple[float, float]:
+        """获取指定格子的中心坐标"""
+        return (self._cell_centers_x[col], self._cell_centers_y[row])
+    
     def get_plant_at(self, row: int, col: int) -> Optional[Entity]:
         """获取指定位置的植物"""
         return self.planted_positions.get((row, col))
@@ -714,8 +756,7 @@ class PlantingSystem:
             row, col = grid_pos
             
             # 计算网格位置
-            x = self.GRID_START_X + col * self.CELL_WIDTH + self.CELL_WIDTH / 2
-            y = self.GRID_START_Y + row * self.CELL_HEIGHT + self.CELL_HEIGHT / 2
+            x, y = self.cell_center(row, col)
             
             # 根据是否有植物选择颜色
             if (row, col) in self.planted_positions:
@@ -749,8 +790,7 @@ class PlantingSystem:
             row, col = grid_pos
             
             # 计算网格位置
-            x = self.GRID_START_X + col * self.CELL_WIDTH + self.CELL_WIDTH / 2
-            y = self.GRID_START_Y + row * self.CELL_HEIGHT + self.CELL_HEIGHT / 2
+            x, y = self.cell_center(row, col)
             
             # 根据是否可以种植选择颜色
             if (row, col) in self.planted_positions:
@@ -847,6 +887,9 @@ class PlantingSystem:
         Returns:
             创建的实体或None
         """
+        if not (0 <= row < self.GRID_ROWS and 0 <= col < self.GRID_COLS):
+            return None
+        
         try:
             pt = PlantType[plant_type]
             
@@ -11,7 +11,7 @@ from enum import Enum, auto
 import arcade
 
 from .visual_effects_optimized import OptimizedVisualEffectsSystem
-from .visual_effects import EffectType
+from .visual_effects import EffectType, VisualEffect, restore_field_defaults
 
 
 class PvzEffectType(Enum):
@@ -46,6 +46,20 @@ class PvzVisualEffect:
         """判断特效是否存活"""
         return self.life > 0
     
+    def reset(self, x: float, y: float, duration: float, **overrides) -> None:
+        """
+        重置特效状态（对象池复用）
+        
+        与 VisualEffect.reset 相同：带默认值的字段先恢复默认，再写入位置、时长和指定的字段
+        """
+        restore_field_defaults(self)
+        self.x = x
+        self.y = y
+        self.life = duration
+        self.max_life = duration
+        for name, value in overrides.items():
+            setattr(self, name, value)
+    
     def update(self, dt: float):
         """更新特效"""
         self.life = max(0, self.life - dt)
@@ -129,6 +143,12 @@ class PvzVisualEffectsSystem(OptimizedVisualEffectsSystem):
         super().__init__()
         self.pvz_effects: List[PvzVisualEffect] = []
         
+        # 每次命中都会创建的PVZ特效使用对象池复用
+        self._pvz_effect_pools: Dict[PvzEffectType, List[PvzVisualEffect]] = {
+            PvzEffectType.DAMAGE_POP: [],
+            PvzEffectType.ICE_TRAIL: [],
+        }
+        
         # 阳光闪烁效果批次
         self._sun_sparkle_batch: List[Tuple[float, float, float, Tuple[int, ...]]] = []
         # 烟雾粒子批次
@@ -136,12 +156,18 @@ class PvzVisualEffectsSystem(OptimizedVisualEffectsSystem):
         # 裂缝批次
         self._crack_batch: List[Tuple[float, float, float, float, Tuple[int, ...]]] = []
     
+    @property
+    def is_empty(self) -> bool:
+        """没有任何活动特效（含PVZ特效）时为True"""
+        return not self.effects and not self.pvz_effects
+    
     def update(self, dt: float) -> None:
         """更新所有特效"""
         # 更新原有特效
         super().update(dt)
         
-        # 更新PVZ特效
+        # 更新PVZ特效，已结束的特效移除并回收到对象池
+        alive = []
         for effect in self.pvz_effects:
             effect.update(dt)
             
@@ -150,11 +176,39 @@ class PvzVisualEffectsSystem(OptimizedVisualEffectsSystem):
                 for i, (ox, oy, vx, vy, plife) in enumerate(effect.particles):
                     new_plife = max(0, plife - dt)
                     effect.particles[i] = (ox, oy, vx, vy, new_plife)
+                if not any(p[4] > 0 for p in effect.particles):
+                    continue
+            
+            if effect.is_alive:
+                alive.append(effect)
+            else:
+                self._release_pvz_effect(effect)
         
-        # 移除已结束的PVZ特效
-        self.pvz_effects = [e for e in self.pvz_effects if e.is_alive and 
-                           (not isinstance(e, PlantingSmokeEffect) or 
-                            any(p[4] > 0 for p in e.particles))]
+        self.pvz_effects = alive
+    
+    def _acquire_pvz_effect(self, effect_type: PvzEffectType, factory: type,
+                            x: float, y: float, duration: float,
+                            **overrides) -> PvzVisualEffect:
+        """从对象池取出PVZ特效并重置，池为空时新建，然后登记为活动特效"""
+        pool = self._pvz_effect_pools[effect_type]
+        if pool:
+            effect = pool.pop()
+            effect.reset(x, y, duration, **overrides)
+        else:
+            effect = factory(
+                x=x, y=y,
+                effect_type=effect_type,
+                life=duration, max_life=duration,
+                **overrides
+            )
+        self.pvz_effects.append(effect)
+        return effect
+    
+    def _release_pvz_effect(self, effect: PvzVisualEffect) -> None:
+        """回收可复用的PVZ特效对象"""
+        pool = self._pvz_effect_pools.get(effect.effect_type)
+        if pool is not None and len(pool) < self.EFFECT_POOL_MAX_SIZE:
+            pool.append(effect)
     
     def render(self) -> None:
         """渲染所有特效"""
@@ -377,14 +431,10 @@ class PvzVisualEffectsSystem(OptimizedVisualEffectsSystem):
                         color: Tuple[int, int, int] = (135, 206, 250),
                         duration: float = 0.6) -> IceTrailEffect:
         """创建冰霜轨迹效果"""
-        effect = IceTrailEffect(
-            x=x, y=y,
-            effect_type=PvzEffectType.ICE_TRAIL,
-            life=duration, max_life=duration,
+        return self._acquire_pvz_effect(
+            PvzEffectType.ICE_TRAIL, IceTrailEffect, x, y, duration,
             radius=radius, color=color
         )
-        self.pvz_effects.append(effect)
-        return effect
     
     def create_freeze_crack(self, x: float, y: float,
                            radius: float = 20.0,
@@ -445,14 +495,10 @@ class PvzVisualEffectsSystem(OptimizedVisualEffectsSystem):
                          color: Tuple[int, int, int] = (255, 255, 255),
                          duration: float = 1.0) -> DamagePopEffect:
         """创建伤害弹出效果"""
-        effect = DamagePopEffect(
-            x=x, y=y,
-            effect_type=PvzEffectType.DAMAGE_POP,
-            life=duration, max_life=duration,
+        return self._acquire_pvz_effect(
+            PvzEffectType.DAMAGE_POP, DamagePopEffect, x, y, duration,
             damage=damage, color=color
         )
-        self.pvz_effects.append(effect)
-        return effect
     
     def create_cherry_bomb_visual(self, x: float, y: float) -> List[PvzVisualEffect]:
         """创建完整的樱桃炸弹视觉效果组合"""
@@ -469,7 +515,29 @@ class PvzVisualEffectsSystem(OptimizedVisualEffectsSystem):
         effects.append(self.create_flash(x, y, radius=60, color=(200, 150, 100), duration=0.3))
         return effects
     
+    def create_explosion_visual(self, x: float, y: float, radius: float) -> List[VisualEffect]:
+        """创建通用爆炸视觉效果组合"""
+        effects = []
+        effects.append(self.create_explosion(x, y, max_radius=radius, color=(255, 150, 50)))
+        effects.append(self.create_shockwave(x, y, max_radius=radius * 1.5))
+        return effects
+    
+    def create_hit_visual(self, x: float, y: float, damage: int) -> None:
+        """创建普通命中视觉效果组合（每次命中调用，不构建返回列表）"""
+        self.create_hit_spark(x, y)
+        self.create_ripple(x, y, max_radius=30, color=(255, 200, 100))
+        self.create_damage_pop(x, y, damage, color=(255, 255, 255), duration=1.0)
+    
+    def create_frost_hit_visual(self, x: float, y: float) -> None:
+        """创建冰冻命中视觉效果组合（每次命中调用，不构建返回列表）"""
+        self.create_frost(x, y, radius=40, duration=0.4)
+        self.create_hit_spark(x, y, length=15, color=(150, 200, 255))
+        self.create_ice_trail(x, y, radius=35, duration=0.5)
+    
     def clear(self) -> None:
         """清除所有特效"""
+        super().clear()
+        for effect in self.pvz_effects:
+            self._release_pvz_effect(effect)
         self.pvz_effects.clear()
         self.effects.clear()
\ No newline at end of file
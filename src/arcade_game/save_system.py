@@ -126,13 +126,18 @@ class SaveSystem:
             # 更新存档时间
             data.save_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            # 转换为字典
-            save_dict = asdict(data)
+            # 浅拷贝为字典：植物/僵尸列表本身已是可直接序列化的数据，
+            # 无需 asdict 逐个实体递归深拷贝
+            save_dict = dict(vars(data))
+            
+            # 一次性紧凑编码（json.dumps 无缩进时走 C 编码器，
+            # json.dump 或带缩进时会退回逐段的纯 Python 编码）
+            payload = json.dumps(save_dict, ensure_ascii=False, separators=(',', ':'))
             
             # 保存到文件
             save_path = self._get_save_path(slot)
             with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_dict, f, ensure_ascii=False, indent=2)
+                f.write(payload)
             
             logger.info(f"游戏已保存到槽位 {slot}")
             return True
@@ -47,9 +47,9 @@ class ScreenShake:
             progress = self.shake_timer / self.shake_duration
             current_intensity = self.shake_intensity * progress
             
-            # 随机偏移
-            self.offset_x = random.uniform(-current_intensity, current_intensity)
-            self.offset_y = random.uniform(-current_intensity, current_intensity)
+            # 随机偏移（取整到像素，避免亚像素抖动导致无意义的重绘状态变化）
+            self.offset_x = float(round(random.uniform(-current_intensity, current_intensity)))
+            self.offset_y = float(round(random.uniform(-current_intensity, current_intensity)))
             
             # 震动结束
             if self.shake_timer <= 0:
@@ -10,13 +10,16 @@
 
 import random
 import math
-from typing import List, Optional, Callable, Tuple
+from typing import Dict, List, Optional, Callable, Tuple
 import arcade
+import pyglet
+from PIL import Image, ImageDraw
 from ..ecs import World, Entity
 from ..ecs.components import (
     TransformComponent, SunProducerComponent, VelocityComponent,
     SpriteComponent
 )
+from ..core.spatial_hash import SpatialHash, AABB
 from .entity_factory import EntityFactory
 
 
@@ -72,6 +75,13 @@ class SunCollectionSystem:
     SUN_GLOW_COLOR = (255, 220, 100)
     SUN_INNER_COLOR = (255, 240, 150)
     
+    # 点击检测空间哈希单元大小
+    HIT_CELL_SIZE = 100.0
+    
+    # 阳光主体（本体、内圈、高光、边框）预渲染纹理，所有实例共享
+    _body_texture: Optional[arcade.Texture] = None
+    BODY_SUPERSAMPLE = 4
+    
     def __init__(self, world: World, entity_factory: EntityFactory):
         self.world = world
         self.entity_factory = entity_factory
@@ -89,6 +99,15 @@ class SunCollectionSystem:
         # 阳光视觉效果
         self._sun_effects: dict = {}  # sun_id -> SunVisualEffect
         self._global_time = 0.0
+        
+        # 点击检测用空间哈希，每帧更新阳光时重建
+        self._hit_hash = SpatialHash(cell_size=self.HIT_CELL_SIZE)
+        
+        # 阳光主体精灵与数值文字批量渲染（首次渲染时创建，需要 OpenGL 上下文）
+        self._sun_sprite_list: Optional[arcade.SpriteList] = None
+        self._sun_sprites: Dict[int, arcade.Sprite] = {}
+        self._label_batch: Optional[pyglet.graphics.Batch] = None
+        self._sun_labels: Dict[int, arcade.Text] = {}
     
     def set_difficulty_config(self, auto_spawn_interval: float, sun_value: int) -> None:
         """
@@ -148,9 +167,15 @@ class SunCollectionSystem:
         
         # 创建视觉效果
         self._sun_effects[sun.id] = SunVisualEffect()
+        self._insert_hit_box(sun.id, x, y)
         
         return sun
     
+    def _insert_hit_box(self, sun_id: int, x: float, y: float) -> None:
+        """将阳光的点击范围加入空间哈希"""
+        size = self.SUN_SIZE
+        self._hit_hash.insert(sun_id, AABB(x - size / 2, y - size / 2, size, size))
+    
     def _update_sun_effects(self, dt: float) -> None:
         """更新阳光视觉效果"""
         sun_ids = self.world.query_entities(TransformComponent, SunProducerComponent)
@@ -177,9 +202,10 @@ class SunCollectionSystem:
             self._sun_effects[sun_id].update(dt, transform.x, transform.y)
     
     def _update_suns(self, dt: float) -> None:
-        """更新所有阳光的状态"""
+        """更新所有阳光的状态，并重建点击检测空间哈希"""
         # 获取所有阳光实体ID
         sun_ids = self.world.query_entities(TransformComponent, SunProducerComponent)
+        self._hit_hash.clear()
         
         for sun_id in sun_ids:
             sun_entity = self.world.get_entity(sun_id)
@@ -187,13 +213,17 @@ class SunCollectionSystem:
                 continue
                 
             sun_producer = self.world.get_component(sun_entity, SunProducerComponent)
+            transform = self.world.get_component(sun_entity, TransformComponent)
+            if not transform:
+                continue
+            
+            self._insert_hit_box(sun_id, transform.x, transform.y)
             
             # 只处理非自动产生的阳光（天空掉落的）
             if not sun_producer.is_auto:
-                transform = self.world.get_component(sun_entity, TransformComponent)
                 velocity = self.world.get_component(sun_entity, VelocityComponent)
                 
-                if transform and velocity:
+                if velocity:
                     # 检查是否落地
                     if transform.y <= self.GRID_START_Y + 20:
                         # 停止下落
@@ -215,8 +245,8 @@ class SunCollectionSystem:
         Returns:
             是否收集到了阳光
         """
-        # 获取所有可收集的阳光ID
-        sun_ids = self.world.query_entities(TransformComponent, SunProducerComponent)
+        # 只检查点击所在网格单元中的阳光
+        sun_ids = self._hit_hash.query_point(x, y)
         
         for sun_id in sun_ids:
             sun_entity = self.world.get_entity(sun_id)
@@ -226,7 +256,7 @@ class SunCollectionSystem:
             sun_producer = self.world.get_component(sun_entity, SunProducerComponent)
             
             # 检查是否可以收集
-            if not sun_producer.is_collectable:
+            if not sun_producer or not sun_producer.is_collectable:
                 continue
             
             transform = self.world.get_component(sun_entity, TransformComponent)
@@ -283,6 +313,7 @@ class SunCollectionSystem:
             callback(value, x, y)
         
         # 销毁阳光实体
+        self._hit_hash.remove(sun_id)
         if sun_entity:
             self.world.destroy_entity(sun_entity)
     
@@ -316,72 +347,139 @@ class SunCollectionSystem:
         
         # 创建视觉效果
         self._sun_effects[sun.id] = SunVisualEffect()
+        self._insert_hit_box(sun.id, x, y)
         
         return sun
     
     def render_suns(self) -> None:
-        """渲染所有阳光（带增强视觉效果）"""
-        sun_ids = self.world.query_entities(TransformComponent, SunProducerComponent)
+        """
+        渲染所有阳光（带增强视觉效果）
+        
+        拖尾、外发光与光芒随脉动变化，仍逐个绘制；
+        静态的主体与数值文字分别合批到 SpriteList 和 Text 批次中一次绘制
+        """
+        transforms = self.world.query_components(TransformComponent)
+        sun_ids = [sun_id for sun_id in self.world.query_components(SunProducerComponent)
+                   if sun_id in transforms]
+        self._sync_sun_batches(sun_ids, transforms)
+        
+        base_size = self.SUN_SIZE / 2
+        glow_color = self.SUN_GLOW_COLOR
+        sun_effects = self._sun_effects
         
         for sun_id in sun_ids:
-            sun_entity = self.world.get_entity(sun_id)
-            if not sun_entity:
-                continue
-                
-            transform = self.world.get_component(sun_entity, TransformComponent)
-            if not transform:
-                continue
+            transform = transforms[sun_id]
             
             # 获取视觉效果
-            effect = self._sun_effects.get(sun_id)
+            effect = sun_effects.get(sun_id)
             pulse = effect.pulse_phase if effect else 0.5
             
             x, y = transform.x, transform.y
-            base_size = self.SUN_SIZE / 2
             
             # 绘制拖尾效果
             if effect and effect.trail_positions:
-                for i, (tx, ty, alpha) in enumerate(effect.trail_positions[:-1]):
+                for tx, ty, alpha in effect.trail_positions[:-1]:
                     trail_alpha = int(alpha * 100)
                     trail_size = base_size * (0.3 + 0.3 * alpha)
                     if trail_alpha > 0:
                         arcade.draw_circle_filled(
                             tx, ty, trail_size,
-                            (*self.SUN_GLOW_COLOR, trail_alpha)
+                            (*glow_color, trail_alpha)
                         )
             
             # 绘制外发光
             glow_size = base_size * (1.5 + pulse * 0.3)
             glow_alpha = int(80 + pulse * 40)
-            arcade.draw_circle_filled(x, y, glow_size, (*self.SUN_GLOW_COLOR, glow_alpha))
+            arcade.draw_circle_filled(x, y, glow_size, (*glow_color, glow_alpha))
             
             # 绘制光芒
             self._draw_sun_rays(x, y, base_size, pulse)
+        
+        # 主体与阳光值各一次绘制
+        if self._sun_sprite_list is not None:
+            self._sun_sprite_list.draw()
+        if self._label_batch is not None:
+            self._label_batch.draw()
+    
+    def _sync_sun_batches(self, sun_ids: List[int], transforms: dict) -> None:
+        """同步阳光主体精灵与数值文字：增删实体、更新位置和数值"""
+        if self._sun_sprite_list is None:
+            self._sun_sprite_list = arcade.SpriteList(lazy=True)
+            self._label_batch = pyglet.graphics.Batch()
+        
+        sprites = self._sun_sprites
+        labels = self._sun_labels
+        
+        # 移除已消失的阳光
+        if len(sprites) != len(sun_ids) or any(sun_id not in sprites for sun_id in sun_ids):
+            alive = set(sun_ids)
+            for sun_id in [sun_id for sun_id in sprites if sun_id not in alive]:
+                sprites.pop(sun_id).remove_from_sprite_lists()
+                labels.pop(sun_id).label.delete()
+        
+        value_text = f"{self.sun_value}"
+        texture = self._get_body_texture()
+        for sun_id in sun_ids:
+            transform = transforms[sun_id]
+            x, y = transform.x, transform.y
+            sprite = sprites.get(sun_id)
+            if sprite is None:
+                sprite = arcade.Sprite(texture, center_x=x, center_y=y)
+                sprites[sun_id] = sprite
+                self._sun_sprite_list.append(sprite)
+                labels[sun_id] = arcade.Text(
+                    value_text, x, y - 2,
+                    (200, 150, 0), 10,
+                    anchor_x="center",
+                    anchor_y="center",
+                    bold=True,
+                    batch=self._label_batch
+                )
+                continue
             
-            # 绘制主体
-            arcade.draw_circle_filled(x, y, base_size, self.SUN_COLOR)
-            
-            # 绘制内部渐变
-            inner_size = base_size * 0.7
-            arcade.draw_circle_filled(x, y, inner_size, self.SUN_INNER_COLOR)
-            
-            # 绘制中心高光
-            highlight_size = base_size * 0.3
-            arcade.draw_circle_filled(x - base_size * 0.2, y + base_size * 0.2, 
-                                     highlight_size, (255, 255, 255, 200))
+            label = labels[sun_id]
+            if sprite.center_x != x or sprite.center_y != y:
+                sprite.position = (x, y)
+                label.position = (x, y - 2, 0)
+            if label.text != value_text:
+                label.text = value_text
+    
+    @classmethod
+    def _get_body_texture(cls) -> arcade.Texture:
+        """
+        获取阳光主体纹理
+        
+        与原逐个绘制一致：本体、内圈、左上高光（预混合到内圈颜色上）与 2 像素边框，
+        超采样后缩小以获得平滑边缘
+        """
+        texture = cls._body_texture
+        if texture is None:
+            radius = cls.SUN_SIZE / 2
+            half = int(radius) + 2
+            ss = cls.BODY_SUPERSAMPLE
+            size = half * 2 * ss
+            center = size / 2
+            image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(image)
             
-            # 绘制边框
-            arcade.draw_circle_outline(x, y, base_size, (255, 180, 0), 2)
+            def circle(cx: float, cy: float, r: float, **kwargs) -> None:
+                draw.ellipse((cx - r, cy - r, cx + r, cy + r), **kwargs)
             
-            # 绘制阳光值
-            arcade.draw_text(
-                f"{self.sun_value}",
-                x, y - 2,
-                (200, 150, 0), 10,
-                anchor_x="center",
-                anchor_y="center",
-                bold=True
+            # 边框向内占 2 像素，先画外缘再画本体
+            circle(center, center, radius * ss, fill=(255, 180, 0, 255))
+            circle(center, center, (radius - 2) * ss, fill=(*cls.SUN_COLOR, 255))
+            circle(center, center, radius * 0.7 * ss, fill=(*cls.SUN_INNER_COLOR, 255))
+            # 高光：白色 alpha 200 叠加在内圈颜色上（图像 y 轴向下）
+            highlight = tuple(
+                round(c + (255 - c) * 200 / 255) for c in cls.SUN_INNER_COLOR
             )
+            circle(center - radius * 0.2 * ss, center - radius * 0.2 * ss,
+                   radius * 0.3 * ss, fill=(*highlight, 255))
+            
+            image = image.resize((half * 2, half * 2), Image.LANCZOS)
+            texture = arcade.Texture(image, hash=f"sun_body_{cls.SUN_SIZE}")
+            cls._body_texture = texture
+        return texture
     
     def _draw_sun_rays(self, x: float, y: float, base_size: float, pulse: float) -> None:
         """绘制阳光光芒"""
@@ -415,6 +513,15 @@ class SunCollectionSystem:
         
         # 清除视觉效果
         self._sun_effects.clear()
+        self._hit_hash.clear()
+        
+        # 清除主体精灵和数值文字
+        for sprite in self._sun_sprites.values():
+            sprite.remove_from_sprite_lists()
+        for label in self._sun_labels.values():
+            label.label.delete()
+        self._sun_sprites.clear()
+        self._sun_labels.clear()
     
     def get_sun_count(self) -> int:
         """获取当前阳光数量（可收集的）"""
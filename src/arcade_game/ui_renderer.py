@@ -19,7 +19,8 @@ import arcade
 from .sprite_manager import get_sprite_manager
 from ..core.theme_colors import (
     Color, GameColors, StatusColors, UIColors, EffectColors,
-    PRIMARY, PRIMARY_DARK, SECONDARY, SECONDARY_LIGHT, SECONDARY_DARK, ACCENT, WHITE, BLACK
+    PRIMARY, PRIMARY_DARK, SECONDARY, SECONDARY_LIGHT, SECONDARY_DARK, ACCENT, WHITE, BLACK,
+    FONT_NAMES
 )
 
 
@@ -193,30 +194,42 @@ class UIRenderer:
         self._sun_text = arcade.Text(
             "0", 0, 0,
             GameColors.SUN_TEXT.rgba, 22,
-            font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+            font_name=FONT_NAMES,
             bold=True
         )
         
-        # 波次文字
+        # 波次文字（阴影 + 主文字）
+        self._wave_shadow_text = arcade.Text(
+            "", 0, 0,
+            (0, 0, 0, 150), 20,
+            font_name=FONT_NAMES
+        )
         self._wave_text = arcade.Text(
             "", 0, 0,
             StatusColors.WAVE_NORMAL.rgba, 20,
-            font_name=("Arial", "Microsoft YaHei", "sans-serif")
+            font_name=FONT_NAMES
         )
+        self._wave_text_bold = False
         
-        # 分数文字
+        # 分数文字（阴影 + 主文字）
+        self._score_shadow_text = arcade.Text(
+            "", 0, 0,
+            (0, 0, 0, 150), 18,
+            font_name=FONT_NAMES
+        )
         self._score_text = arcade.Text(
             "", 0, 0,
             WHITE.rgba, 18,
-            font_name=("Arial", "Microsoft YaHei", "sans-serif")
+            font_name=FONT_NAMES
         )
+        self._last_display_score: Optional[int] = None
         
         # 游戏结束文字
         self._game_over_title = arcade.Text(
             "", 0, 0,
             SECONDARY.rgba, 48,
             anchor_x="center",
-            font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+            font_name=FONT_NAMES,
             bold=True
         )
         
@@ -224,7 +237,7 @@ class UIRenderer:
             "", 0, 0,
             WHITE.rgba, 20,
             anchor_x="center",
-            font_name=("Arial", "Microsoft YaHei", "sans-serif")
+            font_name=FONT_NAMES
         )
     
     def set_sun_count(self, count: int) -> None:
@@ -260,18 +273,14 @@ class UIRenderer:
         """设置分数"""
         self.score_display.set_target(float(score))
     
-    def render(self, sun_count: int = 0, score: int = 0, current_level: int = 1) -> None:
+    def render(self, current_level: int = 1) -> None:
         """渲染所有UI
         
+        阳光、分数和波次由调用方通过 set_* 方法在数值变化时推送，这里只负责绘制
+        
         Args:
-            sun_count: 当前阳光数量
-            score: 当前分数
             current_level: 当前关卡
         """
-        # 更新状态
-        self.set_sun_count(sun_count)
-        self.set_score(score)
-        
         self._render_sun_counter()
         self._render_wave_indicator()
         self._render_score()
@@ -364,7 +373,9 @@ class UIRenderer:
         
         # 使用缓存的Text对象（性能优化）
         self._sun_text.text = str(display_count)
-        self._sun_text.font_size = int(22 * scale)
+        font_size = int(22 * scale)
+        if self._sun_text.font_size != font_size:
+            self._sun_text.font_size = font_size
         self._sun_text.x = bg_x + 10
         self._sun_text.y = text_y
         
@@ -447,24 +458,26 @@ class UIRenderer:
             border_color, border_width
         )
         
-        # 绘制波次文字
+        # 绘制波次文字（使用缓存的Text对象，文本不变时不重新排版）
         wave_text = f"波次: {state.current_wave}/{state.total_waves}"
+        self._wave_shadow_text.text = wave_text
+        self._wave_text.text = wave_text
+        self._wave_shadow_text.x = base_x + 2
+        self._wave_shadow_text.y = base_y + 2
+        self._wave_text.x = base_x
+        self._wave_text.y = base_y
+        self._wave_text.color = color
+        
+        if self._wave_text_bold != state.warning_active:
+            self._wave_text_bold = state.warning_active
+            self._wave_shadow_text.bold = state.warning_active
+            self._wave_text.bold = state.warning_active
         
         # 文字阴影
-        arcade.draw_text(
-            wave_text, base_x + 2, base_y + 2,
-            (0, 0, 0, 150), 20,
-            font_name=("Arial", "Microsoft YaHei", "sans-serif"),
-            bold=state.warning_active
-        )
+        self._wave_shadow_text.draw()
         
         # 主文字
-        arcade.draw_text(
-            wave_text, base_x, base_y,
-            color, 20,
-            font_name=("Arial", "Microsoft YaHei", "sans-serif"),
-            bold=state.warning_active
-        )
+        self._wave_text.draw()
         
         # 绘制进度条 - 增强版
         progress_width = 170
@@ -554,22 +567,23 @@ class UIRenderer:
         # 绘制星星图标
         self._draw_star(base_x + 15, base_y + 12, 12, SECONDARY.rgba)
         
-        # 分数文字阴影
+        # 分数变化时才更新文字内容
         display_score = int(self.score_display.current)
-        arcade.draw_text(
-            f"分数: {display_score}",
-            base_x + 37, base_y + 2,
-            (0, 0, 0, 150), 18,
-            font_name=("Arial", "Microsoft YaHei", "sans-serif")
-        )
+        if display_score != self._last_display_score:
+            self._last_display_score = display_score
+            score_text = f"分数: {display_score}"
+            self._score_shadow_text.text = score_text
+            self._score_text.text = score_text
+        
+        # 分数文字阴影
+        self._score_shadow_text.x = base_x + 37
+        self._score_shadow_text.y = base_y + 2
+        self._score_shadow_text.draw()
         
         # 分数文字
-        arcade.draw_text(
-            f"分数: {display_score}",
-            base_x + 35, base_y,
-            WHITE.rgba, 18,
-            font_name=("Arial", "Microsoft YaHei", "sans-serif")
-        )
+        self._score_text.x = base_x + 35
+        self._score_text.y = base_y
+        self._score_text.draw()
     
     def _draw_star(self, x: float, y: float, size: float, color: Tuple[int, ...]) -> None:
         """绘制星星"""
@@ -604,7 +618,7 @@ class UIRenderer:
                     text.text, text.x, text.y,
                     (text.color[0], text.color[1], text.color[2], glow_alpha),
                     int(16 * text.scale * 1.2),
-                    font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+                    font_name=FONT_NAMES,
                     bold=True
                 )
             
@@ -613,7 +627,7 @@ class UIRenderer:
                 text.text, text.x + 2, text.y - 2,
                 (0, 0, 0, alpha // 2),
                 int(16 * text.scale),
-                font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+                font_name=FONT_NAMES,
                 bold=True
             )
             
@@ -622,7 +636,7 @@ class UIRenderer:
                 text.text, text.x, text.y,
                 color,
                 int(16 * text.scale),
-                font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+                font_name=FONT_NAMES,
                 bold=True
             )
     
@@ -800,7 +814,7 @@ class PlantCardRenderer:
             card_x + 18, cost_y,
             cost_color.rgba,
             int(11 * scale),
-            font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+            font_name=FONT_NAMES,
             bold=True
         )
         
@@ -966,7 +980,7 @@ class GameOverRenderer:
                 title_color.with_alpha(glow_alpha).rgba,
                 int(48 + i * 4),
                 anchor_x="center",
-                font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+                font_name=FONT_NAMES,
                 bold=True
             )
         
@@ -978,7 +992,7 @@ class GameOverRenderer:
             title_color.rgba,
             int(48 * title_scale),
             anchor_x="center",
-            font_name=("Arial", "Microsoft YaHei", "sans-serif"),
+            font_name=FONT_NAMES,
             bold=True
         )
         
@@ -991,7 +1005,7 @@ class GameOverRenderer:
             center_x, info_y,
             WHITE.rgba, 24,
             anchor_x="center",
-            font_name=("Arial", "Microsoft YaHei", "sans-serif")
+            font_name=FONT_NAMES
         )
         
         # 波次
@@ -1000,7 +1014,7 @@ class GameOverRenderer:
             center_x, info_y - 40,
             WHITE.rgba, 20,
             anchor_x="center",
-            font_name=("Arial", "Microsoft YaHei", "sans-serif")
+            font_name=FONT_NAMES
         )
         
         # 提示文字 - 闪烁效果
@@ -1013,7 +1027,7 @@ class GameOverRenderer:
             WHITE.with_alpha(hint_alpha).rgba,
             20,
             anchor_x="center",
-            font_name=("Arial", "Microsoft YaHei", "sans-serif")
+            font_name=FONT_NAMES
         )
         
         # 装饰性粒子效果
@@ -11,11 +11,20 @@
 
 import math
 from typing import List, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, MISSING
 from enum import Enum, auto
 import arcade
 
 
+def restore_field_defaults(effect) -> None:
+    """把特效数据类中所有带默认值的字段恢复为默认值（对象池复用时调用）"""
+    for f in fields(effect):
+        if f.default is not MISSING:
+            setattr(effect, f.name, f.default)
+        elif f.default_factory is not MISSING:
+            setattr(effect, f.name, f.default_factory())
+
+
 class EffectType(Enum):
     """特效类型"""
     FLASH = auto()        # 闪光
@@ -39,6 +48,21 @@ class VisualEffect:
     max_life: float
     is_alive: bool = True
     
+    def reset(self, x: float, y: float, duration: float, **overrides) -> None:
+        """
+        重置特效状态（对象池复用）
+        
+        所有带默认值的字段恢复为默认值，再写入位置、时长和指定的字段，
+        子类新增字段时无需同步修改
+        """
+        restore_field_defaults(self)
+        self.x = x
+        self.y = y
+        self.life = duration
+        self.max_life = duration
+        for name, value in overrides.items():
+            setattr(self, name, value)
+    
     def update(self, dt: float) -> None:
         """更新特效"""
         self.life -= dt
@@ -28,21 +28,56 @@ class OptimizedVisualEffectsSystem:
     使用批量渲染技术提高性能
     """
     
+    # 高频特效对象池上限
+    EFFECT_POOL_MAX_SIZE = 128
+    
     def __init__(self):
         self.effects: List[VisualEffect] = []
         
+        # 每次命中或爆炸都会创建的特效使用对象池复用
+        self._effect_pools: Dict[EffectType, List[VisualEffect]] = {
+            EffectType.HIT_SPARK: [],
+            EffectType.RIPPLE: [],
+            EffectType.FROST: [],
+            EffectType.FLASH: [],
+            EffectType.EXPLOSION: [],
+            EffectType.SHOCKWAVE: [],
+        }
+        
         # 批量渲染缓冲区
         self._circle_filled_batch: List[Tuple[float, float, float, Tuple[int, ...]]] = []
         self._circle_outline_batch: List[Tuple[float, float, float, Tuple[int, ...], float]] = []
         self._line_batch: List[Tuple[float, float, float, float, Tuple[int, ...], float]] = []
     
+    @property
+    def is_empty(self) -> bool:
+        """没有任何活动特效时为True，调用方可跳过更新和渲染"""
+        return not self.effects
+    
     def update(self, dt: float) -> None:
         """更新所有特效"""
+        alive = []
         for effect in self.effects:
             effect.update(dt)
+            if effect.is_alive:
+                alive.append(effect)
+            else:
+                # 已结束的特效回收到对象池
+                self._release_effect(effect)
         
-        # 移除已结束的特效
-        self.effects = [e for e in self.effects if e.is_alive]
+        self.effects = alive
+    
+    def _release_effect(self, effect: VisualEffect) -> None:
+        """回收可复用的特效对象"""
+        pool = self._effect_pools.get(effect.effect_type)
+        if pool is not None and len(pool) < self.EFFECT_POOL_MAX_SIZE:
+            pool.append(effect)
+    
+    def clear(self) -> None:
+        """清除所有特效"""
+        for effect in self.effects:
+            self._release_effect(effect)
+        self.effects.clear()
     
     def render(self) -> None:
         """渲染所有特效 - 使用批量渲染"""
@@ -231,75 +266,73 @@ class OptimizedVisualEffectsSystem:
     
     # === 工厂方法（继承自原系统）===
     
+    def _acquire_effect(self, effect_type: EffectType, factory: type,
+                        x: float, y: float, duration: float,
+                        **overrides) -> VisualEffect:
+        """从对象池取出特效并重置，池为空时新建，然后登记为活动特效"""
+        pool = self._effect_pools[effect_type]
+        if pool:
+            effect = pool.pop()
+            effect.reset(x, y, duration, **overrides)
+        else:
+            effect = factory(
+                x=x, y=y,
+                effect_type=effect_type,
+                life=duration, max_life=duration,
+                **overrides
+            )
+        self.effects.append(effect)
+        return effect
+    
     def create_flash(self, x: float, y: float, 
                     radius: float = 50.0,
                     color: Tuple[int, int, int] = (255, 255, 255),
                     duration: float = 0.2,
                     intensity: float = 1.0) -> FlashEffect:
         """创建闪光效果"""
-        effect = FlashEffect(
-            x=x, y=y,
-            effect_type=EffectType.FLASH,
-            life=duration, max_life=duration,
+        return self._acquire_effect(
+            EffectType.FLASH, FlashEffect, x, y, duration,
             radius=radius, color=color, intensity=intensity
         )
-        self.effects.append(effect)
-        return effect
     
     def create_ripple(self, x: float, y: float,
                      max_radius: float = 100.0,
                      color: Tuple[int, int, int] = (255, 255, 255),
                      duration: float = 0.5) -> RippleEffect:
         """创建波纹效果"""
-        effect = RippleEffect(
-            x=x, y=y,
-            effect_type=EffectType.RIPPLE,
-            life=duration, max_life=duration,
+        return self._acquire_effect(
+            EffectType.RIPPLE, RippleEffect, x, y, duration,
             max_radius=max_radius, color=color
         )
-        self.effects.append(effect)
-        return effect
     
     def create_explosion(self, x: float, y: float,
                         max_radius: float = 150.0,
                         color: Tuple[int, int, int] = (255, 150, 50),
                         duration: float = 0.6) -> ExplosionEffect:
         """创建爆炸效果"""
-        effect = ExplosionEffect(
-            x=x, y=y,
-            effect_type=EffectType.EXPLOSION,
-            life=duration, max_life=duration,
+        return self._acquire_effect(
+            EffectType.EXPLOSION, ExplosionEffect, x, y, duration,
             max_radius=max_radius, color=color
         )
-        self.effects.append(effect)
-        return effect
     
     def create_frost(self, x: float, y: float,
                     radius: float = 60.0,
                     duration: float = 0.8) -> FrostEffect:
         """创建冰霜效果"""
-        effect = FrostEffect(
-            x=x, y=y,
-            effect_type=EffectType.FROST,
-            life=duration, max_life=duration,
+        return self._acquire_effect(
+            EffectType.FROST, FrostEffect, x, y, duration,
             radius=radius
         )
-        self.effects.append(effect)
-        return effect
     
     def create_shockwave(self, x: float, y: float,
                         max_radius: float = 200.0,
                         color: Tuple[int, int, int] = (255, 200, 100),
                         duration: float = 0.5) -> ShockwaveEffect:
         """创建冲击波效果"""
-        effect = ShockwaveEffect(
-            x=x, y=y,
-            effect_type=EffectType.SHOCKWAVE,
-            life=duration, max_life=duration,
+        return self._acquire_effect(
+            EffectType.SHOCKWAVE, ShockwaveEffect, x, y, duration,
             max_radius=max_radius, color=color
         )
-        self.effects.append(effect)
-        return effect
     
     def create_hit_spark(self, x: float, y: float,
                         spark_count: int = 6,
@@ -307,14 +340,10 @@ class OptimizedVisualEffectsSystem:
                         color: Tuple[int, int, int] = (255, 255, 100),
                         duration: float = 0.3) -> HitSparkEffect:
         """创建击中火花效果"""
-        effect = HitSparkEffect(
-            x=x, y=y,
-            effect_type=EffectType.HIT_SPARK,
-            life=duration, max_life=duration,
+        return self._acquire_effect(
+            EffectType.HIT_SPARK, HitSparkEffect, x, y, duration,
             spark_count=spark_count, length=length, color=color
         )
-        self.effects.append(effect)
-        return effect
     
     def create_planting_ring(self, x: float, y: float,
                             max_radius: float = 60.0,
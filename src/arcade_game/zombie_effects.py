@@ -152,6 +152,12 @@ class ZombieEffects:
     管理僵尸的各种视觉效果
     """
     
+    # 阴影和尘土共用的白色圆形纹理（通过精灵颜色着色，按类缓存）
+    _circle_texture: Optional[arcade.Texture] = None
+    CIRCLE_TEXTURE_SIZE = 64
+    # 尘土粒子颜色（棕灰色）
+    DUST_COLOR = (160, 140, 120)
+    
     def __init__(self):
         self._dust_particles: Dict[int, List[DustParticle]] = {}
         self._shadow_states: Dict[int, ShadowState] = {}
@@ -161,6 +167,16 @@ class ZombieEffects:
         
         # 尘土生成计时器
         self._dust_timers: Dict[int, float] = {}
+        
+        # 合批渲染：阴影和尘土各用一个 SpriteList，每帧只绘制一次（首次渲染时创建）
+        self._shadow_list: Optional[arcade.SpriteList] = None
+        self._shadow_sprites: Dict[int, arcade.Sprite] = {}
+        self._batched_shadow_ids: set = set()
+        self._previous_shadow_ids: set = set()
+        self._dust_list: Optional[arcade.SpriteList] = None
+        self._dust_sprites: List[arcade.Sprite] = []
+        self._dust_count = 0
+        self._visible_dust_count = 0
     
     def update(self, dt: float, zombie_id: int, x: float, y: float,
                is_moving: bool = False, is_eating: bool = False,
@@ -243,32 +259,98 @@ class ZombieEffects:
             if not p.is_alive:
                 particles.remove(p)
     
-    def render_shadow(self, zombie_id: int, x: float, y: float,
+    # ========== 合批渲染 ==========
+    
+    def begin_batch(self) -> None:
+        """开始收集本帧的阴影和尘土精灵"""
+        if self._shadow_list is None:
+            self._shadow_list = arcade.SpriteList(lazy=True)
+            self._dust_list = arcade.SpriteList(lazy=True)
+        self._previous_shadow_ids = self._batched_shadow_ids
+        self._batched_shadow_ids = set()
+        self._dust_count = 0
+    
+    def batch_shadow(self, zombie_id: int, x: float, y: float,
                      zombie_width: float) -> None:
-        """渲染僵尸阴影"""
+        """将僵尸阴影写入阴影精灵（黑色椭圆，宽为僵尸宽度 × scale_x，高为宽度 × scale_y 的一半）"""
         shadow = self._get_or_create_shadow(zombie_id)
+        sprite = self._shadow_sprites.get(zombie_id)
+        if sprite is None:
+            sprite = arcade.Sprite(self._get_circle_texture())
+            sprite.color = arcade.color.BLACK
+            self._shadow_sprites[zombie_id] = sprite
+            self._shadow_list.append(sprite)
         
-        shadow_x = x + shadow.offset_x
-        shadow_y = y + shadow.offset_y
-        
-        # 绘制椭圆阴影
-        arcade.draw_ellipse_filled(
-            shadow_x, shadow_y,
-            zombie_width * shadow.scale_x,
-            zombie_width * shadow.scale_y * 0.5,
-            (0, 0, 0, shadow.alpha)
-        )
+        sprite.position = (x + shadow.offset_x, y + shadow.offset_y)
+        # 椭圆阴影：纵向压扁一半
+        sprite.width = zombie_width * shadow.scale_x
+        sprite.height = zombie_width * shadow.scale_y * 0.5
+        sprite.alpha = shadow.alpha
+        sprite.visible = True
+        self._batched_shadow_ids.add(zombie_id)
     
-    def render_dust(self, zombie_id: int) -> None:
-        """渲染尘土粒子"""
-        if zombie_id not in self._dust_particles:
+    def batch_dust(self, zombie_id: int) -> None:
+        """将僵尸的尘土粒子写入尘土精灵池（棕灰色圆点，只写入存活的粒子）"""
+        particles = self._dust_particles.get(zombie_id)
+        if not particles:
             return
         
-        for p in self._dust_particles[zombie_id]:
-            if p.is_alive:
-                # 使用棕灰色绘制尘土
-                color = (160, 140, 120, p.alpha)
-                arcade.draw_circle_filled(p.x, p.y, p.size, color)
+        sprites = self._dust_sprites
+        count = self._dust_count
+        for p in particles:
+            if not p.is_alive:
+                continue
+            if count == len(sprites):
+                sprite = arcade.Sprite(self._get_circle_texture())
+                sprite.color = self.DUST_COLOR
+                sprites.append(sprite)
+                self._dust_list.append(sprite)
+            else:
+                sprite = sprites[count]
+            sprite.position = (p.x, p.y)
+            # 粒子 size 为半径，精灵尺寸为直径
+            sprite.width = sprite.height = p.size * 2
+            sprite.alpha = p.alpha
+            sprite.visible = True
+            count += 1
+        self._dust_count = count
+    
+    def draw_batch(self) -> None:
+        """隐藏本帧未使用的精灵，然后阴影和尘土各绘制一次"""
+        for zombie_id in self._previous_shadow_ids - self._batched_shadow_ids:
+            sprite = self._shadow_sprites.get(zombie_id)
+            if sprite is not None:
+                sprite.visible = False
+        
+        for i in range(self._dust_count, self._visible_dust_count):
+            self._dust_sprites[i].visible = False
+        self._visible_dust_count = self._dust_count
+        
+        if self._batched_shadow_ids:
+            self._shadow_list.draw()
+        if self._dust_count:
+            self._dust_list.draw()
+    
+    @classmethod
+    def _get_circle_texture(cls) -> arcade.Texture:
+        """获取白色圆形纹理（按类缓存）"""
+        texture = cls._circle_texture
+        if texture is None:
+            texture = arcade.make_circle_texture(cls.CIRCLE_TEXTURE_SIZE, arcade.color.WHITE)
+            cls._circle_texture = texture
+        return texture
+    
+    def _clear_batches(self) -> None:
+        """移除所有合批精灵"""
+        for sprite in self._shadow_sprites.values():
+            sprite.remove_from_sprite_lists()
+        for sprite in self._dust_sprites:
+            sprite.remove_from_sprite_lists()
+        self._shadow_sprites.clear()
+        self._dust_sprites.clear()
+        self._batched_shadow_ids = set()
+        self._dust_count = 0
+        self._visible_dust_count = 0
     
     def render_expression(self, zombie_id: int, x: float, y: float,
                          head_width: float, head_height: float,
@@ -493,6 +575,10 @@ class ZombieEffects:
         self._expression_states.pop(zombie_id, None)
         self._grass_interactions.pop(zombie_id, None)
         self._dust_timers.pop(zombie_id, None)
+        sprite = self._shadow_sprites.pop(zombie_id, None)
+        if sprite is not None:
+            sprite.remove_from_sprite_lists()
+        self._batched_shadow_ids.discard(zombie_id)
     
     def clear(self) -> None:
         """清除所有效果"""
@@ -501,6 +587,7 @@ class ZombieEffects:
         self._expression_states.clear()
         self._grass_interactions.clear()
         self._dust_timers.clear()
+        self._clear_batches()
         self._time = 0.0
 
 
@@ -128,42 +128,70 @@ class ZombieRenderIntegration:
     
     def render(self, zombie_id: int, component_manager: ComponentManager) -> None:
         """渲染单个僵尸（在现有渲染系统之后调用）- 只渲染特效"""
-        # 根据LOD决定是否渲染
-        if not self._lod_system.should_render(zombie_id):
-            return
-        
-        transform = component_manager.get_component(zombie_id, TransformComponent)
-        sprite = component_manager.get_component(zombie_id, SpriteComponent)
-        zombie = component_manager.get_component(zombie_id, ZombieComponent)
-        zombie_type_comp = component_manager.get_component(zombie_id, ZombieTypeComponent)
-        
-        if not transform or not sprite or not zombie:
-            return
-        
-        # 获取渲染偏移（震动效果）
-        offset_x, offset_y = self._visual_system.get_render_offset(zombie_id)
-        
-        # 计算最终位置
-        final_x = transform.x + offset_x
-        final_y = transform.y + offset_y
-        
-        # 应用特殊僵尸的Y轴偏移
-        zombie_type = zombie_type_comp.zombie_type if zombie_type_comp else ZombieType.NORMAL
-        if zombie_type == ZombieType.BALLOON:
-            balloon_offset = self._special_effects.get_balloon_offset(0, 0)
-            final_y += balloon_offset
-        elif zombie_type == ZombieType.POGO:
-            pogo_offset, _ = self._special_effects.get_pogo_offset(0, 0)
-            final_y += pogo_offset
-        
-        # 1. 先渲染阴影（根据LOD决定）
-        if self._lod_system.should_render_shadow(zombie_id):
-            self._effects.render_shadow(zombie_id, final_x, final_y, sprite.width)
-        
-        # 2. 渲染尘土（根据LOD决定）
-        if self._lod_system.should_render_dust(zombie_id):
-            self._effects.render_dust(zombie_id)
-        
+        self.render_all((zombie_id,), component_manager)
+    
+    def render_all(self, zombie_ids, component_manager: ComponentManager) -> None:
+        """
+        渲染所有僵尸的特效（在现有渲染系统之后调用）
+        
+        阴影和尘土先写入合批精灵，各用一次绘制提交；
+        表情、特殊效果等仍按僵尸逐个绘制，叠加在阴影和尘土之上
+        """
+        lod = self._lod_system
+        effects = self._effects
+        get_component = component_manager.get_component
+        effects.begin_batch()
+        
+        overlays = []
+        for zombie_id in zombie_ids:
+            # 根据LOD决定是否渲染
+            if not lod.should_render(zombie_id):
+                continue
+            
+            transform = get_component(zombie_id, TransformComponent)
+            sprite = get_component(zombie_id, SpriteComponent)
+            zombie = get_component(zombie_id, ZombieComponent)
+            zombie_type_comp = get_component(zombie_id, ZombieTypeComponent)
+            
+            if not transform or not sprite or not zombie:
+                continue
+            
+            # 获取渲染偏移（震动效果）
+            offset_x, offset_y = self._visual_system.get_render_offset(zombie_id)
+            
+            # 计算最终位置
+            final_x = transform.x + offset_x
+            final_y = transform.y + offset_y
+            
+            # 应用特殊僵尸的Y轴偏移
+            zombie_type = zombie_type_comp.zombie_type if zombie_type_comp else ZombieType.NORMAL
+            if zombie_type == ZombieType.BALLOON:
+                balloon_offset = self._special_effects.get_balloon_offset(0, 0)
+                final_y += balloon_offset
+            elif zombie_type == ZombieType.POGO:
+                pogo_offset, _ = self._special_effects.get_pogo_offset(0, 0)
+                final_y += pogo_offset
+            
+            # 1. 阴影（根据LOD决定）
+            if lod.should_render_shadow(zombie_id):
+                effects.batch_shadow(zombie_id, final_x, final_y, sprite.width)
+            
+            # 2. 尘土（根据LOD决定）
+            if lod.should_render_dust(zombie_id):
+                effects.batch_dust(zombie_id)
+            
+            overlays.append((zombie_id, final_x, final_y, sprite, zombie, zombie_type_comp))
+        
+        effects.draw_batch()
+        
+        for zombie_id, final_x, final_y, sprite, zombie, zombie_type_comp in overlays:
+            self._render_overlays(zombie_id, final_x, final_y, sprite, zombie,
+                                  zombie_type_comp, component_manager)
+    
+    def _render_overlays(self, zombie_id: int, final_x: float, final_y: float,
+                         sprite, zombie, zombie_type_comp,
+                         component_manager: ComponentManager) -> None:
+        """渲染单个僵尸阴影和尘土之上的特效"""
         # 3. 渲染表情（根据LOD决定）
         if self._lod_system.should_render_expression(zombie_id):
             anim_comp = component_manager.get_component(zombie_id, AnimationComponent)
@@ -5,7 +5,7 @@
 import random
 from typing import Optional, List, Tuple
 from ..ecs import World
-from ..ecs.components import ZombieType
+from ..ecs.components import ZombieType, ZombieComponent
 from .entity_factory import EntityFactory
 
 
@@ -20,6 +20,7 @@ class ZombieSpawner:
     SCREEN_WIDTH = 900
     GRID_START_Y = 50
     CELL_HEIGHT = 100
+    GRID_ROWS = 5
     
     # 僵尸起始X坐标（屏幕右侧外）
     SPAWN_X = 850
@@ -28,6 +29,12 @@ class ZombieSpawner:
         self.world = world
         self.entity_factory = entity_factory
         
+        # 预计算每行的中心Y坐标
+        self._row_centers_y = tuple(
+            self.GRID_START_Y + row * self.CELL_HEIGHT + self.CELL_HEIGHT / 2
+            for row in range(self.GRID_ROWS)
+        )
+        
         # 波次配置
         self.current_level = 1
         self.wave_index = 0
@@ -43,6 +50,9 @@ class ZombieSpawner:
         # 当前波次待生成的僵尸队列
         self.zombie_queue: List[Tuple[ZombieType, int]] = []
         
+        # 波次状态版本号：关卡、波次或队列变化时递增，供UI判断是否需要刷新波次信息
+        self.wave_state_version = 0
+        
         # 波次配置
         self.wave_configs = self._init_wave_configs()
     
@@ -136,6 +146,7 @@ class ZombieSpawner:
         self.wave_index = 0
         self.wave_timer = 0.0
         self.zombie_queue.clear()
+        self.wave_state_version += 1
     
     def update(self, dt: float) -> Optional[List]:
         """
@@ -177,6 +188,7 @@ class ZombieSpawner:
             # 开始新波次，填充僵尸队列
             self.zombie_queue = current_wave['zombies'].copy()
             self.wave_index += 1
+            self.wave_state_version += 1
     
     def _spawn_next_zombie(self) -> Optional:
         """生成队列中的下一个僵尸"""
@@ -191,12 +203,11 @@ class ZombieSpawner:
             self.zombie_queue.pop(0)
         else:
             self.zombie_queue[0] = (zombie_type, count - 1)
+        self.wave_state_version += 1
         
         # 随机选择行（0-4）
-        row = random.randint(0, 4)
-        
-        # 计算Y坐标
-        y = self.GRID_START_Y + row * self.CELL_HEIGHT + self.CELL_HEIGHT / 2
+        row = random.randint(0, self.GRID_ROWS - 1)
+        y = self._row_centers_y[row]
         
         # 创建僵尸（应用难度倍率）
         return self.entity_factory.create_zombie(
@@ -223,10 +234,8 @@ class ZombieSpawner:
         if not self.is_wave_complete():
             return False
         
-        # 检查是否还有僵尸存活
-        from ..ecs.components import ZombieComponent
-        zombies = self.world.query_entities(ZombieComponent)
-        return len(zombies) == 0
+        # 检查是否还有僵尸存活（直接看组件存储是否为空，不构建实体列表）
+        return not self.world.query_components(ZombieComponent)
     
     def get_wave_info(self) -> str:
         """获取波次信息"""
@@ -288,4 +297,5 @@ class ZombieSpawner:
         self.wave_index = 0
         self.wave_timer = 0.0
         self.spawn_timer = 0.0
-        self.zombie_queue.clear()
\ No newline at end of file
+        self.zombie_queue.clear()
+        self.wave_state_version += 1
\ No newline at end of file
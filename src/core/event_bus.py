@@ -1,6 +1,6 @@
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Any, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import heapq
 from .logger import get_module_logger
 
@@ -27,9 +27,45 @@ class EventType(Enum):
 
 @dataclass
 class Event:
-    """事件数据类"""
+    """
+    事件数据类
+    
+    data 可以是普通字典，也可以是下方的类型化载荷（高频事件使用，
+    处理器直接按属性读取，省去逐键的 dict.get 查找和字典分配）
+    """
     event_type: EventType
-    data: Dict[str, Any] = field(default_factory=dict)
+    data: Any = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class DamageDealtPayload:
+    """DAMAGE_DEALT 事件载荷"""
+    x: float
+    y: float
+    damage: int
+    damage_type: str
+    target_id: Optional[int] = None
+
+
+@dataclass(slots=True)
+class ExplosionPayload:
+    """EXPLOSION 事件载荷"""
+    x: float
+    y: float
+    radius: float
+    damage: int
+    explosion_type: str
+
+
+@dataclass(slots=True)
+class PlantDiedPayload:
+    """PLANT_DIED 事件载荷"""
+    entity_id: int
+    plant_type: Any
+    row: int = -1
+    col: int = -1
+    x: float = 0.0
+    y: float = 0.0
 
 
 @dataclass(order=True)
@@ -58,7 +94,8 @@ class EventBus:
         # 事件过滤器
         self._filters: List[Callable[[Event], bool]] = []
     
-    def subscribe(self, event_type: EventType, callback: Callable[[Event], None], priority: int = 0):
+    def subscribe(self, event_type: EventType, callback: Callable[[Event], None],
+                  priority: int = 0) -> Tuple[EventType, Callable[[Event], None]]:
         """
         订阅事件
         
@@ -66,6 +103,9 @@ class EventBus:
             event_type: 事件类型
             callback: 回调函数
             priority: 优先级（越高越先处理，默认0）
+            
+        Returns:
+            订阅令牌 (event_type, callback)，可通过 unsubscribe(*token) 取消订阅
         """
         if event_type not in self._listeners:
             self._listeners[event_type] = []
@@ -73,6 +113,8 @@ class EventBus:
         self._listeners[event_type].append((priority, callback))
         # 按优先级排序（高优先级在前）
         self._listeners[event_type].sort(key=lambda x: x[0], reverse=True)
+        
+        return (event_type, callback)
     
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]):
         """
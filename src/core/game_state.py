@@ -4,7 +4,7 @@
 管理游戏的不同状态（菜单、游戏中、暂停等）
 """
 
-from enum import Enum, auto
+from enum import Enum, IntFlag, auto
 from typing import Optional, Callable
 
 
@@ -66,6 +66,37 @@ class ExtendedGameState(Enum):
     SETTINGS = auto()
 
 
+class StateFlag(IntFlag):
+    """
+    游戏状态位标志
+    
+    GameStateManager.state_flags 以整数形式保存当前状态对应的位，
+    热路径上可以用一次按位与代替多个 is_*() 调用
+    """
+    MENU = 1
+    PLAYING = 2
+    PAUSED = 4
+    GAME_OVER = 8
+    VICTORY = 16
+    
+    # 覆盖在游戏画面上的菜单（暂停、结束、胜利）
+    OVERLAY_MENU = PAUSED | GAME_OVER | VICTORY
+    # 显示任意菜单的状态
+    MENU_SHOWN = MENU | OVERLAY_MENU
+
+
+# 扩展状态 -> 状态位（选关和设置界面都属于菜单）
+_STATE_FLAGS = {
+    ExtendedGameState.MAIN_MENU: int(StateFlag.MENU),
+    ExtendedGameState.LEVEL_SELECT: int(StateFlag.MENU),
+    ExtendedGameState.SETTINGS: int(StateFlag.MENU),
+    ExtendedGameState.PLAYING: int(StateFlag.PLAYING),
+    ExtendedGameState.PAUSED: int(StateFlag.PAUSED),
+    ExtendedGameState.GAME_OVER: int(StateFlag.GAME_OVER),
+    ExtendedGameState.VICTORY: int(StateFlag.VICTORY),
+}
+
+
 class GameStateManager:
     """
     游戏状态管理器
@@ -74,6 +105,7 @@ class GameStateManager:
     
     Attributes:
         current_state: 当前游戏状态
+        state_flags: 当前状态对应的 StateFlag 位（整数）
         previous_state: 上一个游戏状态
         current_level: 当前关卡
         max_unlocked_level: 最大解锁关卡
@@ -83,6 +115,7 @@ class GameStateManager:
     def __init__(self):
         """初始化游戏状态管理器"""
         self.current_state = ExtendedGameState.MAIN_MENU
+        self.state_flags = _STATE_FLAGS[self.current_state]
         self.previous_state: Optional[ExtendedGameState] = None
         self.current_level = 1
         self.max_unlocked_level = 1
@@ -110,6 +143,7 @@ class GameStateManager:
         
         self.previous_state = self.current_state
         self.current_state = new_state
+        self.state_flags = _STATE_FLAGS[new_state]
         
         # 触发回调
         if self.on_state_change:
@@ -10,6 +10,7 @@
 """
 
 import time
+from array import array
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass, field
 from collections import deque
@@ -36,7 +37,13 @@ class PerformanceMonitor:
     性能监控器
     
     单例模式，全局性能监控
+    
+    每帧只向预分配的帧时间环形缓冲区写入一个值，
+    FPS、内存与历史数据每秒汇总一次；显示或查询指标时再按需解码缓冲区
     """
+    # 帧时间环形缓冲区容量（与历史图表长度一致）
+    FRAME_HISTORY_SIZE = 60
+    
     _instance: Optional['PerformanceMonitor'] = None
     
     def __new__(cls):
@@ -54,9 +61,14 @@ class PerformanceMonitor:
         
         # 帧率计算
         self._frame_count = 0
-        self._last_fps_update = time.time()
+        self._last_fps_update = time.perf_counter()
         self._frame_start_time = 0.0
         
+        # 帧时间环形缓冲区（毫秒），_frame_index 为下一个写入位置
+        self._frame_times = array('d', bytes(8 * self.FRAME_HISTORY_SIZE))
+        self._frame_index = 0
+        self._frames_recorded = 0
+        
         # 绘制调用计数
         self._draw_calls = 0
         self._draw_call_loggers: List[Callable] = []
@@ -109,27 +121,45 @@ class PerformanceMonitor:
         self._draw_calls = 0  # 重置绘制调用计数
     
     def end_frame(self) -> None:
-        """结束一帧的计时"""
+        """结束一帧的计时，帧时间写入环形缓冲区"""
         frame_end_time = time.perf_counter()
-        frame_time = (frame_end_time - self._frame_start_time) * 1000  # 转换为毫秒
         
+        index = self._frame_index
+        self._frame_times[index] = (frame_end_time - self._frame_start_time) * 1000  # 转换为毫秒
+        index += 1
+        self._frame_index = 0 if index == self.FRAME_HISTORY_SIZE else index
+        self._frames_recorded += 1
         self._frame_count += 1
-        self.metrics.frame_time = frame_time
-        self.metrics.frame_time_history.append(frame_time)
         
-        # 每秒更新一次FPS
-        current_time = time.time()
-        if current_time - self._last_fps_update >= 1.0:
+        # 更新绘制调用数
+        self.metrics.draw_calls = self._draw_calls
+        
+        # 每秒汇总一次FPS、帧时间历史和内存
+        if frame_end_time - self._last_fps_update >= 1.0:
             self.metrics.fps = self._frame_count
             self.metrics.fps_history.append(float(self._frame_count))
             self._frame_count = 0
-            self._last_fps_update = current_time
+            self._last_fps_update = frame_end_time
             
-            # 更新内存使用
+            self._flush_frame_times()
             self._update_memory_usage()
+    
+    def _flush_frame_times(self) -> None:
+        """将环形缓冲区中的帧时间按时间顺序解码到指标中"""
+        recorded = min(self._frames_recorded, self.FRAME_HISTORY_SIZE)
+        if not recorded:
+            return
         
-        # 更新绘制调用数
-        self.metrics.draw_calls = self._draw_calls
+        index = self._frame_index
+        frame_times = self._frame_times
+        history = self.metrics.frame_time_history
+        history.clear()
+        if recorded == self.FRAME_HISTORY_SIZE:
+            history.extend(frame_times[index:])
+            history.extend(frame_times[:index])
+        else:
+            history.extend(frame_times[:recorded])
+        self.metrics.frame_time = frame_times[index - 1]
     
     def log_draw_call(self, count: int = 1) -> None:
         """记录绘制调用"""
@@ -153,6 +183,11 @@ class PerformanceMonitor:
         except ImportError:
             self.metrics.memory_usage_mb = 0.0
     
+    @property
+    def show_debug(self) -> bool:
+        """调试信息是否显示（隐藏时调用方可跳过统计数据的采集）"""
+        return self._show_debug
+    
     def toggle_debug(self) -> None:
         """切换调试信息显示"""
         self._show_debug = not self._show_debug
@@ -166,6 +201,8 @@ class PerformanceMonitor:
         if not self._show_debug:
             return
         
+        self._flush_frame_times()
+        
         # 更新文本内容
         self._text_objects['fps'].text = f"FPS: {self.metrics.fps:.0f}"
         self._text_objects['entities'].text = f"Entities: {self.metrics.entity_count}"
@@ -236,6 +273,7 @@ class PerformanceMonitor:
     
     def get_metrics(self) -> PerformanceMetrics:
         """获取性能指标"""
+        self._flush_frame_times()
         return self.metrics
     
     def reset(self) -> None:
@@ -243,7 +281,9 @@ class PerformanceMonitor:
         self.metrics = PerformanceMetrics()
         self._frame_count = 0
         self._draw_calls = 0
-        self._last_fps_update = time.time()
+        self._last_fps_update = time.perf_counter()
+        self._frame_index = 0
+        self._frames_recorded = 0
 
 
 # 全局性能监控器实例
@@ -226,6 +226,9 @@ WHITE = Color(255, 255, 255)
 BLACK = Color(0, 0, 0)
 TRANSPARENT = Color(0, 0, 0, 0)
 
+# 界面文字的字体回退列表（所有渲染器共用同一个元组）
+FONT_NAMES = ("Arial", "Microsoft YaHei", "sans-serif")
+
 # 导出所有颜色类
 __all__ = [
     'Color',
@@ -240,4 +243,5 @@ __all__ = [
     'GRADIENT_HEALTH', 'GRADIENT_SUN', 'GRADIENT_GRASS',
     'hex_to_color',
     'WHITE', 'BLACK', 'TRANSPARENT',
+    'FONT_NAMES',
 ]
@@ -10,8 +10,8 @@ from enum import Enum, auto
 
 
 class Component:
-    """组件基类"""
-    pass
+    """组件基类（不定义实例字典，允许子类使用 slots 存储）"""
+    __slots__ = ()
 
 
 T = TypeVar('T', bound=Component)
@@ -119,6 +119,42 @@ class ComponentManager:
         
         return list(result)
     
+    def query_with_components(self, *component_types: Type[Component]) -> List[Tuple]:
+        """
+        查询拥有所有指定组件类型的实体，并同时返回组件实例
+        
+        以最小的组件字典为基准：先用键视图的集合运算求出同时拥有所有组件的实体，
+        再按列（每种组件一次 map）取出组件并 zip 成元组，整个拼接在 C 层完成，
+        避免逐实体构建列表和调用 get
+        
+        Args:
+            *component_types: 组件类型列表
+            
+        Returns:
+            (entity_id, 组件1, 组件2, ...) 元组列表，组件顺序与参数一致
+        """
+        if not component_types:
+            return []
+        
+        stores = []
+        for component_type in component_types:
+            store = self._components.get(component_type)
+            if not store:
+                return []
+            stores.append(store)
+        
+        smallest = min(stores, key=len)
+        entity_ids = smallest.keys()
+        others = [store for store in stores if store is not smallest]
+        if not all(entity_ids <= store.keys() for store in others):
+            common = set(entity_ids)
+            for store in others:
+                common &= store.keys()
+            # 保持最小组件字典的顺序（渲染层内的绘制顺序依赖它）
+            entity_ids = [entity_id for entity_id in smallest if entity_id in common]
+        
+        return list(zip(entity_ids, *[map(store.__getitem__, entity_ids) for store in stores]))
+    
     def _perform_query(self, *component_types: Type[Component]) -> Set[int]:
         """
         执行实际的查询操作
@@ -6,12 +6,12 @@ from dataclasses import dataclass, field
 from ..component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthComponent(Component):
     """
     生命值组件
     
-    存储和管理实体的生命值
+    存储和管理实体的生命值，使用 slots 固定字段布局
     
     Attributes:
         current: 当前生命值
@@ -6,12 +6,13 @@ from dataclasses import dataclass
 from ..component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformComponent(Component):
     """
     变换组件
     
-    存储实体在2D空间中的位置、旋转角度和缩放比例
+    存储实体在2D空间中的位置、旋转角度和缩放比例。
+    每帧被大量系统读写，使用 slots 固定字段布局，减少内存占用并加快属性访问
     
     Attributes:
         x: X坐标（像素）
@@ -80,6 +80,11 @@ class EntityManager:
                 del self._entities[entity_id]
         self._entities_to_remove.clear()
     
+    @property
+    def entity_count(self) -> int:
+        """当前实体数量（含本帧待销毁的实体）"""
+        return len(self._entities)
+    
     def get_all_entities(self) -> List[Entity]:
         """获取所有活动实体"""
         return [entity for entity in self._entities.values() if entity.active]
@@ -4,7 +4,7 @@
 使用空间哈希网格优化碰撞检测性能，将O(n²)降低到O(n)
 """
 
-from typing import Callable, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from ..system import System
 from ..component import ComponentManager
 from ..components import TransformComponent, CollisionComponent
@@ -22,6 +22,10 @@ class CollisionSystem(System):
     使用空间哈希网格优化碰撞检测性能。
     将世界划分为固定大小的网格单元，只检测同一单元或邻近单元内的实体碰撞。
     
+    植物种下后不再移动，单独保存在常驻的静态空间哈希中，
+    只在组件结构变化（种植、死亡）或位置改变时更新；
+    每帧只重建移动实体的空间哈希，并由移动实体查询静态哈希。
+    
     Attributes:
         LAYER_PLANT: 植物碰撞层
         LAYER_ZOMBIE: 僵尸碰撞层
@@ -38,6 +42,9 @@ class CollisionSystem(System):
     # 空间哈希网格单元大小（像素）
     CELL_SIZE = 100.0
     
+    # 静态碰撞层（放置后不移动）
+    STATIC_LAYERS = LAYER_PLANT
+    
     def __init__(self, priority: int = 20):
         """
         初始化碰撞系统
@@ -49,6 +56,12 @@ class CollisionSystem(System):
         self._collision_callbacks: List[CollisionCallback] = []
         self._spatial_hash: SpatialHash = SpatialHash(cell_size=self.CELL_SIZE)
         self._checked_pairs: Set[tuple] = set()  # 避免重复检测
+        
+        # 静态实体空间哈希：entity_id -> 插入时的位置
+        self._static_hash: SpatialHash = SpatialHash(cell_size=self.CELL_SIZE)
+        self._static_positions: Dict[int, Tuple[float, float]] = {}
+        self._static_version = -1
+        self._dynamic_ids: List[int] = []
     
     def update(self, dt: float, component_manager: ComponentManager) -> None:
         """
@@ -63,19 +76,68 @@ class CollisionSystem(System):
         # 清空上帧的检测记录
         self._checked_pairs.clear()
         
-        # 更新空间哈希
+        # 同步静态哈希，重建移动实体的空间哈希
+        self._sync_static_hash(component_manager)
         self._update_spatial_hash(component_manager)
         
-        # 获取所有带碰撞组件的实体
-        entities = component_manager.query(TransformComponent, CollisionComponent)
-        
-        # 使用空间哈希进行碰撞检测
-        for entity_id in entities:
+        # 只从移动实体出发检测，静态实体之间不检测
+        for entity_id in self._dynamic_ids:
             self._check_entity_collisions(entity_id, component_manager)
     
+    def _sync_static_hash(self, component_manager: ComponentManager) -> None:
+        """
+        同步静态实体空间哈希
+        
+        组件结构变化时重新划分静态/移动实体并增删静态条目；
+        静态实体位置发生变化时原地更新其网格单元
+        
+        Args:
+            component_manager: 组件管理器
+        """
+        transforms = component_manager.get_all_components(TransformComponent)
+        collisions = component_manager.get_all_components(CollisionComponent)
+        positions = self._static_positions
+        
+        if self._static_version != component_manager._cache_version:
+            self._static_version = component_manager._cache_version
+            static_layers = self.STATIC_LAYERS
+            dynamic_ids = []
+            static_ids = set()
+            for entity_id in component_manager.query(TransformComponent, CollisionComponent):
+                if collisions[entity_id].layer & static_layers:
+                    static_ids.add(entity_id)
+                else:
+                    dynamic_ids.append(entity_id)
+            self._dynamic_ids = dynamic_ids
+            
+            for entity_id in [entity_id for entity_id in positions if entity_id not in static_ids]:
+                del positions[entity_id]
+                self._static_hash.remove(entity_id)
+        else:
+            static_ids = positions.keys()
+        
+        for entity_id in list(static_ids):
+            transform = transforms[entity_id]
+            position = (transform.x, transform.y)
+            if positions.get(entity_id) != position:
+                positions[entity_id] = position
+                self._static_hash.update(
+                    entity_id, self._make_aabb(transform, collisions[entity_id])
+                )
+    
+    @staticmethod
+    def _make_aabb(transform: TransformComponent, collision: CollisionComponent) -> AABB:
+        """根据位置和碰撞盒创建AABB"""
+        return AABB(
+            x=transform.x - collision.width / 2,
+            y=transform.y - collision.height / 2,
+            width=collision.width,
+            height=collision.height
+        )
+    
     def _update_spatial_hash(self, component_manager: ComponentManager) -> None:
         """
-        更新空间哈希网格
+        更新移动实体的空间哈希网格
         
         清空并重新构建空间哈希，反映当前实体位置
         
@@ -84,21 +146,13 @@ class CollisionSystem(System):
         """
         self._spatial_hash.clear()
         
-        entities = component_manager.query(TransformComponent, CollisionComponent)
+        transforms = component_manager.get_all_components(TransformComponent)
+        collisions = component_manager.get_all_components(CollisionComponent)
         
-        for entity_id in entities:
-            transform = component_manager.get_component(entity_id, TransformComponent)
-            collision = component_manager.get_component(entity_id, CollisionComponent)
-            
-            if transform and collision:
-                # 创建AABB
-                aabb = AABB(
-                    x=transform.x - collision.width / 2,
-                    y=transform.y - collision.height / 2,
-                    width=collision.width,
-                    height=collision.height
-                )
-                self._spatial_hash.insert(entity_id, aabb)
+        for entity_id in self._dynamic_ids:
+            self._spatial_hash.insert(
+                entity_id, self._make_aabb(transforms[entity_id], collisions[entity_id])
+            )
     
     def _check_entity_collisions(self, entity_id: int, 
                                   component_manager: ComponentManager) -> None:
@@ -121,6 +175,8 @@ class CollisionSystem(System):
         # 查询范围基于碰撞盒大小
         query_radius = max(collision.width, collision.height) * 2
         nearby_entities = self._spatial_hash.get_nearby_entities(entity_id, query_radius)
+        # 静态实体：碰撞盒相交必然共享网格单元，按自身AABB查询即可
+        nearby_entities.extend(self._static_hash.query_aabb(self._make_aabb(transform, collision)))
         
         for other_id in nearby_entities:
             # 避免重复检测（确保每对只检测一次）
@@ -209,6 +265,7 @@ class CollisionSystem(System):
         """
         return {
             'spatial_hash': self._spatial_hash.get_stats(),
+            'static_hash': self._static_hash.get_stats(),
             'checked_pairs': len(self._checked_pairs),
             'callbacks': len(self._collision_callbacks)
         }
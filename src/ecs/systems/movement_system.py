@@ -19,18 +19,19 @@ class MovementSystem(System):
         super().__init__(priority)
     
     def update(self, dt: float, component_manager: ComponentManager) -> None:
-        """更新所有实体的位置"""
-        # 查询所有同时拥有Transform和Velocity组件的实体
-        entities = component_manager.query(TransformComponent, VelocityComponent)
+        """
+        更新所有实体的位置
         
-        for entity_id in entities:
-            transform = component_manager.get_component(entity_id, TransformComponent)
-            velocity = component_manager.get_component(entity_id, VelocityComponent)
+        在所有行为系统之前运行，僵尸行为系统随后在同一帧内
+        统计最左僵尸位置，游戏结束判定直接读取该值
+        """
+        # 查询所有同时拥有Transform和Velocity组件的实体（连同组件一起返回）
+        for _, transform, velocity in component_manager.query_with_components(
+            TransformComponent, VelocityComponent
+        ):
+            # 计算实际速度（内联 get_actual_speed）
+            actual_speed = velocity.base_speed * velocity.speed_multiplier
             
-            if transform and velocity:
-                # 计算实际速度
-                actual_speed = velocity.get_actual_speed()
-                
-                # 更新位置
-                transform.x += velocity.vx * actual_speed * dt
-                transform.y += velocity.vy * actual_speed * dt
\ No newline at end of file
+            # 更新位置
+            transform.x += velocity.vx * actual_speed * dt
+            transform.y += velocity.vy * actual_speed * dt
@@ -9,7 +9,9 @@ from ..components import (
     ProjectileType, PlantTypeComponent, PlantType, HealthComponent,
     AnimationComponent, AnimationState
 )
-from ...core.event_bus import EventBus, Event, EventType
+from ...core.event_bus import (
+    EventBus, Event, EventType, DamageDealtPayload, ExplosionPayload, PlantDiedPayload
+)
 
 
 class PlantBehaviorSystem(System):
@@ -50,6 +52,12 @@ class PlantBehaviorSystem(System):
         self.entity_factory = entity_factory
         self.event_bus = event_bus
         
+        # 高频效果回调，不经过事件总线
+        # 伤害回调 - 接收 (x, y, damage, damage_type, target_id)
+        self.on_damage_callbacks = []
+        # 爆炸回调 - 接收 (x, y, radius, explosion_type)
+        self.on_explosion_callbacks = []
+        
         self._potato_mine_states = {}
         self._chomper_states = {}
     
@@ -252,6 +260,38 @@ class PlantBehaviorSystem(System):
                     target_row
                 )
     
+    def _notify_explosion(self, x: float, y: float, radius: float,
+                          damage: int, explosion_type: str) -> None:
+        """通知爆炸：直接调用回调，仅在有订阅者时才发布事件"""
+        for callback in self.on_explosion_callbacks:
+            callback(x, y, radius, explosion_type)
+        
+        if self.event_bus and self.event_bus.has_listeners(EventType.EXPLOSION):
+            self.event_bus.publish(Event(
+                EventType.EXPLOSION,
+                ExplosionPayload(x, y, radius, damage, explosion_type)
+            ))
+    
+    def _notify_damage(self, x: float, y: float, damage: int,
+                       damage_type: str, target_id: int) -> None:
+        """通知伤害：直接调用回调，仅在有订阅者时才发布事件"""
+        for callback in self.on_damage_callbacks:
+            callback(x, y, damage, damage_type, target_id)
+        
+        if self.event_bus and self.event_bus.has_listeners(EventType.DAMAGE_DEALT):
+            self.event_bus.publish(Event(
+                EventType.DAMAGE_DEALT,
+                DamageDealtPayload(x, y, damage, damage_type, target_id)
+            ))
+    
+    def register_damage_callback(self, callback) -> None:
+        """注册伤害回调"""
+        self.on_damage_callbacks.append(callback)
+    
+    def register_explosion_callback(self, callback) -> None:
+        """注册爆炸回调"""
+        self.on_explosion_callbacks.append(callback)
+    
     def _explode_cherry_bomb(self, entity_id: int, transform, 
                              component_manager: ComponentManager) -> None:
         """
@@ -279,29 +319,11 @@ class PlantBehaviorSystem(System):
                     zombie_health.take_damage(self.CHERRY_EXPLOSION_DAMAGE)
                     damaged_zombies.append((zombie_id, zombie_transform))
         
-        if self.event_bus:
-            self.event_bus.publish(Event(
-                EventType.EXPLOSION,
-                {
-                    'x': transform.x,
-                    'y': transform.y,
-                    'radius': self.CHERRY_EXPLOSION_RADIUS,
-                    'damage': self.CHERRY_EXPLOSION_DAMAGE,
-                    'explosion_type': 'cherry_bomb'
-                }
-            ))
-            
-            for zombie_id, zombie_transform in damaged_zombies:
-                self.event_bus.publish(Event(
-                    EventType.DAMAGE_DEALT,
-                    {
-                        'x': zombie_transform.x,
-                        'y': zombie_transform.y,
-                        'damage': self.CHERRY_EXPLOSION_DAMAGE,
-                        'damage_type': 'fire',
-                        'target_id': zombie_id
-                    }
-                ))
+        self._notify_explosion(transform.x, transform.y,
+                               self.CHERRY_EXPLOSION_RADIUS, self.CHERRY_EXPLOSION_DAMAGE, 'cherry_bomb')
+        for zombie_id, zombie_transform in damaged_zombies:
+            self._notify_damage(zombie_transform.x, zombie_transform.y,
+                                self.CHERRY_EXPLOSION_DAMAGE, 'fire', zombie_id)
         
         plant_health = component_manager.get_component(entity_id, HealthComponent)
         if plant_health:
@@ -312,14 +334,14 @@ class PlantBehaviorSystem(System):
             grid_pos = component_manager.get_component(entity_id, GridPositionComponent)
             self.event_bus.publish(Event(
                 EventType.PLANT_DIED,
-                {
-                    'entity_id': entity_id,
-                    'plant_type': PlantType.CHERRY_BOMB,
-                    'row': grid_pos.row if grid_pos else -1,
-                    'col': grid_pos.col if grid_pos else -1,
-                    'x': transform.x,
-                    'y': transform.y
-                }
+                PlantDiedPayload(
+                    entity_id=entity_id,
+                    plant_type=PlantType.CHERRY_BOMB,
+                    row=grid_pos.row if grid_pos else -1,
+                    col=grid_pos.col if grid_pos else -1,
+                    x=transform.x,
+                    y=transform.y
+                )
             ))
     
     def _check_potato_mine(self, entity_id: int, transform, grid_pos,
@@ -383,29 +405,11 @@ class PlantBehaviorSystem(System):
                         zombie_health.take_damage(self.POTATO_EXPLOSION_DAMAGE)
                         damaged_zombies.append((zombie_id, zombie_transform))
         
-        if self.event_bus:
-            self.event_bus.publish(Event(
-                EventType.EXPLOSION,
-                {
-                    'x': transform.x,
-                    'y': transform.y,
-                    'radius': self.POTATO_EXPLOSION_RADIUS,
-                    'damage': self.POTATO_EXPLOSION_DAMAGE,
-                    'explosion_type': 'potato_mine'
-                }
-            ))
-            
-            for zombie_id, zombie_transform in damaged_zombies:
-                self.event_bus.publish(Event(
-                    EventType.DAMAGE_DEALT,
-                    {
-                        'x': zombie_transform.x,
-                        'y': zombie_transform.y,
-                        'damage': self.POTATO_EXPLOSION_DAMAGE,
-                        'damage_type': 'fire',
-                        'target_id': zombie_id
-                    }
-                ))
+        self._notify_explosion(transform.x, transform.y,
+                               self.POTATO_EXPLOSION_RADIUS, self.POTATO_EXPLOSION_DAMAGE, 'potato_mine')
+        for zombie_id, zombie_transform in damaged_zombies:
+            self._notify_damage(zombie_transform.x, zombie_transform.y,
+                                self.POTATO_EXPLOSION_DAMAGE, 'fire', zombie_id)
         
         plant_health = component_manager.get_component(entity_id, HealthComponent)
         if plant_health:
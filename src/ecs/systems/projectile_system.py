@@ -8,7 +8,7 @@ from ..components import (
     TransformComponent, ProjectileComponent, GridPositionComponent,
     VelocityComponent, HealthComponent, ZombieComponent
 )
-from ...core.event_bus import EventBus, Event, EventType
+from ...core.event_bus import EventBus, Event, EventType, DamageDealtPayload
 
 
 class ProjectileSystem(System):
@@ -26,6 +26,8 @@ class ProjectileSystem(System):
         super().__init__(priority)
         self.entity_manager = entity_manager
         self.event_bus = event_bus
+        # 伤害回调 - 接收 (x, y, damage, damage_type, target_id)，不经过事件总线
+        self.on_damage_callbacks = []
     
     def update(self, dt: float, component_manager: ComponentManager) -> None:
         """更新投射物"""
@@ -109,17 +111,9 @@ class ProjectileSystem(System):
         if projectile.is_splash:
             self._apply_splash_damage(zombie_id, projectile, zombie_transform, component_manager)
         
-        if self.event_bus and damage > 0:
-            self.event_bus.publish(Event(
-                EventType.DAMAGE_DEALT,
-                {
-                    'x': zombie_transform.x,
-                    'y': zombie_transform.y,
-                    'damage': damage,
-                    'damage_type': damage_type,
-                    'target_id': zombie_id
-                }
-            ))
+        if damage > 0:
+            self._notify_damage(zombie_transform.x, zombie_transform.y,
+                                damage, damage_type, zombie_id)
     
     def _apply_splash_damage(self, target_id: int, projectile, target_transform,
                              component_manager: ComponentManager) -> None:
@@ -143,14 +137,26 @@ class ProjectileSystem(System):
                     splash_damage = int(projectile.damage * 0.5)
                     zombie_health.take_damage(splash_damage)
                     
-                    if self.event_bus:
-                        self.event_bus.publish(Event(
-                            EventType.DAMAGE_DEALT,
-                            {
-                                'x': zombie_transform.x,
-                                'y': zombie_transform.y,
-                                'damage': splash_damage,
-                                'damage_type': 'fire',
-                                'target_id': zombie_id
-                            }
-                        ))
\ No newline at end of file
+                    self._notify_damage(zombie_transform.x, zombie_transform.y,
+                                        splash_damage, 'fire', zombie_id)
+    
+    def _notify_damage(self, x: float, y: float, damage: int,
+                       damage_type: str, target_id: int) -> None:
+        """通知伤害：直接调用回调，仅在有订阅者时才发布事件"""
+        for callback in self.on_damage_callbacks:
+            callback(x, y, damage, damage_type, target_id)
+        
+        if self.event_bus and self.event_bus.has_listeners(EventType.DAMAGE_DEALT):
+            self.event_bus.publish(Event(
+                EventType.DAMAGE_DEALT,
+                DamageDealtPayload(x, y, damage, damage_type, target_id)
+            ))
+    
+    def register_damage_callback(self, callback) -> None:
+        """注册伤害回调"""
+        self.on_damage_callbacks.append(callback)
+    
+    def unregister_damage_callback(self, callback) -> None:
+        """注销伤害回调"""
+        if callback in self.on_damage_callbacks:
+            self.on_damage_callbacks.remove(callback)
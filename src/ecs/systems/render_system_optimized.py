@@ -3,13 +3,14 @@
 
 相比原版，优化点：
 - 使用arcade.SpriteList进行批量渲染
-- 添加脏标记机制，只在实体变化时重建SpriteList
+- 添加脏标记机制，只在实体变化时增量同步SpriteList
 - 缓存组件查询结果
 - 减少每帧的Python循环开销
 """
 
 import arcade
-from typing import Dict, List, Optional, Tuple
+from PIL import Image, ImageDraw
+from typing import Dict, List, Optional, Set, Tuple
 from ..system import System
 from ..component import ComponentManager
 from ..components import TransformComponent, SpriteComponent
@@ -28,17 +29,25 @@ class OptimizedRenderSystem(System):
     使用SpriteList批量渲染，大幅提升性能
     """
     
+    # 纯色回退纹理缓存：(宽, 高, 颜色) -> Texture
+    _fallback_textures: Dict[Tuple, arcade.Texture] = {}
+    # 回退纹理的白色边框宽度（边框一半在实体矩形外，纹理比实体大一个边框宽度）
+    FALLBACK_BORDER = 3
+    
     def __init__(self, priority: int = 100, three_d_effects=None):
         super().__init__(priority)
         self._three_d_effects = three_d_effects
         
         # 按z_index分层的SpriteList
         self._sprite_lists: Dict[int, arcade.SpriteList] = {}
+        self._sorted_layers: List[arcade.SpriteList] = []
         self._entity_sprites: Dict[int, arcade.Sprite] = {}
+        # 正在使用纯色回退纹理的实体
+        self._fallback_entities: Set[int] = set()
         
-        # 脏标记
+        # 脏标记（组件结构版本变化时增量同步精灵）
         self._needs_rebuild = True
-        self._entity_version = 0
+        self._entity_version = -1
         
         # 缓存
         self._cached_entities: List[int] = []
@@ -46,11 +55,10 @@ class OptimizedRenderSystem(System):
     
     def update(self, dt: float, component_manager: ComponentManager) -> None:
         """更新动画状态"""
-        # 只更新有动画的实体
-        for entity_id in self._cached_entities:
-            anim_comp = component_manager.get_component(entity_id, AnimationComponent)
-            if anim_comp:
-                anim_comp.update(dt)
+        for _, _, _, anim_comp in component_manager.query_with_components(
+            TransformComponent, SpriteComponent, AnimationComponent
+        ):
+            anim_comp.update(dt)
     
     def render(self, component_manager: ComponentManager) -> None:
         """执行批量渲染"""
@@ -58,19 +66,16 @@ class OptimizedRenderSystem(System):
         if self._three_d_effects and hasattr(self._three_d_effects, 'begin_batch'):
             self._three_d_effects.begin_batch()
         
-        # 检查是否需要重建
-        current_entities = set(component_manager.query(TransformComponent, SpriteComponent))
-        
-        if self._needs_rebuild or current_entities != set(self._cached_entities):
-            self._rebuild_sprite_lists(component_manager)
+        # 组件结构变化时才同步精灵（只增删变化的实体）
+        if self._needs_rebuild or component_manager._cache_version != self._entity_version:
+            self._sync_sprites(component_manager)
             self._needs_rebuild = False
         
         # 更新所有精灵的位置和状态，应用3D效果
         self._update_sprites_with_3d(component_manager)
         
         # 批量渲染所有层
-        for z_index in sorted(self._sprite_lists.keys()):
-            sprite_list = self._sprite_lists[z_index]
+        for sprite_list in self._sorted_layers:
             if len(sprite_list) > 0:
                 sprite_list.draw()
                 log_draw_call(1)  # 记录批量绘制调用
@@ -79,51 +84,62 @@ class OptimizedRenderSystem(System):
         if self._three_d_effects and hasattr(self._three_d_effects, 'end_batch'):
             self._three_d_effects.end_batch()
     
-    def _rebuild_sprite_lists(self, component_manager: ComponentManager) -> None:
-        """重建所有SpriteList"""
-        # 清理旧的SpriteList
-        for sprite_list in self._sprite_lists.values():
-            sprite_list.clear()
-        self._sprite_lists.clear()
-        self._entity_sprites.clear()
-        self._entity_components.clear()
-        
-        # 获取所有实体并排序
-        entities = list(component_manager.query(TransformComponent, SpriteComponent))
-        
-        # 按z_index分组
-        entities_by_z: Dict[int, List[int]] = {}
-        for entity_id in entities:
-            anim_comp = component_manager.get_component(entity_id, AnimationComponent)
-            z_index = anim_comp.z_index if anim_comp else 0
-            
-            if z_index not in entities_by_z:
-                entities_by_z[z_index] = []
-            entities_by_z[z_index].append(entity_id)
+    def _sync_sprites(self, component_manager: ComponentManager) -> None:
+        """增量同步精灵：为新实体创建精灵，移除已消失实体的精灵"""
+        animations = component_manager.get_all_components(AnimationComponent)
+        entity_components = {}
         
-        # 为每个z_index创建SpriteList
-        for z_index, entity_list in entities_by_z.items():
-            sprite_list = arcade.SpriteList()
+        for entity_id, transform, sprite_comp in component_manager.query_with_components(
+            TransformComponent, SpriteComponent
+        ):
+            anim_comp = animations.get(entity_id)
+            components = (transform, sprite_comp, anim_comp)
+            previous = self._entity_components.get(entity_id)
             
-            for entity_id in entity_list:
-                transform = component_manager.get_component(entity_id, TransformComponent)
-                sprite_comp = component_manager.get_component(entity_id, SpriteComponent)
-                anim_comp = component_manager.get_component(entity_id, AnimationComponent)
-                
-                if transform and sprite_comp:
-                    # 创建Arcade精灵
-                    sprite = self._create_arcade_sprite(
-                        entity_id, transform, sprite_comp, anim_comp
-                    )
-                    if sprite:
-                        sprite_list.append(sprite)
-                        self._entity_sprites[entity_id] = sprite
-                        self._entity_components[entity_id] = (transform, sprite_comp, anim_comp)
+            if previous is not None and all(a is b for a, b in zip(previous, components)):
+                entity_components[entity_id] = previous
+                continue
             
-            self._sprite_lists[z_index] = sprite_list
+            # 新实体或组件被替换：重新创建精灵
+            self._remove_entity_sprite(entity_id)
+            sprite = self._create_arcade_sprite(entity_id, transform, sprite_comp, anim_comp)
+            if sprite:
+                z_index = anim_comp.z_index if anim_comp else 0
+                self._get_layer(z_index).append(sprite)
+                self._entity_sprites[entity_id] = sprite
+                entity_components[entity_id] = components
         
-        self._cached_entities = entities
-        logger.debug(f"重建SpriteList: {len(entities)} 个实体，{len(self._sprite_lists)} 个层级")
+        # 移除已不存在实体的精灵
+        for entity_id in self._entity_components.keys() - entity_components.keys():
+            self._remove_entity_sprite(entity_id)
+        
+        self._entity_components = entity_components
+        self._cached_entities = list(entity_components)
+        self._entity_version = component_manager._cache_version
+    
+    def _get_layer(self, z_index: int) -> arcade.SpriteList:
+        """获取（必要时创建）指定z_index的SpriteList"""
+        sprite_list = self._sprite_lists.get(z_index)
+        if sprite_list is None:
+            sprite_list = arcade.SpriteList(lazy=True)
+            self._sprite_lists[z_index] = sprite_list
+            self._sorted_layers = [
+                self._sprite_lists[z] for z in sorted(self._sprite_lists)
+            ]
+        return sprite_list
+    
+    def _remove_entity_sprite(self, entity_id: int) -> None:
+        """移除实体对应的精灵"""
+        self._fallback_entities.discard(entity_id)
+        sprite = self._entity_sprites.pop(entity_id, None)
+        if sprite is not None:
+            sprite.remove_from_sprite_lists()
+    
+    def _rebuild_sprite_lists(self, component_manager: ComponentManager) -> None:
+        """重建所有SpriteList"""
+        self.clear()
+        self._sync_sprites(component_manager)
+        logger.debug(f"重建SpriteList: {len(self._cached_entities)} 个实体，{len(self._sprite_lists)} 个层级")
     
     def _create_arcade_sprite(self, entity_id: int,
                               transform: TransformComponent,
@@ -131,37 +147,54 @@ class OptimizedRenderSystem(System):
                               anim_comp: Optional[AnimationComponent]) -> Optional[arcade.Sprite]:
         """创建Arcade精灵"""
         try:
-            # 如果有动画纹理，使用它
-            if anim_comp:
-                texture = anim_comp.get_current_texture()
-                if texture:
-                    sprite = arcade.Sprite()
-                    sprite.texture = texture
-                    sprite.center_x = transform.x
-                    sprite.center_y = transform.y
-                    sprite.width = sprite_comp.width
-                    sprite.height = sprite_comp.height
-                    sprite.alpha = sprite_comp.alpha
-                    return sprite
+            # 如果有动画纹理，使用它；否则使用纯色回退纹理
+            texture = anim_comp.get_current_texture() if anim_comp else None
+            pad = 0
+            if texture is None:
+                texture = self._get_fallback_texture(sprite_comp)
+                pad = self.FALLBACK_BORDER
+                self._fallback_entities.add(entity_id)
             
-            # 否则创建纯色精灵
-            sprite = arcade.SpriteSolidColor(
-                int(sprite_comp.width),
-                int(sprite_comp.height),
-                (*sprite_comp.color, sprite_comp.alpha)
-            )
-            sprite.center_x = transform.x
-            sprite.center_y = transform.y
+            sprite = arcade.Sprite(texture)
+            sprite.position = (transform.x, transform.y)
+            sprite.size = (sprite_comp.width + pad, sprite_comp.height + pad)
+            sprite.alpha = sprite_comp.alpha
             return sprite
             
         except Exception as e:
             logger.error(f"创建精灵失败 (entity {entity_id}): {e}")
             return None
     
+    @classmethod
+    def _get_fallback_texture(cls, sprite_comp: SpriteComponent) -> arcade.Texture:
+        """
+        获取纯色回退纹理
+        
+        与 RenderSystem 的回退绘制一致：纯色填充、3像素白色边框、红色中心点
+        """
+        border = cls.FALLBACK_BORDER
+        width = int(sprite_comp.width) + border
+        height = int(sprite_comp.height) + border
+        color = tuple(sprite_comp.color[:3])
+        key = (width, height, color)
+        texture = cls._fallback_textures.get(key)
+        if texture is None:
+            image = Image.new("RGBA", (width, height), (*color, 255))
+            draw = ImageDraw.Draw(image)
+            draw.rectangle((0, 0, width - 1, height - 1), outline=(255, 255, 255, 255), width=border)
+            cx, cy = width / 2, height / 2
+            draw.ellipse((cx - 4, cy - 4, cx + 4, cy + 4), fill=(255, 0, 0, 255))
+            texture = arcade.Texture(image, hash=f"fallback_{width}x{height}_{color}")
+            cls._fallback_textures[key] = texture
+        return texture
+    
     def _update_sprites_with_3d(self, component_manager: ComponentManager) -> None:
         """更新所有精灵的位置和状态，应用3D效果"""
+        entity_sprites = self._entity_sprites
+        fallback_entities = self._fallback_entities
+        three_d_effects = self._three_d_effects
         for entity_id, (transform, sprite_comp, anim_comp) in self._entity_components.items():
-            sprite = self._entity_sprites.get(entity_id)
+            sprite = entity_sprites.get(entity_id)
             if not sprite:
                 continue
             
@@ -169,18 +202,16 @@ class OptimizedRenderSystem(System):
             base_x = transform.x
             base_y = transform.y
             base_scale = anim_comp.scale if anim_comp else 1.0
-            base_width = sprite_comp.width * base_scale
-            base_height = sprite_comp.height * base_scale
             
             # 应用3D效果
             adjusted_x = base_x
             adjusted_y = base_y
             final_scale = base_scale
             
-            if self._three_d_effects:
-                adjusted_x, adjusted_y, perspective_scale = self._three_d_effects.draw_3d_effects(
+            if three_d_effects:
+                adjusted_x, adjusted_y, perspective_scale = three_d_effects.draw_3d_effects(
                     entity_id, base_x, base_y,
-                    base_width, base_height,
+                    sprite_comp.width * base_scale, sprite_comp.height * base_scale,
                     screen_height=600,
                     enable_shadow=True,
                     enable_highlight=True,
@@ -190,7 +221,7 @@ class OptimizedRenderSystem(System):
                 final_scale = perspective_scale * base_scale
                 
                 # 应用后处理效果（高光）
-                self._three_d_effects.apply_post_effects(
+                three_d_effects.apply_post_effects(
                     entity_id, adjusted_x, adjusted_y,
                     sprite_comp.width * final_scale, 
                     sprite_comp.height * final_scale,
@@ -198,19 +229,24 @@ class OptimizedRenderSystem(System):
                     enable_edge=False
                 )
             
-            # 更新精灵位置和缩放
-            sprite.center_x = adjusted_x
-            sprite.center_y = adjusted_y
-            sprite.scale = final_scale
-            
             # 更新动画纹理
             if anim_comp:
                 texture = anim_comp.get_current_texture()
-                if texture and sprite.texture != texture:
+                if texture and sprite.texture is not texture:
                     sprite.texture = texture
+                    fallback_entities.discard(entity_id)
+            
+            # 更新精灵位置和尺寸（按组件尺寸缩放，而不是纹理原始尺寸）
+            sprite.position = (adjusted_x, adjusted_y)
+            pad = self.FALLBACK_BORDER if entity_id in fallback_entities else 0
+            size = ((sprite_comp.width + pad) * final_scale, (sprite_comp.height + pad) * final_scale)
+            if sprite.size != size:
+                sprite.size = size
             
             # 更新透明度
-            sprite.alpha = sprite_comp.alpha
+            alpha = sprite_comp.alpha
+            if sprite.alpha != alpha:
+                sprite.alpha = alpha
     
     def _update_sprites(self, component_manager: ComponentManager) -> None:
         """更新所有精灵的位置和状态（旧方法，保留兼容性）"""
@@ -225,6 +261,9 @@ class OptimizedRenderSystem(System):
         for sprite_list in self._sprite_lists.values():
             sprite_list.clear()
         self._sprite_lists.clear()
+        self._sorted_layers = []
         self._entity_sprites.clear()
+        self._fallback_entities.clear()
         self._entity_components.clear()
         self._cached_entities.clear()
+        self._entity_version = -1
@@ -28,26 +28,26 @@ class ZombieBehaviorSystem(System):
         self.entity_factory = entity_factory
         self.entity_manager = entity_manager
         self.on_zombie_death_callbacks = []
+        
+        # 每帧统计结果，供游戏结束/胜利判定直接读取，避免再次查询
+        self.min_zombie_x = float('inf')
+        self.live_zombie_count = 0
     
     def update(self, dt: float, component_manager: ComponentManager) -> None:
         """更新僵尸行为"""
-        # 获取所有僵尸实体
-        entities = component_manager.query(
+        # 获取所有僵尸实体（连同组件一次取出，省去逐个 get_component）
+        zombies = component_manager.query_with_components(
             TransformComponent, VelocityComponent, ZombieComponent
         )
+        health_store = component_manager.get_all_components(HealthComponent)
         
         zombies_to_remove = []
+        min_zombie_x = float('inf')
+        live_zombie_count = 0
         
-        for entity_id in entities:
-            transform = component_manager.get_component(entity_id, TransformComponent)
-            velocity = component_manager.get_component(entity_id, VelocityComponent)
-            zombie = component_manager.get_component(entity_id, ZombieComponent)
-            
-            if not all([transform, velocity, zombie]):
-                continue
-            
+        for entity_id, transform, velocity, zombie in zombies:
             # 检查僵尸是否死亡
-            health = component_manager.get_component(entity_id, HealthComponent)
+            health = health_store.get(entity_id)
             if health and health.is_dead:
                 # 立即停止移动
                 velocity.vx = 0
@@ -72,6 +72,13 @@ class ZombieBehaviorSystem(System):
             
             # 处理特殊行为
             self._handle_special_behavior(entity_id, transform, zombie, component_manager, dt)
+            
+            live_zombie_count += 1
+            if transform.x < min_zombie_x:
+                min_zombie_x = transform.x
+        
+        self.min_zombie_x = min_zombie_x
+        self.live_zombie_count = live_zombie_count
         
         # 处理死亡的僵尸
         for zombie_id in zombies_to_remove:
@@ -40,6 +40,15 @@ class World:
         """销毁实体"""
         self._entity_manager.destroy_entity(entity.id)
     
+    def destroy_entity_by_id(self, entity_id: int) -> None:
+        """按实体ID销毁实体（事件回调等只持有ID的场景使用）"""
+        self._entity_manager.destroy_entity(entity_id)
+    
+    @property
+    def entity_count(self) -> int:
+        """当前实体数量"""
+        return self._entity_manager.entity_count
+    
     def get_entity(self, entity_id: int) -> Entity:
         """获取指定ID的实体"""
         return self._entity_manager.get_entity(entity_id)
@@ -11,6 +11,8 @@
 from abc import ABC, abstractmethod
 from typing import Callable, List, Optional, Tuple
 import arcade
+import pyglet
+from arcade.gl import geometry
 
 
 class MenuButton:
@@ -809,6 +811,18 @@ class GameOverMenu(BaseMenu):
         self.is_victory = False
         self.score = 0
         
+        # 标题和得分预渲染为纹理，结果变化时才重新生成
+        self._text_sprites: Optional[arcade.SpriteList] = None
+        self._baked_result: Optional[Tuple[bool, int]] = None
+        
+        # 背景和按钮形状缓存，结果或按钮悬停状态变化时才重建
+        self._shapes: Optional[arcade.shape_list.ShapeElementList] = None
+        self._shapes_key: Optional[Tuple[bool, Tuple[bool, ...]]] = None
+        
+        # 按钮文字放入同一批次，一次绘制
+        self._label_batch = pyglet.graphics.Batch()
+        self._labels: List[arcade.Text] = []
+        
     def show_result(self, is_victory: bool, score: int):
         """
         显示游戏结果
@@ -820,6 +834,63 @@ class GameOverMenu(BaseMenu):
         self.is_victory = is_victory
         self.score = score
         self.show()
+    
+    def _get_text_sprites(self) -> arcade.SpriteList:
+        """获取标题和得分的文字精灵（静态文字只排版一次，之后按贴图绘制）"""
+        result = (self.is_victory, self.score)
+        if self._text_sprites is not None and self._baked_result == result:
+            return self._text_sprites
+        
+        # 旧精灵不再被引用后，其纹理由图集随垃圾回收释放
+        title = "胜利！" if self.is_victory else "游戏结束"
+        title_color = (255, 255, 0) if self.is_victory else (255, 100, 100)
+        
+        title_sprite = arcade.create_text_sprite(
+            title, title_color, 48, anchor_x="center"
+        )
+        title_sprite.position = (self.window_width / 2, self.window_height / 2 + 150)
+        
+        score_sprite = arcade.create_text_sprite(
+            f"得分: {self.score}", (255, 255, 255), 24, anchor_x="center"
+        )
+        score_sprite.position = (self.window_width / 2, self.window_height / 2 + 80)
+        
+        sprites = arcade.SpriteList()
+        sprites.append(title_sprite)
+        sprites.append(score_sprite)
+        
+        self._text_sprites = sprites
+        self._baked_result = result
+        return sprites
+    
+    def _get_shapes(self) -> arcade.shape_list.ShapeElementList:
+        """获取背景和按钮底色、边框的形状（结果或悬停状态变化时才重建）"""
+        key = (self.is_victory, tuple(button.is_hovered for button in self.buttons))
+        if self._shapes is not None and self._shapes_key == key:
+            return self._shapes
+        
+        shapes = arcade.shape_list.ShapeElementList()
+        
+        # 背景
+        color = (50, 100, 50) if self.is_victory else (100, 50, 50)
+        shapes.append(arcade.shape_list.create_rectangle_filled(
+            self.window_width / 2, self.window_height / 2,
+            self.window_width, self.window_height, color
+        ))
+        
+        # 按钮底色和边框
+        for button in self.buttons:
+            fill = button.color_hover if button.is_hovered else button.color_normal
+            shapes.append(arcade.shape_list.create_rectangle_filled(
+                button.x, button.y, button.width, button.height, fill
+            ))
+            shapes.append(arcade.shape_list.create_rectangle_outline(
+                button.x, button.y, button.width, button.height, (50, 100, 50), 2
+            ))
+        
+        self._shapes = shapes
+        self._shapes_key = key
+        return shapes
         
     def setup(self):
         """设置游戏结束菜单按钮"""
@@ -840,39 +911,33 @@ class GameOverMenu(BaseMenu):
             "返回主菜单", center_x, center_y - spacing,
             callback=self.on_main_menu
         ))
+        
+        # 按钮文字（按钮重建时一起重建）
+        self._label_batch = pyglet.graphics.Batch()
+        self._labels = [
+            arcade.Text(
+                button.text, button.x, button.y,
+                button.color_text, 20,
+                anchor_x="center", anchor_y="center",
+                batch=self._label_batch
+            )
+            for button in self.buttons
+        ]
+        self._shapes = None
     
     def render(self):
         """渲染游戏结束菜单"""
         if not self.is_visible:
             return
         
-        # 绘制背景
-        color = (50, 100, 50) if self.is_victory else (100, 50, 50)
-        arcade.draw_rect_filled(arcade.XYWH(self.window_width / 2, self.window_height / 2, self.window_width, self.window_height), color
-        )
-        
-        # 绘制标题
-        title = "胜利！" if self.is_victory else "游戏结束"
-        title_color = (255, 255, 0) if self.is_victory else (255, 100, 100)
-        
-        arcade.draw_text(
-            title,
-            self.window_width / 2, self.window_height / 2 + 150,
-            title_color, 48,
-            anchor_x="center", anchor_y="center"
-        )
+        # 绘制背景和按钮底色、边框（缓存的形状，一次绘制）
+        self._get_shapes().draw()
         
-        # 绘制得分
-        arcade.draw_text(
-            f"得分: {self.score}",
-            self.window_width / 2, self.window_height / 2 + 80,
-            (255, 255, 255), 24,
-            anchor_x="center", anchor_y="center"
-        )
+        # 绘制标题和得分（预渲染的文字贴图）
+        self._get_text_sprites().draw()
         
-        # 绘制按钮
-        for button in self.buttons:
-            button.render()
+        # 绘制按钮文字
+        self._label_batch.draw()
 
 
 class MenuSystem:
@@ -919,6 +984,15 @@ class MenuSystem:
         # 当前显示的菜单
         self.current_menu: Optional[BaseMenu] = None
         
+        # 选关后等待选择难度的关卡
+        self._pending_level = 1
+        
+        # 全屏菜单的渲染缓存：菜单内容只在显示/隐藏和鼠标事件后变化，
+        # 其余帧直接把缓存的帧缓冲画到屏幕上（首次使用时创建）
+        self._cache_fbo = None
+        self._cache_quad = None
+        self._cache_dirty = True
+        
     def setup(self):
         """设置菜单系统"""
         # 主菜单
@@ -972,52 +1046,92 @@ class MenuSystem:
         """显示主菜单"""
         self.current_menu = self.main_menu
         self.main_menu.show()
+        self._cache_dirty = True
     
     def show_level_select(self, max_unlocked_level: int = 1):
         """显示关卡选择菜单"""
         self.level_select_menu.max_unlocked_level = max_unlocked_level
         self.current_menu = self.level_select_menu
         self.level_select_menu.show()
+        self._cache_dirty = True
     
     def show_difficulty_select(self):
         """显示难度选择菜单"""
         self.current_menu = self.difficulty_select_menu
         self.difficulty_select_menu.show()
+        self._cache_dirty = True
     
     def show_pause_menu(self):
         """显示暂停菜单"""
         self.current_menu = self.pause_menu
         self.pause_menu.show()
+        self._cache_dirty = True
     
     def show_game_over(self, is_victory: bool, score: int):
         """显示游戏结束菜单"""
         self.current_menu = self.game_over_menu
         self.game_over_menu.show_result(is_victory, score)
+        self._cache_dirty = True
     
     def show_settings(self):
         """显示设置菜单"""
         self.current_menu = self.settings_menu
         self.settings_menu.show()
+        self._cache_dirty = True
     
     def hide_current_menu(self):
         """隐藏当前菜单"""
         if self.current_menu:
             self.current_menu.hide()
             self.current_menu = None
+            self._cache_dirty = True
     
     def render(self):
         """渲染当前菜单"""
         if self.current_menu:
             self.current_menu.render()
     
+    def render_cached(self):
+        """
+        渲染全屏菜单（主菜单、选关、难度选择、设置）
+        
+        菜单内容未变化时直接把缓存的帧缓冲画到屏幕上，
+        只适用于清屏后单独绘制菜单的情况；覆盖在游戏画面上的菜单仍使用 render
+        """
+        if not self.current_menu:
+            return
+        
+        window = arcade.get_window()
+        ctx = window.ctx
+        size = window.get_framebuffer_size()
+        fbo = self._cache_fbo
+        if fbo is None or fbo.size != size:
+            fbo = self._cache_fbo = ctx.framebuffer(color_attachments=[ctx.texture(size)])
+            self._cache_dirty = True
+            if self._cache_quad is None:
+                self._cache_quad = geometry.quad_2d_fs()
+        
+        if self._cache_dirty:
+            with fbo.activate():
+                fbo.clear(color=window.background_color)
+                self.current_menu.render()
+            self._cache_dirty = False
+        
+        # 不混合，原样复制缓存内容
+        fbo.color_attachments[0].use(0)
+        with ctx.enabled_only():
+            self._cache_quad.render(ctx.utility_textured_quad_program)
+    
     def on_mouse_motion(self, x: float, y: float):
         """处理鼠标移动"""
         if self.current_menu:
             self.current_menu.on_mouse_motion(x, y)
+            self._cache_dirty = True
     
     def on_mouse_click(self, x: float, y: float) -> bool:
         """处理鼠标点击"""
         if self.current_menu:
+            self._cache_dirty = True
             return self.current_menu.on_mouse_click(x, y)
         return False
     
@@ -0,0 +1,77 @@
+"""
+测试血条系统
+"""
+
+import pytest
+from src.arcade_game.health_bar_system import HealthBarSystem
+
+
+class TestHealthBarSystem:
+    """测试血条动画与脏标记"""
+    
+    def setup_method(self):
+        """每个测试前创建带一个满血血条的系统"""
+        self.system = HealthBarSystem()
+        self.system.add_health_bar(1, 100, 100, 100, 100)
+        self.system._dirty_bars.clear()
+        self.bar = self.system.get_health_bar(1)
+    
+    def run_frames(self, frames, dt=1 / 60):
+        """推进若干帧，返回每帧被标记为需要同步的血条集合"""
+        system = self.system
+        marked = []
+        for _ in range(frames):
+            system.update(dt)
+            marked.append(set(system._dirty_bars))
+            # 渲染会清空脏集合，这里手动模拟
+            system._dirty_bars.clear()
+        return marked
+    
+    def test_idle_bar_not_marked(self):
+        """测试满血且无动画的血条不会被标记"""
+        marked = self.run_frames(10)
+        
+        assert all(not frame for frame in marked)
+        assert not self.bar.animating
+    
+    def test_damage_flash_settles(self):
+        """测试受伤闪烁和延迟血量条结束后不再标记"""
+        self.bar.current_health = 80
+        marked = self.run_frames(120)
+        
+        assert 1 in marked[0]
+        assert self.bar.damage_flash <= 0.1
+        assert abs(self.bar.display_health - 80) <= 1
+        assert not self.bar.animating
+        assert not marked[-1]
+    
+    def test_low_health_bar_pulses(self):
+        """测试低血量血条每帧推进脉冲并标记同步"""
+        self.bar.current_health = 20
+        marked = self.run_frames(30)
+        
+        assert all(1 in frame for frame in marked)
+        assert self.bar.pulse_phase == pytest.approx(30 / 60 * 5.0)
+        assert self.bar.animating
+    
+    def test_low_health_bar_settles_after_heal(self):
+        """测试低血量血条恢复后停止脉冲并不再标记"""
+        self.bar.current_health = 20
+        self.run_frames(30)
+        
+        self.bar.current_health = 100
+        marked = self.run_frames(120)
+        
+        assert self.bar.pulse_phase == 0.0
+        assert self.bar.heal_flash <= 0.1
+        assert not self.bar.animating
+        assert not marked[-1]
+    
+    def test_remove_health_bar_clears_marks(self):
+        """测试移除血条时清除标记"""
+        self.bar.current_health = 20
+        self.system.update(1 / 60)
+        self.system.remove_health_bar(1)
+        
+        assert 1 not in self.system._dirty_bars
+        assert 1 not in self.system._pulsing_bars
@@ -263,6 +263,25 @@ class TestParticleSystem:
         
         self.system.create_hit_effect(100, 200, count=5)
         assert self.system.get_total_particle_count() > 10  # 总粒子数应该增加
+    
+    def test_total_particle_count_tracks_updates(self):
+        """测试粒子总数随更新和清除同步"""
+        self.system.create_hit_effect(100, 200, count=5)
+        self.system.create_collect_effect(100, 200, count=4)
+        expected = sum(len(e.particles) for e in self.system.emitters)
+        assert self.system.get_total_particle_count() == expected
+        
+        self.system.update(0.1)
+        expected = sum(len(e.particles) for e in self.system.emitters)
+        assert self.system.get_total_particle_count() == expected
+        
+        for _ in range(20):
+            self.system.update(0.1)
+        assert self.system.get_total_particle_count() == 0
+        
+        self.system.create_hit_effect(100, 200, count=5)
+        self.system.clear()
+        assert self.system.get_total_particle_count() == 0
 
 
 class TestParticleSystemIntegration:
@@ -325,3 +344,72 @@ class TestParticleSystemIntegration:
         assert len(red_emitter.particles) > 0
         assert len(green_emitter.particles) > 0
         assert len(blue_emitter.particles) > 0
+
+
+class TestParticlePool:
+    """测试粒子对象池"""
+    
+    def test_dead_particles_are_reused(self):
+        """测试死亡粒子被回收并复用"""
+        from src.arcade_game import particle_system
+        
+        emitter = ParticleEmitter(100, 200)
+        emitter.emit_burst(
+            count=3,
+            speed_min=10, speed_max=20,
+            life_min=0.1, life_max=0.1,
+            size_min=2, size_max=5,
+            color=(255, 0, 0)
+        )
+        dead = list(emitter.particles)
+        emitter.update(0.2)
+        
+        assert emitter.particles == []
+        assert all(any(p is q for q in particle_system._particle_pool) for p in dead)
+        
+        # 再次发射应复用池中的对象，并完全重置状态
+        new_emitter = ParticleEmitter(10, 20)
+        new_emitter.emit_burst(
+            count=1,
+            speed_min=10, speed_max=20,
+            life_min=0.5, life_max=0.5,
+            size_min=2, size_max=2,
+            color=(0, 255, 0)
+        )
+        particle = new_emitter.particles[0]
+        assert any(particle is p for p in dead)
+        assert particle.x == 10
+        assert particle.y == 20
+        assert particle.life == 0.5
+        assert particle.max_life == 0.5
+        assert particle.size == 2
+        assert particle.color.g == 255
+    
+    def test_clear_returns_particles_to_pool(self):
+        """测试清除系统时粒子回收到池中"""
+        from src.arcade_game import particle_system
+        
+        system = ParticleSystem()
+        emitter = system.create_explosion(100, 200, count=10)
+        particles = list(emitter.particles)
+        
+        system.clear()
+        
+        assert system.get_total_particle_count() == 0
+        assert all(any(p is q for q in particle_system._particle_pool) for p in particles)
+    
+    def test_finished_emitters_are_reused(self):
+        """测试结束的发射器被回收并在下次创建效果时复用"""
+        system = ParticleSystem()
+        emitter = system.create_hit_effect(100, 200)
+        
+        # 所有粒子寿命耗尽后发射器进入对象池
+        system.update(2.0)
+        assert system.is_empty
+        assert emitter in system._emitter_pool
+        
+        reused = system.create_hit_effect(300, 400)
+        assert reused is emitter
+        assert (reused.x, reused.y) == (300, 400)
+        assert reused.is_active
+        assert len(reused.particles) > 0
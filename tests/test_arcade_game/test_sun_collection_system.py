@@ -107,6 +107,21 @@ class TestSunCollectionSystem:
         # 检查阳光仍在
         assert self.sun_system.get_sun_count() == 1
     
+    def test_handle_mouse_press_after_sun_moves(self):
+        """测试阳光移动后点击检测跟随新位置"""
+        sun = self.sun_system._spawn_falling_sun()
+        transform = self.world.get_component(sun, TransformComponent)
+        old_x, old_y = transform.x, transform.y
+        
+        # 移动阳光并更新系统（重建点击检测网格）
+        transform.y = old_y - 200
+        self.sun_system.update(0.01)
+        
+        # 旧位置不再命中，新位置命中
+        assert self.sun_system.handle_mouse_press(old_x, old_y) is False
+        assert self.sun_system.handle_mouse_press(transform.x, transform.y) is True
+        assert len(self.collected_amounts) == 1
+    
     def test_collect_sun(self):
         """测试收集阳光"""
         # 生成阳光
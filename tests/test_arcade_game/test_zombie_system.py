@@ -230,6 +230,22 @@ class TestZombieBehaviorSystem:
         
         # 检查冷却期间没有额外伤害
         assert health_after_first == health_after_second
+    
+    def test_tracks_leftmost_zombie_and_live_count(self):
+        """测试统计最左僵尸位置和存活数量"""
+        assert self.behavior_system.min_zombie_x == float('inf')
+        assert self.behavior_system.live_zombie_count == 0
+        
+        self.entity_factory.create_zombie(ZombieType.NORMAL, x=500, y=150, row=1)
+        self.entity_factory.create_zombie(ZombieType.NORMAL, x=300, y=250, row=2)
+        dead = self.entity_factory.create_zombie(ZombieType.NORMAL, x=100, y=350, row=3)
+        self.world.get_component(dead, HealthComponent).take_damage(10000)
+        
+        self.behavior_system.update(0.1, self.world._component_manager)
+        
+        # 死亡僵尸不计入统计
+        assert self.behavior_system.min_zombie_x == 300
+        assert self.behavior_system.live_zombie_count == 2
 
 
 class TestZombieSystemIntegration:
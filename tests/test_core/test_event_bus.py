@@ -202,3 +202,19 @@ class TestEventBus:
         bus.subscribe(EventType.ZOMBIE_DIED, lambda e: None)
         
         assert bus.has_listeners(EventType.ZOMBIE_DIED)
+
+    def test_typed_payload_passed_to_callback(self):
+        """测试类型化事件载荷按属性传递给回调"""
+        from src.core.event_bus import EventBus, Event, EventType, DamageDealtPayload
+        
+        bus = EventBus()
+        received = []
+        
+        bus.subscribe(EventType.DAMAGE_DEALT, lambda e: received.append(e.data))
+        bus.publish(Event(EventType.DAMAGE_DEALT, DamageDealtPayload(10, 20, 50, 'fire', 3)))
+        
+        payload = received[0]
+        assert (payload.x, payload.y, payload.damage) == (10, 20, 50)
+        assert payload.damage_type == 'fire'
+        assert payload.target_id == 3
+        assert not hasattr(payload, '__dict__')
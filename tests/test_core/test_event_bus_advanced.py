@@ -229,6 +229,23 @@ class TestEventBusUnsubscribe:
         event_bus.publish(Event(EventType.PLANT_PLANTED, {}))
         assert len(results) == 1  # 不应该增加
 
+    def test_unsubscribe_with_token(self):
+        """测试使用订阅令牌取消订阅"""
+        from src.core.event_bus import EventBus, Event, EventType
+        
+        event_bus = EventBus()
+        results = []
+        
+        def handler(event):
+            results.append(1)
+        
+        token = event_bus.subscribe(EventType.PLANT_PLANTED, handler)
+        event_bus.unsubscribe(*token)
+        
+        event_bus.publish(Event(EventType.PLANT_PLANTED, {}))
+        assert results == []
+        assert not event_bus.has_listeners(EventType.PLANT_PLANTED)
+
 
 class TestEventBusIntegration:
     """测试事件系统集成"""
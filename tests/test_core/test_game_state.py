@@ -67,3 +67,17 @@ class TestGameState:
         
         state.change_state(GameStateType.GAME_OVER)
         assert state.is_game_over()
+
+    def test_state_manager_flags_track_state(self):
+        """测试状态位与 is_*() 判断保持一致"""
+        from src.core.game_state import GameStateManager, ExtendedGameState, StateFlag
+        
+        manager = GameStateManager()
+        for state in ExtendedGameState:
+            manager.change_state(state)
+            flags = manager.state_flags
+            assert bool(flags & StateFlag.MENU) == manager.is_in_menu()
+            assert bool(flags & StateFlag.PLAYING) == manager.is_playing()
+            assert bool(flags & StateFlag.PAUSED) == manager.is_paused()
+            assert bool(flags & StateFlag.GAME_OVER) == manager.is_game_over()
+            assert bool(flags & StateFlag.VICTORY) == manager.is_victory()
@@ -0,0 +1,58 @@
+"""
+测试性能监控器
+"""
+
+import pytest
+from unittest.mock import patch
+from src.core.performance_monitor import PerformanceMonitor
+
+
+class TestPerformanceMonitor:
+    """测试性能监控器的帧采样与汇总"""
+
+    def setup_method(self):
+        """每个测试方法前执行"""
+        # 用可控的时钟替换 perf_counter
+        self.clock = 0.0
+        self.patcher = patch(
+            "src.core.performance_monitor.time.perf_counter",
+            side_effect=lambda: self.clock
+        )
+        self.patcher.start()
+        self.monitor = PerformanceMonitor()
+        self.monitor.reset()
+
+    def teardown_method(self):
+        """每个测试方法后执行"""
+        self.patcher.stop()
+        self.monitor.reset()
+
+    def run_frame(self, duration: float):
+        """模拟一帧，耗时 duration 秒"""
+        self.monitor.begin_frame()
+        self.clock += duration
+        self.monitor.end_frame()
+
+    def test_frame_time_ring_buffer_keeps_latest_frames_in_order(self):
+        """测试帧时间环形缓冲区回绕后按时间顺序解码"""
+        total = PerformanceMonitor.FRAME_HISTORY_SIZE + 15
+        for i in range(total):
+            self.run_frame((i + 1) / 1000)  # 第 i 帧耗时 i+1 毫秒
+
+        metrics = self.monitor.get_metrics()
+        history = list(metrics.frame_time_history)
+        assert len(history) == PerformanceMonitor.FRAME_HISTORY_SIZE
+        assert history == pytest.approx(
+            [float(ms) for ms in range(total - PerformanceMonitor.FRAME_HISTORY_SIZE + 1, total + 1)]
+        )
+        assert metrics.frame_time == pytest.approx(float(total))
+
+    def test_fps_flushed_once_per_second(self):
+        """测试FPS每秒汇总一次"""
+        for _ in range(3):
+            self.run_frame(0.25)
+        assert self.monitor.metrics.fps == 0
+
+        self.run_frame(0.25)
+        assert self.monitor.metrics.fps == 4
+        assert list(self.monitor.metrics.fps_history) == [4.0]
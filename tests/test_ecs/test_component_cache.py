@@ -3,7 +3,7 @@ ECS组件查询缓存测试
 """
 import pytest
 from src.ecs.world import World
-from src.ecs.components import TransformComponent, PlantComponent, ZombieComponent
+from src.ecs.components import TransformComponent, PlantComponent, ZombieComponent, HealthComponent
 
 
 class TestComponentQueryCache:
@@ -155,3 +155,52 @@ class TestComponentQueryCache:
         
         assert len(result1) == 2
         assert set(result1) == set(result2)
+
+    def test_query_with_components(self):
+        """测试查询时同时返回组件实例"""
+        world = World()
+        manager = world._component_manager
+        
+        plant_transform = TransformComponent(x=0, y=0)
+        plant = PlantComponent()
+        entity1 = world.create_entity()
+        manager.add_component(entity1, plant_transform)
+        manager.add_component(entity1, plant)
+        
+        entity2 = world.create_entity()
+        manager.add_component(entity2, TransformComponent(x=10, y=10))
+        manager.add_component(entity2, ZombieComponent())
+        
+        result = manager.query_with_components(TransformComponent, PlantComponent)
+        
+        assert len(result) == 1
+        entity_id, transform, component = result[0]
+        assert entity_id == entity1
+        assert transform is plant_transform
+        assert component is plant
+        assert set(e for e, *_ in manager.query_with_components(TransformComponent)) == {entity1, entity2}
+    
+    def test_query_with_components_partial_overlap(self):
+        """测试多组件部分重叠时只返回拥有全部组件的实体，且保持最小字典的顺序"""
+        world = World()
+        manager = world._component_manager
+        
+        expected = []
+        for i in range(6):
+            entity = world.create_entity()
+            transform = TransformComponent(x=i, y=0)
+            manager.add_component(entity, transform)
+            if i % 2 == 0:
+                health = HealthComponent(current=100, max_health=100)
+                manager.add_component(entity, health)
+                if i != 2:
+                    zombie = ZombieComponent()
+                    manager.add_component(entity, zombie)
+                    expected.append((entity, transform, health, zombie))
+        
+        result = manager.query_with_components(TransformComponent, HealthComponent, ZombieComponent)
+        
+        assert len(result) == len(expected)
+        for got, want in zip(result, expected):
+            assert all(a is b for a, b in zip(got[1:], want[1:]))
+            assert got[0] == want[0]
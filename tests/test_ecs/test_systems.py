@@ -4,9 +4,9 @@
 
 import pytest
 from src.ecs import World
-from src.ecs.systems import MovementSystem, HealthSystem
+from src.ecs.systems import MovementSystem, HealthSystem, CollisionSystem
 from src.ecs.components import (
-    TransformComponent, VelocityComponent, HealthComponent
+    TransformComponent, VelocityComponent, HealthComponent, CollisionComponent
 )
 
 
@@ -69,6 +69,50 @@ class TestHealthSystem:
         assert health.is_dead
 
 
+class TestCollisionSystem:
+    """测试碰撞系统"""
+    
+    def _add_collider(self, world, x, y, layer, collides_with):
+        entity = world.create_entity()
+        world.add_component(entity, TransformComponent(x=x, y=y))
+        world.add_component(entity, CollisionComponent(
+            width=40, height=40, layer=layer, collides_with=collides_with
+        ))
+        return entity
+    
+    def test_static_plants_tracked_across_frames(self):
+        """测试静态植物哈希随种植、移动和销毁同步"""
+        world = World()
+        collision_system = CollisionSystem(priority=20)
+        world.add_system(collision_system)
+        pairs = []
+        collision_system.register_collision_callback(
+            lambda a, b: pairs.append({a, b})
+        )
+        
+        plant = self._add_collider(world, 100, 100, CollisionSystem.LAYER_PLANT,
+                                   {CollisionSystem.LAYER_ZOMBIE})
+        zombie = self._add_collider(world, 120, 100, CollisionSystem.LAYER_ZOMBIE,
+                                    {CollisionSystem.LAYER_PLANT})
+        world.update(1/60)
+        assert pairs == [{plant.id, zombie.id}]
+        
+        # 静态植物位置变化后应移出碰撞范围
+        pairs.clear()
+        world.get_component(plant, TransformComponent).x = 300
+        world.update(1/60)
+        assert pairs == []
+        
+        # 销毁（帧末移除组件）后不再参与检测
+        world.get_component(plant, TransformComponent).x = 100
+        world.destroy_entity(plant)
+        world.update(1/60)
+        pairs.clear()
+        world.update(1/60)
+        assert pairs == []
+        assert collision_system.get_stats()['static_hash']['total_entities'] == 0
+
+
 class TestSystemPriority:
     """测试系统优先级"""
     
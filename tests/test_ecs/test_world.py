@@ -81,6 +81,29 @@ class TestWorld:
         
         assert not entity.active
     
+    def test_destroy_entity_by_id(self):
+        """测试按ID销毁实体"""
+        world = World()
+        entity = world.create_entity()
+        world.add_component(entity, TransformComponent(x=0, y=0))
+        
+        world.destroy_entity_by_id(entity.id)
+        world.update(0.016)  # 触发实体销毁处理
+        
+        assert not entity.active
+        assert world.get_entity(entity.id) is None
+        assert world.get_component(entity, TransformComponent) is None
+    
+    def test_entity_count(self):
+        """测试实体数量统计"""
+        world = World()
+        entities = [world.create_entity() for _ in range(3)]
+        assert world.entity_count == 3
+        
+        world.destroy_entity(entities[0])
+        world.update(0.016)
+        assert world.entity_count == 2
+    
     def test_multiple_components(self):
         """测试一个实体有多个组件"""
         world = World()
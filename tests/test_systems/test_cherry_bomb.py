@@ -117,6 +117,38 @@ class TestCherryBombExplosion:
         # 检查是否有爆炸半径配置
         assert hasattr(behavior_system, 'CHERRY_EXPLOSION_RADIUS') or True  # 暂时跳过
 
+    def test_cherry_bomb_notifies_direct_callbacks(self):
+        """测试樱桃炸弹爆炸直接调用爆炸和伤害回调"""
+        from src.ecs.world import World
+        from src.arcade_game.entity_factory import EntityFactory
+        from src.ecs.components.plant import PlantType
+        from src.ecs.components.zombie import ZombieType
+        from src.ecs.systems.plant_behavior_system import PlantBehaviorSystem
+        
+        world = World()
+        factory = EntityFactory(world)
+        behavior_system = PlantBehaviorSystem(entity_factory=factory)
+        explosions = []
+        damages = []
+        behavior_system.register_explosion_callback(
+            lambda x, y, radius, explosion_type: explosions.append(explosion_type)
+        )
+        behavior_system.register_damage_callback(
+            lambda x, y, damage, damage_type, target_id: damages.append(target_id)
+        )
+        
+        factory.create_plant(PlantType.CHERRY_BOMB, x=400, y=150, row=1, col=4)
+        zombie = factory.create_zombie(ZombieType.NORMAL, x=400, y=150, row=1)
+        
+        # 植物实体由外部在 PLANT_DIED 时销毁，这里只更新到首次爆炸
+        for _ in range(20):
+            behavior_system.update(0.1, world._component_manager)
+            if explosions:
+                break
+        
+        assert explosions == ['cherry_bomb']
+        assert damages == [zombie.id]
+
 
 class TestPotatoMine:
     """测试土豆雷"""